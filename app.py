@@ -1,6 +1,8 @@
 import sys
 import os
 import cv2
+import multiprocessing
+import numpy as np
 import threading
 import time
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
@@ -9,10 +11,14 @@ from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                             QGroupBox, QRadioButton, QFrame, QSizePolicy,
                             QSpacerItem, QDialog, QWizard, QWizardPage, QToolTip,
                             QProgressBar, QStyleFactory)
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QThread, QSize, QPropertyAnimation, QEasingCurve
+from PyQt6.QtCore import Qt, QEvent, QTimer, pyqtSignal, QThread, QSize, QPropertyAnimation, QEasingCurve
 from PyQt6.QtGui import QIcon, QImage, QPixmap, QCloseEvent, QColor, QPalette, QFont, QFontDatabase, QCursor
 
 from controller import HandGestureController
+from capture import FrameGrabber
+from overlay import SpriteCache
+from pipeline import Pipeline
+import profiles
 from settings import Settings
 import utils
 
@@ -20,6 +26,7 @@ class VideoThread(QThread):
     change_pixmap_signal = pyqtSignal(QImage)
     status_signal = pyqtSignal(str)
     fps_signal = pyqtSignal(float)
+    frame_stats_signal = pyqtSignal(dict)
 
     def __init__(self, camera_index=0):
         super().__init__()
@@ -31,6 +38,17 @@ class VideoThread(QThread):
         self.fps = 0
         self.last_fps_time = time.time()
         self.processing_enabled = True
+        self.grabber = None
+        self.pipeline = None
+        self.camera_fps = 0
+
+        # Preview rendering state
+        self.preview_visible = False
+        self._last_render_time = 0.0
+        self.preview_size = None
+        self.overlay = SpriteCache()
+        self._preview_buffers = [None, None, None, None]
+        self._preview_position = 0
 
     def set_controller(self, controller):
         self.controller = controller
@@ -44,93 +62,213 @@ class VideoThread(QThread):
     def toggle_processing(self, enabled):
         self.processing_enabled = enabled
 
+    def set_preview_visible(self, visible):
+        """Pause or resume preview rendering; tracking is not affected"""
+        self.preview_visible = visible
+
+    def set_preview_size(self, width, height):
+        """Set the size previews are produced at (the video label size)"""
+        self.preview_size = (width, height) if width > 0 and height > 0 else None
+
+    def frame_stats(self):
+        """Get dropped/stale frame counters and per-stage pipeline timings"""
+        if self.grabber is None:
+            stats = {'published': 0, 'consumed': 0, 'dropped': 0, 'stale': 0}
+        else:
+            stats = self.grabber.slot.stats()
+            stats.update(self.grabber.clock.stats())
+            stats.update(self.grabber.pool.stats())
+            stats['camera_fps'] = self.camera_fps
+        if self.pipeline is not None:
+            stats.update(self.pipeline.stats())
+        if self.controller is not None:
+            stats['inference'] = self.controller.inference_stats()
+        return stats
+
     def run(self):
         # Try to open camera with specified settings
         cap = cv2.VideoCapture(self.camera_index)
 
         # Set camera properties for better performance
-        cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
-        cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
-        cap.set(cv2.CAP_PROP_FPS, 30)
+        settings = self.settings or {}
+        target_fps = settings.get('target_fps', 30)
+        cap.set(cv2.CAP_PROP_FRAME_WIDTH, settings.get('capture_width', 640))
+        cap.set(cv2.CAP_PROP_FRAME_HEIGHT, settings.get('capture_height', 480))
+        cap.set(cv2.CAP_PROP_FPS, target_fps)
+        # Keep as few frames as possible queued in the driver
+        cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
 
         if not cap.isOpened():
             self.status_signal.emit("Error: Could not open camera")
             return
 
-        self.status_signal.emit("Camera connected")
+        # Use whatever rate the camera actually agreed to, capped at the target
+        self.camera_fps = cap.get(cv2.CAP_PROP_FPS) or target_fps
+        self.status_signal.emit(f"Camera connected ({self.camera_fps:.0f} FPS)")
+
+        # Grab frames on a dedicated thread so slow processing never delays the next read
+        self.grabber = FrameGrabber(cap, target_fps=min(target_fps, self.camera_fps))
+        self._last_index = -1
+
+        # capture -> inference -> gesture/actuation
+        #                      \-> render
+        # Every stage runs on its own thread, so throughput is bound by the
+        # slowest stage and cursor actuation never waits on preview drawing.
+        self.pipeline = Pipeline()
+        gesture_queue = self.pipeline.add_queue('gesture', maxsize=1)
+        render_queue = self.pipeline.add_queue('render', maxsize=1)
+        self.pipeline.add_stage('inference', self._next_frame, self._infer,
+                                [gesture_queue, render_queue])
+        self.pipeline.add_stage('gesture', lambda: gesture_queue.get(timeout=0.1), self._actuate)
+        self.pipeline.add_stage('render', lambda: render_queue.get(timeout=0.1), self._render)
 
-        # Performance tracking
-        frame_time = time.time()
-        processing_times = []
+        self.last_fps_time = time.time()
+        self.grabber.start()
+        self.pipeline.start()
+        # Cursor moves on its own clock when a cursor output rate is set
+        if self.controller is not None:
+            self.controller.start_cursor_output()
 
+        # Report statistics once per second until capture ends
         while self.running:
-            # Measure frame processing time
-            start_time = time.time()
-
-            # Read frame
-            ret, frame = cap.read()
-            if not ret:
-                self.status_signal.emit("Error: Failed to read frame")
+            self.grabber.join(timeout=1.0)
+            if not self.grabber.is_alive():
+                if self.running:
+                    self.status_signal.emit("Error: Failed to read frame")
                 break
 
-            # Flip frame horizontally for natural movement
-            frame = cv2.flip(frame, 1)
-
-            # Process frame if enabled
-            if self.controller and self.settings and self.settings.get('enabled') and self.processing_enabled:
-                # Process frame and detect hands
-                results = self.controller.process_frame(frame)
-
-                # Draw hand landmarks
-                self.controller.draw_landmarks(frame, results)
-
-                # Process hand gestures and control mouse
-                if results.multi_hand_landmarks:
-                    hand_landmarks = results.multi_hand_landmarks[0]
-                    gesture_state = self.controller.get_gesture(hand_landmarks)
-                    self.controller.control_mouse(hand_landmarks, gesture_state)
-
-            # Add FPS counter
-            self.frame_count += 1
-            if time.time() - self.last_fps_time > 1.0:
-                self.fps = self.frame_count / (time.time() - self.last_fps_time)
-                self.frame_count = 0
-                self.last_fps_time = time.time()
-                self.fps_signal.emit(self.fps)
-
-            # Add FPS text to frame
-            cv2.putText(frame, f"FPS: {self.fps:.1f}", (10, frame.shape[0] - 10),
-                        cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 1)
-
-            # Convert to Qt format for display
-            rgb_image = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            h, w, ch = rgb_image.shape
-            bytes_per_line = ch * w
-            qt_image = QImage(rgb_image.data, w, h, bytes_per_line, QImage.Format.Format_RGB888)
-
-            # Emit signal with the image
-            self.change_pixmap_signal.emit(qt_image)
-
-            # Calculate processing time
-            process_time = time.time() - start_time
-            processing_times.append(process_time)
-            if len(processing_times) > 100:
-                processing_times.pop(0)
-
-            # Adaptive sleep to maintain target frame rate
-            target_frame_time = 1.0 / 30  # Target 30 FPS
-            sleep_time = max(0, target_frame_time - process_time)
-            if sleep_time > 0:
-                time.sleep(sleep_time)
-
+            now = time.time()
+            self.fps = self.frame_count / (now - self.last_fps_time)
+            self.frame_count = 0
+            self.last_fps_time = now
+            self.fps_signal.emit(self.fps)
+            self.frame_stats_signal.emit(self.frame_stats())
+
+        self.pipeline.stop()
+        if self.controller is not None:
+            self.controller.stop_cursor_output()
+        self.grabber.stop()
         cap.release()
         self.status_signal.emit("Camera disconnected")
 
+    def _next_frame(self):
+        """Take the newest captured frame, skipping any we were too slow for"""
+        captured = self.grabber.slot.get(self._last_index, timeout=0.1)
+        if captured is not None:
+            self._last_index = captured.index
+        return captured
+
+    def _infer(self, captured):
+        """Inference stage: detect hands in the mirrored RGB frame"""
+        # The capture thread already converted and flipped the frame into a
+        # pooled RGB buffer, which inference and the preview both use as-is
+        frame = captured.image
+
+        results = None
+        capture_time = captured.timestamp
+        if self.controller and self.settings and self.settings.get('enabled') and self.processing_enabled:
+            results = self.controller.process_frame(frame, captured.timestamp)
+            # Asynchronous backends return the results of an earlier frame
+            capture_time = self.controller.results_timestamp
+
+        self.frame_count += 1
+        return frame, results, capture_time
+
+    def _actuate(self, item):
+        """Gesture stage: classify the hand pose and control the mouse"""
+        frame, results, capture_time = item
+        if results is not None and results.multi_hand_landmarks:
+            hand_landmarks = results.multi_hand_landmarks[0]
+            gesture_state = self.controller.get_gesture(hand_landmarks)
+            self.controller.control_mouse(hand_landmarks, gesture_state, capture_time)
+        elif results is not None:
+            # Hand lost: end gestures in progress
+            self.controller.release_gestures()
+
+    def _render(self, item):
+        """Render stage: draw overlays and hand the preview to the GUI"""
+        # Nothing to draw for while the preview can't be seen
+        if not self.preview_visible:
+            return
+
+        # Optionally render at a lower rate than tracking runs
+        now = time.monotonic()
+        preview_fps = self.settings.get('preview_fps', 0) if self.settings else 0
+        if preview_fps and now - self._last_render_time < 1.0 / preview_fps:
+            return
+        self._last_render_time = now
+
+        frame, results, _ = item
+
+        # Produce the preview at the size it is displayed at, so the GUI
+        # thread only has to show it
+        h, w = frame.shape[:2]
+        label_w, label_h = self.preview_size or (w, h)
+        ratio = min(label_w / w, label_h / h)
+        display_size = (max(1, int(w * ratio)), max(1, int(h * ratio)))
+
+        # Optionally draw at a lower resolution than that
+        preview_scale = self.settings.get('preview_scale', 1.0) if self.settings else 1.0
+        render_size = display_size
+        if preview_scale < 1.0:
+            render_size = (min(display_size[0], max(1, int(w * preview_scale))),
+                           min(display_size[1], max(1, int(h * preview_scale))))
+
+        # Always draw into a preview buffer: the frame belongs to the capture
+        # ring, which reuses it while the GUI may still be painting the preview
+        frame = self._resize_preview(frame, render_size)
+
+        if results is not None:
+            self.controller.draw_landmarks(frame, results)
+
+        # Add FPS text to frame
+        self.overlay.draw(frame, f"FPS: {self.fps:.1f}", (10, frame.shape[0] - 10), 0.5, (0, 255, 0), 1)
+
+        if render_size != display_size:
+            frame = self._resize_preview(frame, display_size)
+
+        # Wrap the RGB buffer for display (no conversion or copy needed)
+        h, w, ch = frame.shape
+        bytes_per_line = ch * w
+        qt_image = QImage(frame.data, w, h, bytes_per_line, QImage.Format.Format_RGB888)
+
+        # Emit signal with the image
+        self.change_pixmap_signal.emit(qt_image)
+
+    def _resize_preview(self, frame, size):
+        """Resize (or copy) a frame into one of a few reused preview buffers"""
+        # Rotate buffers so the GUI can still read the previous preview
+        self._preview_position = (self._preview_position + 1) % len(self._preview_buffers)
+        buffer = self._preview_buffers[self._preview_position]
+        if buffer is None or buffer.shape[1::-1] != size:
+            buffer = np.empty((size[1], size[0], 3), dtype=np.uint8)
+            self._preview_buffers[self._preview_position] = buffer
+
+        if frame.shape[1::-1] == size:
+            np.copyto(buffer, frame)
+        else:
+            interpolation = cv2.INTER_AREA if size[0] < frame.shape[1] else cv2.INTER_LINEAR
+            cv2.resize(frame, size, dst=buffer, interpolation=interpolation)
+        return buffer
+
     def stop(self):
         self.running = False
         self.wait()
 
 
+class ProfileBenchmarkThread(QThread):
+    """Times the performance profiles off the GUI thread (it takes seconds)"""
+    result_signal = pyqtSignal(str, dict)
+
+    def __init__(self, latency_target_ms):
+        super().__init__()
+        self.latency_target_ms = latency_target_ms
+
+    def run(self):
+        name, timings = profiles.benchmark_profiles(self.latency_target_ms)
+        self.result_signal.emit(name, timings)
+
+
 class TutorialWizard(QWizard):
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -413,8 +551,13 @@ class NoMouseApp(QMainWindow):
         # Load settings
         self.settings_manager = Settings()
 
+        # Pick a performance profile for this machine before the detector is created
+        if self.settings_manager.get('performance_profile', 'balanced') == 'auto':
+            profiles.auto_select(self.settings_manager)
+
         # Initialize controller
         self.controller = HandGestureController(self.settings_manager.current)
+        self.profile_thread = None
 
         # Setup UI
         self.init_ui()
@@ -426,6 +569,10 @@ class NoMouseApp(QMainWindow):
         self.video_thread.change_pixmap_signal.connect(self.update_image)
         self.video_thread.status_signal.connect(self.update_status)
         self.video_thread.fps_signal.connect(self.update_fps)
+        self.video_thread.frame_stats_signal.connect(self.update_frame_stats)
+
+        self.video_thread.set_preview_visible(self.preview_visible())
+        self.video_thread.set_preview_size(self.video_label.width(), self.video_label.height())
 
         # Start video thread if enabled
         if self.settings_manager.get('enabled'):
@@ -632,6 +779,8 @@ class NoMouseApp(QMainWindow):
         self.video_label.setMinimumSize(640, 480)
         self.video_label.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
         self.video_label.setStyleSheet("background-color: #1E1E1E; border-radius: 8px;")
+        # Previews are rendered at the label size, so follow its resizes
+        self.video_label.installEventFilter(self)
         video_layout.addWidget(self.video_label)
 
         main_tab_layout.addWidget(video_frame)
@@ -668,6 +817,9 @@ class NoMouseApp(QMainWindow):
         # Add tab
         self.tabs.addTab(main_tab, 'Main')
 
+        # Only render the preview while the Main tab is showing
+        self.tabs.currentChanged.connect(self.update_preview_visibility)
+
     def setup_settings_tab(self):
         """Set up the settings tab with all configuration options"""
         settings_tab = QWidget()
@@ -693,6 +845,96 @@ class NoMouseApp(QMainWindow):
         camera_selector_layout.addStretch()
 
         camera_layout.addLayout(camera_selector_layout)
+
+        # Target frame rate
+        fps_selector_layout = QHBoxLayout()
+        fps_selector_layout.addWidget(QLabel('Target Frame Rate:'))
+        self.fps_combo = QComboBox()
+        for fps in (15, 30, 60, 120):
+            self.fps_combo.addItem(f'{fps} FPS', fps)
+        self.fps_combo.setCurrentIndex(max(0, self.fps_combo.findData(self.settings_manager.get('target_fps', 30))))
+        self.fps_combo.currentIndexChanged.connect(self.change_target_fps)
+        fps_selector_layout.addWidget(self.fps_combo)
+        fps_selector_layout.addStretch()
+        camera_layout.addLayout(fps_selector_layout)
+
+        # Performance profile
+        profile_layout = QHBoxLayout()
+        profile_layout.addWidget(QLabel('Performance Profile:'))
+        self.profile_combo = QComboBox()
+        for label, name in (('Auto (benchmark at startup)', 'auto'), ('Low Power', 'low-power'),
+                            ('Balanced', 'balanced'), ('Low Latency', 'low-latency')):
+            self.profile_combo.addItem(label, name)
+        self.profile_combo.setCurrentIndex(
+            max(0, self.profile_combo.findData(self.settings_manager.get('performance_profile', 'balanced'))))
+        self.update_profile_tooltip()
+        self.profile_combo.currentIndexChanged.connect(self.change_performance_profile)
+        profile_layout.addWidget(self.profile_combo)
+        profile_layout.addStretch()
+        camera_layout.addLayout(profile_layout)
+
+        # Hand tracking backend
+        backend_layout = QHBoxLayout()
+        backend_layout.addWidget(QLabel('Hand Tracking Backend (requires restart):'))
+        self.backend_combo = QComboBox()
+        self.backend_combo.addItem('MediaPipe Hands', 'solutions')
+        self.backend_combo.addItem('MediaPipe Tasks (asynchronous)', 'tasks')
+        self.backend_combo.setCurrentIndex(
+            max(0, self.backend_combo.findData(self.settings_manager.get('landmark_backend', 'solutions'))))
+        self.backend_combo.currentIndexChanged.connect(self.change_landmark_backend)
+        backend_layout.addWidget(self.backend_combo)
+        backend_layout.addStretch()
+        camera_layout.addLayout(backend_layout)
+
+        # Separate inference process option
+        self.inference_process_checkbox = QCheckBox('Run Hand Tracking in a Separate Process (requires restart)')
+        self.inference_process_checkbox.setChecked(self.settings_manager.get('inference_process', False))
+        self.inference_process_checkbox.stateChanged.connect(self.toggle_inference_process)
+        camera_layout.addWidget(self.inference_process_checkbox)
+
+        # ROI tracking option
+        self.roi_checkbox = QCheckBox('Track Hand Region (experimental)')
+        self.roi_checkbox.setToolTip("Runs inference on a crop around the hand. MediaPipe Hands already "
+                                     "tracks the hand itself, so this is not faster (see benchmark.py roi)")
+        self.roi_checkbox.setChecked(self.settings_manager.get('roi_tracking', False))
+        self.roi_checkbox.stateChanged.connect(self.toggle_roi_tracking)
+        camera_layout.addWidget(self.roi_checkbox)
+
+        # Adaptive inference rate option
+        self.adaptive_checkbox = QCheckBox('Adaptive Inference Rate (predict slow hand movement)')
+        self.adaptive_checkbox.setChecked(self.settings_manager.get('adaptive_inference', False))
+        self.adaptive_checkbox.stateChanged.connect(self.toggle_adaptive_inference)
+        camera_layout.addWidget(self.adaptive_checkbox)
+
+        # Low-power presence mode option
+        self.presence_checkbox = QCheckBox('Low-Power Mode When No Hand Is Visible')
+        self.presence_checkbox.setChecked(self.settings_manager.get('presence_detection', False))
+        self.presence_checkbox.stateChanged.connect(self.toggle_presence_detection)
+        camera_layout.addWidget(self.presence_checkbox)
+
+        # Idle delay
+        idle_layout = QHBoxLayout()
+        idle_layout.addWidget(QLabel('Idle After:'))
+        self.idle_slider = QSlider(Qt.Orientation.Horizontal)
+        self.idle_slider.setRange(1, 30)
+        self.idle_slider.setValue(int(self.settings_manager.get('idle_enter_seconds', 3.0)))
+        self.idle_slider.valueChanged.connect(self.update_idle_enter_seconds)
+        self.idle_value_label = QLabel(f"{self.idle_slider.value()}s")
+        idle_layout.addWidget(self.idle_slider)
+        idle_layout.addWidget(self.idle_value_label)
+        camera_layout.addLayout(idle_layout)
+
+        # Wake-up motion threshold
+        motion_layout = QHBoxLayout()
+        motion_layout.addWidget(QLabel('Wake-up Motion:'))
+        self.motion_slider = QSlider(Qt.Orientation.Horizontal)
+        self.motion_slider.setRange(1, 20)
+        self.motion_slider.setValue(int(self.settings_manager.get('idle_motion_threshold', 4.0)))
+        self.motion_slider.valueChanged.connect(self.update_idle_motion_threshold)
+        self.motion_value_label = QLabel(f"{self.motion_slider.value()}")
+        motion_layout.addWidget(self.motion_slider)
+        motion_layout.addWidget(self.motion_value_label)
+        camera_layout.addLayout(motion_layout)
         settings_layout.addWidget(camera_group)
 
         # Gesture settings group
@@ -711,6 +953,116 @@ class NoMouseApp(QMainWindow):
         smoothing_layout.addWidget(self.smoothing_value_label)
         gesture_layout.addLayout(smoothing_layout)
 
+        # Cursor filter
+        filter_layout = QHBoxLayout()
+        filter_layout.addWidget(QLabel('Cursor Filter:'))
+        self.filter_combo = QComboBox()
+        self.filter_combo.addItem('Smoothing + Kalman', 'kalman')
+        self.filter_combo.addItem('One Euro (less lag)', 'one_euro')
+        self.filter_combo.addItem('Predictive (latency compensation)', 'predictive')
+        self.filter_combo.addItem('Custom (cursor_filter_chain in settings.json)', 'custom')
+        self.filter_combo.setCurrentIndex(
+            max(0, self.filter_combo.findData(self.settings_manager.get('cursor_filter', 'kalman'))))
+        self.filter_combo.currentIndexChanged.connect(self.change_cursor_filter)
+        filter_layout.addWidget(self.filter_combo)
+        filter_layout.addStretch()
+        gesture_layout.addLayout(filter_layout)
+
+        # One Euro minimum cutoff
+        min_cutoff_layout = QHBoxLayout()
+        min_cutoff_layout.addWidget(QLabel('One Euro Min Cutoff:'))
+        self.min_cutoff_slider = QSlider(Qt.Orientation.Horizontal)
+        self.min_cutoff_slider.setRange(1, 50)
+        self.min_cutoff_slider.setValue(int(self.settings_manager.get('one_euro_min_cutoff', 1.0) * 10))
+        self.min_cutoff_slider.valueChanged.connect(self.update_one_euro_min_cutoff)
+        self.min_cutoff_value_label = QLabel(f"{self.min_cutoff_slider.value() / 10:.1f} Hz")
+        min_cutoff_layout.addWidget(self.min_cutoff_slider)
+        min_cutoff_layout.addWidget(self.min_cutoff_value_label)
+        gesture_layout.addLayout(min_cutoff_layout)
+
+        # One Euro speed coefficient
+        beta_layout = QHBoxLayout()
+        beta_layout.addWidget(QLabel('One Euro Beta:'))
+        self.beta_slider = QSlider(Qt.Orientation.Horizontal)
+        self.beta_slider.setRange(0, 50)
+        self.beta_slider.setValue(int(round(self.settings_manager.get('one_euro_beta', 0.007) * 1000)))
+        self.beta_slider.valueChanged.connect(self.update_one_euro_beta)
+        self.beta_value_label = QLabel(f"{self.beta_slider.value() / 1000:.3f}")
+        beta_layout.addWidget(self.beta_slider)
+        beta_layout.addWidget(self.beta_value_label)
+        gesture_layout.addLayout(beta_layout)
+
+        # One Euro speed cutoff
+        d_cutoff_layout = QHBoxLayout()
+        d_cutoff_layout.addWidget(QLabel('One Euro Speed Cutoff:'))
+        self.d_cutoff_slider = QSlider(Qt.Orientation.Horizontal)
+        self.d_cutoff_slider.setRange(1, 50)
+        self.d_cutoff_slider.setValue(int(self.settings_manager.get('one_euro_d_cutoff', 1.0) * 10))
+        self.d_cutoff_slider.valueChanged.connect(self.update_one_euro_d_cutoff)
+        self.d_cutoff_value_label = QLabel(f"{self.d_cutoff_slider.value() / 10:.1f} Hz")
+        d_cutoff_layout.addWidget(self.d_cutoff_slider)
+        d_cutoff_layout.addWidget(self.d_cutoff_value_label)
+        gesture_layout.addLayout(d_cutoff_layout)
+
+        # Prediction horizon
+        horizon_layout = QHBoxLayout()
+        horizon_layout.addWidget(QLabel('Prediction Horizon:'))
+        self.horizon_slider = QSlider(Qt.Orientation.Horizontal)
+        self.horizon_slider.setRange(0, 100)
+        self.horizon_slider.setValue(int(self.settings_manager.get('prediction_horizon', 0.03) * 1000))
+        self.horizon_slider.valueChanged.connect(self.update_prediction_horizon)
+        self.horizon_value_label = QLabel(f"{self.horizon_slider.value()} ms")
+        horizon_layout.addWidget(self.horizon_slider)
+        horizon_layout.addWidget(self.horizon_value_label)
+        gesture_layout.addLayout(horizon_layout)
+
+        # Prediction overshoot cap
+        offset_layout = QHBoxLayout()
+        offset_layout.addWidget(QLabel('Max Prediction Lead:'))
+        self.offset_slider = QSlider(Qt.Orientation.Horizontal)
+        self.offset_slider.setRange(0, 200)
+        self.offset_slider.setValue(int(self.settings_manager.get('prediction_max_offset', 80)))
+        self.offset_slider.valueChanged.connect(self.update_prediction_max_offset)
+        self.offset_value_label = QLabel(f"{self.offset_slider.value()} px")
+        offset_layout.addWidget(self.offset_slider)
+        offset_layout.addWidget(self.offset_value_label)
+        gesture_layout.addLayout(offset_layout)
+
+        # Cursor output rate, independent of the camera rate
+        output_layout = QHBoxLayout()
+        output_layout.addWidget(QLabel('Cursor Output:'))
+        self.output_rate_combo = QComboBox()
+        self.output_rate_combo.addItem('Every camera frame', 0)
+        for rate in (60, 120, 144, 240):
+            self.output_rate_combo.addItem(f"{rate} Hz", rate)
+        self.output_rate_combo.setCurrentIndex(
+            max(0, self.output_rate_combo.findData(self.settings_manager.get('cursor_output_rate', 0))))
+        self.output_rate_combo.currentIndexChanged.connect(self.change_cursor_output_rate)
+        output_layout.addWidget(self.output_rate_combo)
+        self.output_mode_combo = QComboBox()
+        self.output_mode_combo.addItem('Interpolate (smoothest, +1 frame)', 'interpolate')
+        self.output_mode_combo.addItem('Extrapolate (no added lag)', 'extrapolate')
+        self.output_mode_combo.setCurrentIndex(
+            max(0, self.output_mode_combo.findData(self.settings_manager.get('cursor_output_mode', 'interpolate'))))
+        self.output_mode_combo.currentIndexChanged.connect(self.change_cursor_output_mode)
+        output_layout.addWidget(self.output_mode_combo)
+        output_layout.addStretch()
+        gesture_layout.addLayout(output_layout)
+
+        # Mouse and keyboard event injection
+        input_backend_layout = QHBoxLayout()
+        input_backend_layout.addWidget(QLabel('Input Backend:'))
+        self.input_backend_combo = QComboBox()
+        self.input_backend_combo.addItem('Auto', 'auto')
+        self.input_backend_combo.addItem('XTest (Linux/X11)', 'xtest')
+        self.input_backend_combo.addItem('pyautogui', 'pyautogui')
+        self.input_backend_combo.setCurrentIndex(
+            max(0, self.input_backend_combo.findData(self.settings_manager.get('input_backend', 'auto'))))
+        self.input_backend_combo.currentIndexChanged.connect(self.change_input_backend)
+        input_backend_layout.addWidget(self.input_backend_combo)
+        input_backend_layout.addStretch()
+        gesture_layout.addLayout(input_backend_layout)
+
         # Stability threshold
         stability_layout = QHBoxLayout()
         stability_layout.addWidget(QLabel('Stability:'))
@@ -759,6 +1111,30 @@ class NoMouseApp(QMainWindow):
         pinch_layout.addWidget(self.pinch_value_label)
         gesture_layout.addLayout(pinch_layout)
 
+        # Learned gesture classifier option
+        self.gesture_model_checkbox = QCheckBox('Use Learned Gesture Classifier (train with gesture_model.py)')
+        self.gesture_model_checkbox.setChecked(self.settings_manager.get('gesture_model', False))
+        self.gesture_model_checkbox.stateChanged.connect(self.toggle_gesture_model)
+        gesture_layout.addWidget(self.gesture_model_checkbox)
+
+        # Temporal gestures option
+        self.temporal_checkbox = QCheckBox('Double Pinch, Pinch-Spread Zoom, Swipe and Flick')
+        self.temporal_checkbox.setChecked(self.settings_manager.get('temporal_gestures', False))
+        self.temporal_checkbox.stateChanged.connect(self.toggle_temporal_gestures)
+        gesture_layout.addWidget(self.temporal_checkbox)
+
+        # Double pinch window
+        double_pinch_layout = QHBoxLayout()
+        double_pinch_layout.addWidget(QLabel('Double Pinch Window:'))
+        self.double_pinch_slider = QSlider(Qt.Orientation.Horizontal)
+        self.double_pinch_slider.setRange(2, 10)
+        self.double_pinch_slider.setValue(int(self.settings_manager.get('double_pinch_window', 0.5) * 10))
+        self.double_pinch_slider.valueChanged.connect(self.update_double_pinch_window)
+        self.double_pinch_value_label = QLabel(f"{self.double_pinch_slider.value() / 10:.1f}s")
+        double_pinch_layout.addWidget(self.double_pinch_slider)
+        double_pinch_layout.addWidget(self.double_pinch_value_label)
+        gesture_layout.addLayout(double_pinch_layout)
+
         settings_layout.addWidget(gesture_group)
 
         # Application settings group
@@ -783,6 +1159,32 @@ class NoMouseApp(QMainWindow):
         self.gestures_checkbox.stateChanged.connect(self.toggle_show_gestures)
         app_layout.addWidget(self.gestures_checkbox)
 
+        # Preview frame rate
+        preview_fps_layout = QHBoxLayout()
+        preview_fps_layout.addWidget(QLabel('Preview Frame Rate:'))
+        self.preview_fps_combo = QComboBox()
+        for label, fps in (('Same as tracking', 0), ('15 FPS', 15), ('5 FPS', 5)):
+            self.preview_fps_combo.addItem(label, fps)
+        self.preview_fps_combo.setCurrentIndex(
+            max(0, self.preview_fps_combo.findData(self.settings_manager.get('preview_fps', 0))))
+        self.preview_fps_combo.currentIndexChanged.connect(self.change_preview_fps)
+        preview_fps_layout.addWidget(self.preview_fps_combo)
+        preview_fps_layout.addStretch()
+        app_layout.addLayout(preview_fps_layout)
+
+        # Preview resolution
+        preview_scale_layout = QHBoxLayout()
+        preview_scale_layout.addWidget(QLabel('Preview Resolution:'))
+        self.preview_scale_combo = QComboBox()
+        for label, scale in (('Full', 1.0), ('Half', 0.5), ('Quarter', 0.25)):
+            self.preview_scale_combo.addItem(label, scale)
+        self.preview_scale_combo.setCurrentIndex(
+            max(0, self.preview_scale_combo.findData(self.settings_manager.get('preview_scale', 1.0))))
+        self.preview_scale_combo.currentIndexChanged.connect(self.change_preview_scale)
+        preview_scale_layout.addWidget(self.preview_scale_combo)
+        preview_scale_layout.addStretch()
+        app_layout.addLayout(preview_scale_layout)
+
         # Theme selection
         theme_layout = QHBoxLayout()
         theme_layout.addWidget(QLabel('Theme:'))
@@ -919,9 +1321,8 @@ class NoMouseApp(QMainWindow):
 
     def update_image(self, image):
         """Update the video display with the latest frame"""
-        self.video_label.setPixmap(QPixmap.fromImage(image).scaled(
-            self.video_label.width(), self.video_label.height(),
-            Qt.AspectRatioMode.KeepAspectRatio))
+        # The video thread already scaled the image to the label size
+        self.video_label.setPixmap(QPixmap.fromImage(image))
 
     def update_status(self, status):
         """Update the status label"""
@@ -931,6 +1332,38 @@ class NoMouseApp(QMainWindow):
         """Update the FPS counter"""
         self.fps_label.setText(f"FPS: {fps:.1f}")
 
+    def update_frame_stats(self, stats):
+        """Show capture and pipeline statistics as the FPS label tooltip"""
+        lines = [
+            f"Captured: {stats['published']}",
+            f"Dropped: {stats['dropped']}",
+            f"Stale: {stats['stale']}"
+        ]
+        if 'interval_ms' in stats:
+            lines.append(f"Camera: {stats['camera_fps']:.0f} FPS, measured {stats['measured_fps']:.1f} FPS")
+            lines.append(f"Frame interval: {stats['interval_ms']:.1f} ms (jitter {stats['jitter_ms']:.1f} ms)")
+            lines.append(f"Frame buffers: {stats['allocations']} allocations, "
+                         f"{stats['bytes_copied_per_frame'] / 1e6:.1f} MB copied per frame")
+        for name, stage in stats.get('stages', {}).items():
+            lines.append(f"{name}: {stage['avg_ms']:.1f} ms")
+        for name, dropped in stats.get('queue_dropped', {}).items():
+            lines.append(f"Dropped before {name}: {dropped}")
+        if 'inference' in stats:
+            lines.append(f"Skipped inference: {stats['inference']['skip_ratio']:.0%}")
+            lines.append(f"Prediction error: {stats['inference']['prediction_error']:.4f}")
+            lines.append(f"Tracking: {stats['inference']['tracking_seconds']:.0f}s, "
+                         f"idle: {stats['inference']['idle_seconds']:.0f}s")
+        for stage in stats.get('inference', {}).get('cursor_filter', []):
+            lines.append(f"Cursor {stage['stage']}: {stage['us_per_sample']:.1f} us, "
+                         f"lag {stage['lag_ms']:.0f} ms")
+        output = stats.get('inference', {}).get('cursor_output')
+        if output:
+            lines.append(f"Cursor output: {output['rate']} Hz, {output['moves']} moves, "
+                         f"{output['late_ticks']} late, {output['avg_us']:.0f} us")
+        for event, timing in stats.get('inference', {}).get('input', {}).items():
+            lines.append(f"Input {event}: {timing['us_per_event']:.0f} us ({timing['count']} events)")
+        self.fps_label.setToolTip("\n".join(lines))
+
     def toggle_gesture_control(self):
         """Enable or disable gesture control"""
         enabled = not self.settings_manager.get('enabled')
@@ -973,10 +1406,68 @@ class NoMouseApp(QMainWindow):
         self.video_thread.change_pixmap_signal.connect(self.update_image)
         self.video_thread.status_signal.connect(self.update_status)
         self.video_thread.fps_signal.connect(self.update_fps)
+        self.video_thread.frame_stats_signal.connect(self.update_frame_stats)
+        self.video_thread.set_preview_visible(self.preview_visible())
+        self.video_thread.set_preview_size(self.video_label.width(), self.video_label.height())
 
         if self.settings_manager.get('enabled'):
             self.video_thread.start()
 
+    def change_target_fps(self, index):
+        """Change the target capture frame rate"""
+        self.settings_manager.set('target_fps', self.fps_combo.itemData(index))
+
+        # The camera is configured when it opens, so restart it
+        self.change_camera(self.settings_manager.get('camera_index', 0))
+
+    def change_performance_profile(self, index):
+        """Apply a performance profile (the detection model changes after a restart)"""
+        name = self.profile_combo.itemData(index)
+        if name == 'auto':
+            # Benchmark in the background; the profile is applied when it finishes
+            self.profile_combo.setEnabled(False)
+            self.profile_combo.setToolTip("Measuring inference speed...")
+            self.profile_thread = ProfileBenchmarkThread(
+                self.settings_manager.get('profile_latency_target_ms', 30.0))
+            self.profile_thread.result_signal.connect(self.apply_auto_profile)
+            self.profile_thread.start()
+            return
+        profiles.apply_profile(self.settings_manager, name)
+        self.profile_applied()
+
+    def apply_auto_profile(self, name, timings):
+        """Apply the profile the background benchmark chose"""
+        self.profile_thread.wait()
+        self.profile_thread = None
+        self.profile_combo.setEnabled(True)
+        profiles.apply_auto_profile(self.settings_manager, name, timings)
+        self.profile_applied()
+
+    def profile_applied(self):
+        """Show a newly applied profile and restart the camera with it"""
+        self.update_profile_tooltip()
+
+        # Show the profile's frame rate without triggering a second camera restart
+        self.fps_combo.blockSignals(True)
+        self.fps_combo.setCurrentIndex(max(0, self.fps_combo.findData(self.settings_manager.get('target_fps', 30))))
+        self.fps_combo.blockSignals(False)
+
+        self.controller.update_settings(self.settings_manager.current)
+
+        # Resolution and frame rate are set when the camera opens, so restart it
+        self.change_camera(self.settings_manager.get('camera_index', 0))
+
+    def update_profile_tooltip(self):
+        """Describe the active profile, including the auto benchmark result"""
+        settings = self.settings_manager
+        text = (f"{settings.get('capture_width', 640)}x{settings.get('capture_height', 480)} at "
+                f"{settings.get('target_fps', 30)} FPS, model complexity {settings.get('model_complexity', 1)}")
+        if settings.get('performance_profile') == 'auto' and settings.get('auto_profile'):
+            timings = ', '.join(f"{name}: {ms:.1f} ms"
+                                for name, ms in settings.get('auto_profile_timings', {}).items())
+            text = f"Selected {settings.get('auto_profile')} ({timings})\n{text}"
+        self.profile_combo.setToolTip(text)
+
     def update_smoothing(self):
         """Update smoothing factor setting"""
         value = self.smoothing_slider.value() / 10.0
@@ -988,6 +1479,93 @@ class NoMouseApp(QMainWindow):
         # Update controller
         self.controller.update_settings({'smoothing_factor': value})
 
+    def change_cursor_filter(self, index):
+        """Switch between the smoothing chain and the One Euro filter"""
+        value = self.filter_combo.itemData(index)
+        self.settings_manager.set('cursor_filter', value)
+
+        # Update controller
+        self.controller.update_settings({'cursor_filter': value})
+
+    def update_one_euro_min_cutoff(self):
+        """Update the One Euro cutoff for a still hand"""
+        value = self.min_cutoff_slider.value() / 10.0
+        self.settings_manager.set('one_euro_min_cutoff', value)
+
+        # Update label
+        self.min_cutoff_value_label.setText(f"{value:.1f} Hz")
+
+        # Update controller
+        self.controller.update_settings({'one_euro_min_cutoff': value})
+
+    def update_one_euro_beta(self):
+        """Update how quickly the One Euro cutoff rises with speed"""
+        value = self.beta_slider.value() / 1000.0
+        self.settings_manager.set('one_euro_beta', value)
+
+        # Update label
+        self.beta_value_label.setText(f"{value:.3f}")
+
+        # Update controller
+        self.controller.update_settings({'one_euro_beta': value})
+
+    def update_one_euro_d_cutoff(self):
+        """Update the One Euro cutoff of the speed estimate"""
+        value = self.d_cutoff_slider.value() / 10.0
+        self.settings_manager.set('one_euro_d_cutoff', value)
+
+        # Update label
+        self.d_cutoff_value_label.setText(f"{value:.1f} Hz")
+
+        # Update controller
+        self.controller.update_settings({'one_euro_d_cutoff': value})
+
+    def update_prediction_horizon(self):
+        """Update how far past the measured delay the predictive filter looks"""
+        value = self.horizon_slider.value() / 1000.0
+        self.settings_manager.set('prediction_horizon', value)
+
+        # Update label
+        self.horizon_value_label.setText(f"{self.horizon_slider.value()} ms")
+
+        # Update controller
+        self.controller.update_settings({'prediction_horizon': value})
+
+    def update_prediction_max_offset(self):
+        """Update how far the prediction may lead, which limits overshoot"""
+        value = self.offset_slider.value()
+        self.settings_manager.set('prediction_max_offset', value)
+
+        # Update label
+        self.offset_value_label.setText(f"{value} px")
+
+        # Update controller
+        self.controller.update_settings({'prediction_max_offset': value})
+
+    def change_cursor_output_rate(self, index):
+        """Move the cursor on every camera frame or from a thread at a fixed rate"""
+        value = self.output_rate_combo.itemData(index)
+        self.settings_manager.set('cursor_output_rate', value)
+
+        # Update controller
+        self.controller.update_settings({'cursor_output_rate': value})
+
+    def change_cursor_output_mode(self, index):
+        """Switch the cursor output between interpolating and extrapolating"""
+        value = self.output_mode_combo.itemData(index)
+        self.settings_manager.set('cursor_output_mode', value)
+
+        # Update controller
+        self.controller.update_settings({'cursor_output_mode': value})
+
+    def change_input_backend(self, index):
+        """Switch how mouse and keyboard events are injected"""
+        value = self.input_backend_combo.itemData(index)
+        self.settings_manager.set('input_backend', value)
+
+        # Update controller
+        self.controller.update_settings({'input_backend': value})
+
     def update_stability(self):
         """Update stability threshold setting"""
         value = self.stability_slider.value()
@@ -1032,6 +1610,33 @@ class NoMouseApp(QMainWindow):
         # Update controller
         self.controller.update_settings({'pinch_threshold': value})
 
+    def toggle_gesture_model(self):
+        """Toggle classifying poses with the learned model instead of the rules"""
+        value = self.gesture_model_checkbox.isChecked()
+        self.settings_manager.set('gesture_model', value)
+
+        # Update controller (loads or drops the model)
+        self.controller.update_settings({'gesture_model': value})
+
+    def toggle_temporal_gestures(self):
+        """Toggle the time-based gestures"""
+        value = self.temporal_checkbox.isChecked()
+        self.settings_manager.set('temporal_gestures', value)
+
+        # Update controller
+        self.controller.update_settings({'temporal_gestures': value})
+
+    def update_double_pinch_window(self):
+        """Update the most time between the two pinches of a double pinch"""
+        value = self.double_pinch_slider.value() / 10.0
+        self.settings_manager.set('double_pinch_window', value)
+
+        # Update label
+        self.double_pinch_value_label.setText(f"{value:.1f}s")
+
+        # Update controller
+        self.controller.update_settings({'double_pinch_window': value})
+
     def toggle_start_minimized(self):
         """Toggle start minimized setting"""
         value = self.minimized_checkbox.isChecked()
@@ -1045,6 +1650,62 @@ class NoMouseApp(QMainWindow):
         # Configure autostart
         utils.setup_autostart(value)
 
+    def change_landmark_backend(self, index):
+        """Change the hand tracking backend (applies after a restart)"""
+        self.settings_manager.set('landmark_backend', self.backend_combo.itemData(index))
+
+    def toggle_inference_process(self):
+        """Toggle running hand tracking in a worker process"""
+        value = self.inference_process_checkbox.isChecked()
+        self.settings_manager.set('inference_process', value)
+        # The detector is created at startup, so the change applies after a restart
+
+    def toggle_roi_tracking(self):
+        """Toggle cropping inference to the region around the hand"""
+        value = self.roi_checkbox.isChecked()
+        self.settings_manager.set('roi_tracking', value)
+
+        # Update controller
+        self.controller.update_settings({'roi_tracking': value})
+
+    def toggle_adaptive_inference(self):
+        """Toggle skipping inference on slow hand movement"""
+        value = self.adaptive_checkbox.isChecked()
+        self.settings_manager.set('adaptive_inference', value)
+
+        # Update controller
+        self.controller.update_settings({'adaptive_inference': value})
+
+    def toggle_presence_detection(self):
+        """Toggle the low-power idle state"""
+        value = self.presence_checkbox.isChecked()
+        self.settings_manager.set('presence_detection', value)
+
+        # Update controller
+        self.controller.update_settings({'presence_detection': value})
+
+    def update_idle_enter_seconds(self):
+        """Update how long without a hand before going idle"""
+        value = float(self.idle_slider.value())
+        self.settings_manager.set('idle_enter_seconds', value)
+
+        # Update label
+        self.idle_value_label.setText(f"{value:.0f}s")
+
+        # Update controller
+        self.controller.update_settings({'idle_enter_seconds': value})
+
+    def update_idle_motion_threshold(self):
+        """Update the motion level that wakes up tracking"""
+        value = float(self.motion_slider.value())
+        self.settings_manager.set('idle_motion_threshold', value)
+
+        # Update label
+        self.motion_value_label.setText(f"{value:.0f}")
+
+        # Update controller
+        self.controller.update_settings({'idle_motion_threshold': value})
+
     def toggle_show_gestures(self):
         """Toggle show gestures setting"""
         value = self.gestures_checkbox.isChecked()
@@ -1053,6 +1714,14 @@ class NoMouseApp(QMainWindow):
         # Update controller
         self.controller.update_settings({'show_gestures': value})
 
+    def change_preview_fps(self, index):
+        """Change how often the preview is rendered"""
+        self.settings_manager.set('preview_fps', self.preview_fps_combo.itemData(index))
+
+    def change_preview_scale(self, index):
+        """Change the resolution the preview is rendered at"""
+        self.settings_manager.set('preview_scale', self.preview_scale_combo.itemData(index))
+
     def change_theme(self, theme_name):
         """Change application theme"""
         self.settings_manager.set('theme', theme_name.lower())
@@ -1066,18 +1735,79 @@ class NoMouseApp(QMainWindow):
         # Update UI with default values
         self.smoothing_slider.setValue(int(self.settings_manager.get('smoothing_factor', 0.8) * 10))
         self.stability_slider.setValue(self.settings_manager.get('stability_threshold', 5))
+        self.filter_combo.setCurrentIndex(
+            max(0, self.filter_combo.findData(self.settings_manager.get('cursor_filter', 'kalman'))))
+        self.min_cutoff_slider.setValue(int(self.settings_manager.get('one_euro_min_cutoff', 1.0) * 10))
+        self.beta_slider.setValue(int(round(self.settings_manager.get('one_euro_beta', 0.007) * 1000)))
+        self.d_cutoff_slider.setValue(int(self.settings_manager.get('one_euro_d_cutoff', 1.0) * 10))
+        self.horizon_slider.setValue(int(self.settings_manager.get('prediction_horizon', 0.03) * 1000))
+        self.offset_slider.setValue(int(self.settings_manager.get('prediction_max_offset', 80)))
+        self.output_rate_combo.setCurrentIndex(
+            max(0, self.output_rate_combo.findData(self.settings_manager.get('cursor_output_rate', 0))))
+        self.output_mode_combo.setCurrentIndex(
+            max(0, self.output_mode_combo.findData(self.settings_manager.get('cursor_output_mode', 'interpolate'))))
+        self.input_backend_combo.setCurrentIndex(
+            max(0, self.input_backend_combo.findData(self.settings_manager.get('input_backend', 'auto'))))
         self.dwell_slider.setValue(int(self.settings_manager.get('dwell_time', 0.8) * 10))
         self.scroll_slider.setValue(self.settings_manager.get('scroll_sensitivity', 5))
         self.pinch_slider.setValue(int(self.settings_manager.get('pinch_threshold', 0.1) * 100))
+        self.gesture_model_checkbox.setChecked(self.settings_manager.get('gesture_model', False))
+        self.temporal_checkbox.setChecked(self.settings_manager.get('temporal_gestures', False))
+        self.double_pinch_slider.setValue(int(self.settings_manager.get('double_pinch_window', 0.5) * 10))
         self.camera_combo.setCurrentIndex(self.settings_manager.get('camera_index', 0))
+        self.fps_combo.setCurrentIndex(max(0, self.fps_combo.findData(self.settings_manager.get('target_fps', 30))))
+        self.profile_combo.blockSignals(True)
+        self.profile_combo.setCurrentIndex(
+            max(0, self.profile_combo.findData(self.settings_manager.get('performance_profile', 'balanced'))))
+        self.profile_combo.blockSignals(False)
+        self.update_profile_tooltip()
         self.minimized_checkbox.setChecked(self.settings_manager.get('start_minimized', False))
         self.autostart_checkbox.setChecked(self.settings_manager.get('start_on_boot', False))
         self.gestures_checkbox.setChecked(self.settings_manager.get('show_gestures', True))
+        self.preview_fps_combo.setCurrentIndex(
+            max(0, self.preview_fps_combo.findData(self.settings_manager.get('preview_fps', 0))))
+        self.preview_scale_combo.setCurrentIndex(
+            max(0, self.preview_scale_combo.findData(self.settings_manager.get('preview_scale', 1.0))))
+        self.backend_combo.setCurrentIndex(
+            max(0, self.backend_combo.findData(self.settings_manager.get('landmark_backend', 'solutions'))))
+        self.inference_process_checkbox.setChecked(self.settings_manager.get('inference_process', False))
+        self.roi_checkbox.setChecked(self.settings_manager.get('roi_tracking', False))
+        self.adaptive_checkbox.setChecked(self.settings_manager.get('adaptive_inference', False))
+        self.presence_checkbox.setChecked(self.settings_manager.get('presence_detection', False))
+        self.idle_slider.setValue(int(self.settings_manager.get('idle_enter_seconds', 3.0)))
+        self.motion_slider.setValue(int(self.settings_manager.get('idle_motion_threshold', 4.0)))
         self.theme_combo.setCurrentText(self.settings_manager.get('theme', 'dark').capitalize())
 
         # Update controller
         self.controller.update_settings(self.settings_manager.current)
 
+    def preview_visible(self):
+        """Whether the video preview can currently be seen"""
+        return self.video_label.isVisible() and not self.isMinimized()
+
+    def update_preview_visibility(self, *args):
+        """Pause preview rendering while the window is hidden, minimized or on another tab"""
+        if hasattr(self, 'video_thread'):
+            self.video_thread.set_preview_visible(self.preview_visible())
+
+    def eventFilter(self, obj, event):
+        if obj is self.video_label and event.type() == QEvent.Type.Resize and hasattr(self, 'video_thread'):
+            self.video_thread.set_preview_size(self.video_label.width(), self.video_label.height())
+        return super().eventFilter(obj, event)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.update_preview_visibility()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.update_preview_visibility()
+
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() == QEvent.Type.WindowStateChange:
+            self.update_preview_visibility()
+
     def closeEvent(self, event: QCloseEvent):
         """Handle window close event"""
         # Minimize to tray instead of closing
@@ -1089,6 +1819,11 @@ class NoMouseApp(QMainWindow):
         # Stop video thread
         if self.video_thread.isRunning():
             self.video_thread.stop()
+        if self.profile_thread is not None:
+            self.profile_thread.wait()
+
+        # Release the hand detector (and its worker process, if any)
+        self.controller.close()
 
         # Save settings
         self.settings_manager.save()
@@ -1098,6 +1833,9 @@ class NoMouseApp(QMainWindow):
 
 
 def main():
+    # Needed for the inference worker process in frozen builds
+    multiprocessing.freeze_support()
+
     # Create application
     app = QApplication(sys.argv)
     app.setQuitOnLastWindowClosed(False)  # Don't quit when window is closed
@@ -0,0 +1,418 @@
+#!/usr/bin/env python3
+"""
+NoMouse - Benchmarks
+Micro-benchmarks for the hot paths of the tracking loop. Run one with:
+
+    python3 benchmark.py render
+    python3 benchmark.py gestures
+    python3 benchmark.py model
+    python3 benchmark.py filters --session session.npz
+    python3 benchmark.py filters --chain one_euro predictive
+    python3 benchmark.py output --rate 144
+    python3 benchmark.py input --backend xtest
+    python3 benchmark.py roi --video hand.mp4
+"""
+
+import argparse
+import sys
+import time
+
+import numpy as np
+
+from landmarks import NUM_LANDMARKS, array_to_landmarks
+
+def sample_hand(seed=0):
+    """A plausible-looking random hand in normalized coordinates"""
+    rng = np.random.default_rng(seed)
+    points = np.empty((NUM_LANDMARKS, 3), dtype=np.float32)
+    points[:, 0] = 0.4 + 0.2 * rng.random(NUM_LANDMARKS)
+    points[:, 1] = 0.3 + 0.4 * rng.random(NUM_LANDMARKS)
+    points[:, 2] = -0.05 * rng.random(NUM_LANDMARKS)
+    return points
+
+
+def time_call(function, iterations):
+    """Mean seconds per call"""
+    function()  # Warm up
+    start_time = time.perf_counter()
+    for _ in range(iterations):
+        function()
+    return (time.perf_counter() - start_time) / iterations
+
+
+def report(name, seconds):
+    print(f"  {name:<32} {seconds * 1e6:10.1f} us")
+
+
+def benchmark_render(args):
+    """Hand skeleton drawing: HandRenderer vs mediapipe drawing_utils"""
+    from hand_renderer import HandRenderer
+
+    frame = np.zeros((480, 640, 3), dtype=np.uint8)
+    hand_landmarks = array_to_landmarks(sample_hand())
+
+    print("Hand skeleton rendering (640x480):")
+    renderer = HandRenderer(budget_ms=float('inf'))
+    report("HandRenderer", time_call(lambda: renderer.draw(frame, hand_landmarks), args.iterations))
+
+    try:
+        import mediapipe as mp
+    except ImportError:
+        print("  mediapipe not installed, skipping drawing_utils")
+        return
+
+    mp_draw = mp.solutions.drawing_utils
+    mp_styles = mp.solutions.drawing_styles
+    landmark_style = mp_styles.get_default_hand_landmarks_style()
+    connection_style = mp_styles.get_default_hand_connections_style()
+    report("mediapipe drawing_utils", time_call(
+        lambda: mp_draw.draw_landmarks(frame, hand_landmarks, mp.solutions.hands.HAND_CONNECTIONS,
+                                       landmark_style, connection_style),
+        args.iterations))
+
+
+def benchmark_features(args):
+    """Gesture features for one hand: the per-frame path and the vectorized one"""
+    import gesture_features
+    from landmarks import landmarks_to_array
+
+    hand_landmarks = array_to_landmarks(sample_hand())
+    points = np.empty((NUM_LANDMARKS, 3), dtype=np.float32)
+    features = np.empty(gesture_features.NUM_FEATURES, dtype=np.float32)
+
+    print("Gesture features (one hand):")
+    report("landmarks_to_array", time_call(lambda: landmarks_to_array(hand_landmarks, points), args.iterations))
+    report("compute_features", time_call(
+        lambda: gesture_features.compute_features(points, features), args.iterations))
+    report("frame_features", time_call(
+        lambda: gesture_features.frame_features(hand_landmarks), args.iterations))
+    report("frame_features + classify", time_call(
+        lambda: gesture_features.classify(gesture_features.frame_features(hand_landmarks)),
+        args.iterations))
+
+
+def benchmark_batch(args):
+    """Batch gesture evaluation and a threshold sweep over many frames"""
+    import gesture_batch
+
+    frames = args.iterations * 1000
+    rng = np.random.default_rng(0)
+    points = (sample_hand()[np.newaxis] + 0.05 * rng.standard_normal((frames, NUM_LANDMARKS, 3))).astype(np.float32)
+
+    print(f"Batch gesture evaluation ({frames} frames):")
+    start_time = time.perf_counter()
+    flags, features = gesture_batch.evaluate(points)
+    elapsed = time.perf_counter() - start_time
+    report("evaluate (per frame)", elapsed / frames)
+    print(f"  {'evaluate (total)':<32} {elapsed:10.2f} s")
+
+    start_time = time.perf_counter()
+    gesture_batch.sweep(features, 'pinch_threshold', np.linspace(0.05, 0.15, 11))
+    print(f"  {'pinch_threshold sweep, 11 values':<32} {time.perf_counter() - start_time:10.2f} s")
+
+    sample = points[:1000]
+    mismatches = gesture_batch.check_consistency(sample, flags[:1000])
+    print(f"  {'streaming mismatches':<32} {len(mismatches):10d} of {len(sample)}")
+
+
+def benchmark_model(args):
+    """Learned gesture classifier vs the gesture rules: accuracy and time per frame"""
+    import gesture_features
+    from gesture_batch import batch_features
+    from gesture_model import augment, labels_from_flags, train
+    from landmark_sources import GESTURE_POSES
+
+    rng = np.random.default_rng(0)
+    labels = np.repeat(list(GESTURE_POSES), 2000)
+    points = np.stack([GESTURE_POSES[label] for label in labels])
+    points += rng.normal(0.0, 0.004, points.shape).astype(np.float32)
+
+    # Trained on upright hands plus tilted/scaled copies, tested on unseen ones
+    start_time = time.perf_counter()
+    model = train(np.concatenate([points, augment(points, 3)]), np.concatenate([labels, np.repeat(labels, 3)]))
+    training_time = time.perf_counter() - start_time
+    model.min_confidence = 0.6
+
+    print(f"Gesture classifier ({len(GESTURE_POSES)} poses, trained in {training_time:.1f}s):")
+    for name, test in (('upright', points), ('tilted and scaled', augment(points, 1, seed=1))):
+        model_accuracy = np.mean(model.predict_batch(test) == labels)
+        rules_accuracy = np.mean(labels_from_flags(gesture_features.classify_batch(batch_features(test)),
+                                                   model.classes) == labels)
+        print(f"  {'accuracy, ' + name:<32} model {model_accuracy * 100:5.1f}%  rules {rules_accuracy * 100:5.1f}%")
+
+    hand = np.ascontiguousarray(points[0])
+    features = gesture_features.compute_features(hand).tolist()
+    report("rules (classify)", time_call(lambda: gesture_features.classify(features), args.iterations))
+    report("model (predict)", time_call(lambda: model.predict(hand), args.iterations))
+    report("classify + model.apply", time_call(
+        lambda: model.apply(hand, gesture_features.classify(features)), args.iterations))
+
+
+def cursor_trace(settings, source, latency=0.0):
+    """
+    Drive a headless controller and return (N, 5) rows of time, cursor x, y
+    and the raw fingertip x, y in screen pixels, one per cursor move, with
+    the per-stage statistics of its cursor filter.
+    """
+    from input_backends import RecordingBackend
+    from landmark_sources import drive, headless_controller
+
+    rows = []
+    class TracingMouse(RecordingBackend):
+        def moveTo(self, x, y, *args, **kwargs):
+            super().moveTo(x, y)
+            tip = controller.index_finger_tip
+            rows.append((controller.clock(), x, y,
+                         tip[0] * self.screen_size[0], tip[1] * self.screen_size[1]))
+
+    controller = headless_controller(settings, TracingMouse())
+    drive(controller, source, latency=latency)
+    return np.array(rows, dtype=np.float64).reshape(-1, 5), controller.cursor_filter.stats()
+
+
+def trace_lag(trace, reference, max_lag=1.0):
+    """Delay (seconds, 1 ms steps) that best aligns a trace's cursor with a reference path"""
+    times = trace[:, 0]
+    lags = np.arange(-max_lag, max_lag, 0.001)
+    errors = [np.mean((trace[:, 1] - np.interp(times - lag, reference[:, 0], reference[:, 1])) ** 2 +
+                      (trace[:, 2] - np.interp(times - lag, reference[:, 0], reference[:, 2])) ** 2)
+              for lag in lags]
+    return lags[int(np.argmin(errors))]
+
+
+def trace_jitter(positions):
+    """RMS frame-to-frame change in velocity (pixels), dominated by noise rather than motion"""
+    return float(np.sqrt(np.mean(np.sum(np.diff(positions, n=2, axis=0) ** 2, axis=1))))
+
+
+def benchmark_filters(args):
+    """Cursor filters: time per sample, lag added and jitter left on a trace"""
+    from cursor_filters import KalmanFilter, KalmanPredictor, OneEuroFilter
+    from landmark_sources import ReplaySource, SyntheticSource
+
+    print("Cursor filters (per sample):")
+    one_euro = OneEuroFilter()
+    samples = iter(range(1 << 62))
+    report("OneEuroFilter.step", time_call(lambda: one_euro.step(next(samples) / 30, 100.0, 100.0),
+                                           args.iterations))
+    kalman = KalmanFilter()
+    report("KalmanFilter.step", time_call(lambda: kalman.step(next(samples) / 30, 100.0, 100.0),
+                                          args.iterations))
+    predictor = KalmanPredictor()
+    report("KalmanPredictor.step", time_call(lambda: predictor.step(next(samples) / 30, 100.0, 100.0),
+                                             args.iterations))
+
+    # Against the noise-free path for synthetic hands; recorded ones only
+    # have their raw fingertip to compare with
+    if args.session:
+        def source():
+            return ReplaySource(args.session)
+        title = args.session
+    else:
+        script = [('point', 20.0)]
+        def source():
+            return SyntheticSource(script, noise=0.003)
+        title = "synthetic pointing, 20 s"
+
+    # Cursor positions are compared with where the finger is when they are
+    # shown, `latency` after capture
+    latency = args.latency
+    print(f"Cursor lag and jitter ({title}, {latency * 1000:.0f} ms pipeline delay):")
+    print(f"  {'filter':<32} {'lag':>8} {'jitter':>10}")
+    filters = [('kalman', 'average + Kalman + blend'), ('one_euro', 'One Euro'),
+               ('predictive', 'Kalman predictor')]
+    if args.chain:
+        filters.append(('custom', ' > '.join(args.chain)))
+    raw = None
+    for name, label in filters:
+        # The simulated delay is all measured, so nothing is predicted beyond it
+        settings = {'cursor_filter': name, 'cursor_filter_chain': args.chain, 'prediction_horizon': 0.0}
+        trace, stages = cursor_trace(settings, source(), latency)
+        if raw is None:
+            raw = trace[:, [0, 3, 4]]
+            reference = raw.copy() if args.session else \
+                cursor_trace({}, SyntheticSource(script, noise=0.0), latency)[0][:, [0, 3, 4]]
+            # Compared at capture time, so the pipeline delay shows up as lag
+            reference[:, 0] -= latency
+            print(f"  {'raw fingertip':<32} {trace_lag(raw, reference) * 1000:6.0f}ms"
+                  f" {trace_jitter(raw[:, 1:]):8.1f}px")
+        print(f"  {label:<32} {trace_lag(trace, reference) * 1000:6.0f}ms {trace_jitter(trace[:, 1:3]):8.1f}px")
+        for stage in stages:
+            print(f"    {stage['stage']:<30} {stage['lag_ms']:6.0f}ms {stage['us_per_sample']:8.1f}us")
+
+
+def output_trace(trace, rate, mode=None):
+    """
+    (M, 3) rows of time, cursor x, y at each tick of a `rate` Hz display
+    for a trace of per-frame cursor moves: held between moves when `mode` is
+    None, else following a CursorPath in that mode.
+    """
+    from cursor_output import CursorPath
+
+    ticks = np.arange(trace[0, 0], trace[-1, 0], 1.0 / rate)
+    if mode is None:
+        rows = np.searchsorted(trace[:, 0], ticks, side='right') - 1
+        return np.column_stack([ticks, trace[rows, 1], trace[rows, 2]])
+
+    path = CursorPath(mode)
+    output = np.empty((len(ticks), 3))
+    row = 0
+    for i, now in enumerate(ticks):
+        while row < len(trace) and trace[row, 0] <= now:
+            path.push(*trace[row, :3])
+            row += 1
+        output[i] = (now,) + tuple(int(value) for value in path.position(now))
+    return output
+
+
+def benchmark_output(args):
+    """Cursor output thread: per-tick cost, and smoothness and lag at the display rate"""
+    from cursor_output import CursorOutput, CursorPath
+    from input_backends import RecordingBackend
+    from landmark_sources import SyntheticSource
+
+    rate = args.rate
+    print("Cursor output (per tick):")
+    output = CursorOutput(RecordingBackend(), CursorPath(), rate)
+    samples = iter(range(1 << 62))
+    def tick():
+        t = next(samples) / rate
+        if int(t * 30) != int((t - 1.0 / rate) * 30):
+            output.push(t, 1000 * t, 500 * t)
+        output.tick(t)
+    report("CursorOutput.tick", time_call(tick, args.iterations))
+
+    # One Euro moves of a 30 FPS synthetic hand, shown on a `rate` Hz display
+    latency = args.latency
+    script = [('point', 20.0)]
+    settings = {'cursor_filter': 'one_euro'}
+    trace = cursor_trace(settings, SyntheticSource(script, noise=0.003), latency)[0]
+    reference = cursor_trace({}, SyntheticSource(script, noise=0.0), latency)[0][:, [0, 3, 4]]
+    reference[:, 0] -= latency
+
+    print(f"Cursor on a {rate} Hz display (synthetic pointing, One Euro, {latency * 1000:.0f} ms pipeline delay):")
+    print(f"  {'output':<32} {'lag':>8} {'judder':>10} {'max step':>10}")
+    for mode, label in ((None, 'every camera frame'), ('interpolate', 'interpolate'),
+                        ('extrapolate', 'extrapolate')):
+        shown = output_trace(trace, rate, mode)
+        steps = np.hypot(*np.diff(shown[:, 1:], axis=0).T)
+        print(f"  {label:<32} {trace_lag(shown, reference) * 1000:6.0f}ms"
+              f" {trace_jitter(shown[:, 1:]):8.1f}px {steps.max():8.0f}px")
+
+
+def benchmark_input(args):
+    """Input backends: time to inject each kind of event"""
+    from input_backends import create_input_backend
+
+    # Real backends really move the cursor: keep it in a small square around
+    # where it is and inject events that do nothing (a Shift press)
+    backend = create_input_backend(args.backend)
+    width, height = backend.size()
+    positions = iter(range(1 << 62))
+    def move():
+        offset = next(positions) % 16
+        backend.moveTo(width // 2 + offset, height // 2 + offset)
+    def key():
+        backend.keyDown('shift')
+        backend.keyUp('shift')
+
+    print(f"Input backend {backend.name} (per event):")
+    report("moveTo", time_call(move, args.iterations))
+    report("keyDown + keyUp (2 events)", time_call(key, args.iterations))
+    for event, timing in backend.stats().items():
+        report(f"{event} (measured by the backend)", timing['us_per_event'] * 1e-6)
+    backend.close()
+
+
+def read_video_frames(source, count):
+    """Up to `count` mirrored RGB frames from a video file or camera index"""
+    import cv2
+
+    cap = cv2.VideoCapture(int(source) if source.isdigit() else source)
+    frames = []
+    while len(frames) < count:
+        ret, frame = cap.read()
+        if not ret:
+            break
+        frames.append(cv2.flip(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB), 1))
+    cap.release()
+    return frames
+
+
+def benchmark_roi(args):
+    """Hand inference per frame: full frames (MediaPipe's own tracking) vs ROI crops"""
+    try:
+        import mediapipe  # noqa: F401
+    except ImportError:
+        print("ROI tracking: mediapipe not installed, skipping")
+        return
+    from controller import HandGestureController
+    from input_backends import RecordingBackend
+
+    frames = read_video_frames(args.video, args.iterations)
+    if not frames:
+        print(f"ROI tracking: no frames could be read from {args.video!r}")
+        return
+
+    print(f"Hand inference ({len(frames)} frames of {args.video}):")
+    for name, roi_tracking in (("full frame", False), ("ROI crop", True)):
+        controller = HandGestureController({'roi_tracking': roi_tracking}, mouse=RecordingBackend())
+        found = 0
+        start_time = time.perf_counter()
+        for frame in frames:
+            found += bool(controller.detect_hands(frame).multi_hand_landmarks)
+        seconds = (time.perf_counter() - start_time) / len(frames)
+        stats = controller.inference_stats()
+        controller.close()
+        report(name, seconds)
+        print(f"    hand in {found}/{len(frames)} frames, {stats['roi_full_frames']} full-frame fallbacks")
+
+
+def benchmark_gestures(args):
+    """Gesture classification and cursor control fed by a synthetic landmark source"""
+    from landmark_sources import SyntheticSource, drive, headless_controller
+
+    frames = max(args.iterations, 1000)
+    stats = drive(headless_controller(), SyntheticSource(loop=True), limit=frames)
+
+    print(f"Gesture and cursor path ({frames} synthetic frames):")
+    report("get_gesture + control_mouse", stats['seconds'] / stats['samples'])
+    print(f"  {'throughput':<32} {stats['samples_per_second']:10.0f} frames/s")
+
+
+BENCHMARKS = {
+    'batch': benchmark_batch,
+    'features': benchmark_features,
+    'filters': benchmark_filters,
+    'gestures': benchmark_gestures,
+    'input': benchmark_input,
+    'model': benchmark_model,
+    'output': benchmark_output,
+    'render': benchmark_render,
+    'roi': benchmark_roi,
+}
+
+def main():
+    parser = argparse.ArgumentParser(description="NoMouse micro-benchmarks")
+    parser.add_argument('benchmark', choices=sorted(BENCHMARKS) + ['all'])
+    parser.add_argument('-n', '--iterations', type=int, default=1000)
+    parser.add_argument('--session', help="Recorded .npz session for the filters benchmark")
+    parser.add_argument('--chain', nargs='+', metavar='STAGE',
+                        help="Also run the filters benchmark with this chain of cursor filter stages")
+    parser.add_argument('--latency', type=float, default=0.05,
+                        help="Simulated capture-to-cursor delay (seconds) for the filters and output benchmarks")
+    parser.add_argument('--rate', type=int, default=120,
+                        help="Display refresh rate (Hz) for the output benchmark")
+    parser.add_argument('--backend', default='recording',
+                        help="Input backend for the input benchmark (auto, xtest, pyautogui or recording)")
+    parser.add_argument('--video', default='0',
+                        help="Video file or camera index with a hand in view for the roi benchmark")
+    args = parser.parse_args()
+
+    names = sorted(BENCHMARKS) if args.benchmark == 'all' else [args.benchmark]
+    for name in names:
+        BENCHMARKS[name](args)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,280 @@
+import threading
+import time
+
+import cv2
+import numpy as np
+
+class CapturedFrame:
+    """A mirrored RGB camera frame together with its capture metadata"""
+    __slots__ = ('image', 'index', 'timestamp')
+
+    def __init__(self, image, index, timestamp):
+        self.image = image
+        self.index = index          # Monotonically increasing frame number
+        self.timestamp = timestamp  # time.monotonic() right after the read returned
+
+    def age(self, now=None):
+        """Seconds elapsed since the frame was captured"""
+        return (now if now is not None else time.monotonic()) - self.timestamp
+
+
+class LatestFrameSlot:
+    """
+    Single-slot buffer holding only the newest captured frame.
+
+    The producer overwrites the slot on every frame; consumers always get the
+    newest frame and never see a frame older than one they already took.
+    Frames overwritten before anyone took them are counted as dropped, frames
+    that were older than `stale_after` seconds when taken are counted as stale.
+    """
+    def __init__(self, stale_after=0.1):
+        self.stale_after = stale_after
+        self._condition = threading.Condition()
+        self._frame = None
+        self._taken = True
+        self.closed = False
+
+        # Statistics
+        self.published = 0
+        self.consumed = 0
+        self.dropped = 0
+        self.stale = 0
+
+    def put(self, frame):
+        """Publish a new frame, replacing whatever is in the slot"""
+        with self._condition:
+            if not self._taken:
+                self.dropped += 1
+            self._frame = frame
+            self._taken = False
+            self.published += 1
+            self._condition.notify_all()
+
+    def get(self, last_index=-1, timeout=None):
+        """
+        Wait for a frame newer than `last_index` and return it.
+
+        Returns None on timeout or when the slot has been closed.
+        """
+        with self._condition:
+            if not self._condition.wait_for(
+                    lambda: self.closed or (self._frame is not None and self._frame.index > last_index),
+                    timeout):
+                return None
+            if self._frame is None or self._frame.index <= last_index:
+                return None
+
+            frame = self._frame
+            if not self._taken:
+                self._taken = True
+                self.consumed += 1
+                if frame.age() > self.stale_after:
+                    self.stale += 1
+            return frame
+
+    def close(self):
+        """Wake up all waiting consumers and refuse to block any further"""
+        with self._condition:
+            self.closed = True
+            self._condition.notify_all()
+
+    def stats(self):
+        """Get frame counters"""
+        with self._condition:
+            return {
+                'published': self.published,
+                'consumed': self.consumed,
+                'dropped': self.dropped,
+                'stale': self.stale
+            }
+
+
+class FrameBuffer:
+    """Preallocated storage for one frame: the raw camera image and its mirrored RGB version"""
+    __slots__ = ('raw', 'rgb')
+
+    def __init__(self):
+        self.raw = None
+        self.rgb = None
+
+
+class FramePool:
+    """
+    Ring of preallocated frame buffers.
+
+    Each frame is read straight into a raw buffer, converted BGR->RGB once
+    into an RGB buffer and mirrored in place. That single RGB buffer is shared
+    by inference and the preview, so no per-frame arrays are allocated once
+    the ring is warm. The ring must be larger than the number of frames in
+    flight through the pipeline (plus the one the GUI is showing).
+
+    `grab` and `convert` split `read` in two, so frames that are dropped
+    after their timestamp is seen are never converted.
+    """
+    def __init__(self, size=8):
+        self.buffers = [FrameBuffer() for _ in range(size)]
+        self.position = 0
+
+        # Statistics
+        self.frames = 0
+        self.grabbed = 0
+        self.conversions = 0
+        self.flips = 0
+        self.allocations = 0
+        self.bytes_allocated = 0
+        self.bytes_copied = 0
+
+    def _allocate(self, shape):
+        self.allocations += 1
+        self.bytes_allocated += shape[0] * shape[1] * shape[2]
+        return np.empty(shape, dtype=np.uint8)
+
+    def grab(self, cap):
+        """
+        Read the next camera frame into the current buffer, or return None.
+
+        The buffer only moves on in `convert`, so a frame that is never
+        converted is overwritten by the next one.
+        """
+        buffer = self.buffers[self.position]
+        ret, image = cap.read(buffer.raw)
+        if not ret:
+            return None
+        if image is not buffer.raw:
+            # First use of this slot (or the camera changed resolution)
+            self.allocations += 1
+            self.bytes_allocated += image.nbytes
+            buffer.raw = image
+        self.grabbed += 1
+        return buffer
+
+    def convert(self, buffer):
+        """Mirrored RGB version of a grabbed frame, in the buffer's own RGB array"""
+        self.position = (self.position + 1) % len(self.buffers)
+        if buffer.rgb is None or buffer.rgb.shape != buffer.raw.shape:
+            buffer.rgb = self._allocate(buffer.raw.shape)
+
+        # One color conversion and one in-place flip per frame
+        cv2.cvtColor(buffer.raw, cv2.COLOR_BGR2RGB, dst=buffer.rgb)
+        self.conversions += 1
+        cv2.flip(buffer.rgb, 1, dst=buffer.rgb)
+        self.flips += 1
+        self.bytes_copied += 2 * buffer.rgb.nbytes
+        self.frames += 1
+        return buffer.rgb
+
+    def read(self, cap):
+        """Read the next camera frame and return it as a mirrored RGB array"""
+        buffer = self.grab(cap)
+        if buffer is None:
+            return False, None
+        return True, self.convert(buffer)
+
+    def stats(self):
+        return {
+            'allocations': self.allocations,
+            'bytes_allocated': self.bytes_allocated,
+            'bytes_copied_per_frame': self.bytes_copied / self.frames if self.frames else 0,
+            'skipped_conversions': self.grabbed - self.frames
+        }
+
+
+class FrameClock:
+    """
+    Paces capture from frame timestamps instead of a fixed sleep.
+
+    A camera whose read() blocks until the next frame already paces the loop,
+    so the clock never sleeps for it; frames arriving faster than the target
+    rate are decimated instead. Only sources whose read() returns immediately
+    (files, some virtual cameras) are slept until the next frame is due.
+    The time between frames is measured, not assumed.
+    """
+    def __init__(self, target_fps=30):
+        self.target_interval = 1.0 / target_fps if target_fps else 0.0
+        self.last_read = None
+        self.last_published = None
+        self.interval = self.target_interval   # Smoothed time between reads
+        self.jitter = 0.0                      # Smoothed deviation from that interval
+        self.read_duration = None              # Smoothed time spent blocked in read(), from the first read
+
+    def record_read(self, read_start, timestamp):
+        """Account for one read that started at `read_start` and returned at `timestamp`"""
+        duration = timestamp - read_start
+        if self.read_duration is None:
+            self.read_duration = duration
+        else:
+            self.read_duration += 0.1 * (duration - self.read_duration)
+        if self.last_read is not None:
+            interval = timestamp - self.last_read
+            self.jitter += 0.1 * (abs(interval - self.interval) - self.jitter)
+            self.interval += 0.1 * (interval - self.interval)
+        self.last_read = timestamp
+
+    def should_publish(self, timestamp):
+        """Decimate frames that arrive faster than the target rate"""
+        # Small tolerance so a camera running exactly at the target rate never loses frames
+        if self.last_published is not None and \
+                timestamp - self.last_published < 0.75 * self.target_interval:
+            return False
+        self.last_published = timestamp
+        return True
+
+    def wait_time(self, now):
+        """Seconds to wait before the next read; zero whenever read() blocks by itself"""
+        if self.last_published is None or self.read_duration is None or \
+                self.read_duration > 0.25 * self.target_interval:
+            return 0.0
+        return max(0.0, self.last_published + self.target_interval - now)
+
+    def stats(self):
+        return {
+            'interval_ms': 1000 * self.interval,
+            'jitter_ms': 1000 * self.jitter,
+            'measured_fps': 1.0 / self.interval if self.interval else 0.0
+        }
+
+
+class FrameGrabber(threading.Thread):
+    """
+    Dedicated capture thread that reads the camera as fast as it delivers
+    frames and publishes each one into a LatestFrameSlot.
+
+    Keeping the driver drained means a slow consumer only ever skips frames,
+    it never falls behind on a queue of old ones.
+    """
+    def __init__(self, cap, slot=None, target_fps=30, pool=None):
+        super().__init__(name='FrameGrabber', daemon=True)
+        self.cap = cap
+        self.slot = slot or LatestFrameSlot()
+        self.pool = pool or FramePool()
+        self.clock = FrameClock(target_fps)
+        self.running = True
+        self.failed = False
+        self.frame_index = 0
+
+    def run(self):
+        while self.running:
+            read_start = time.monotonic()
+            buffer = self.pool.grab(self.cap)
+            if buffer is None:
+                self.failed = True
+                break
+
+            timestamp = time.monotonic()
+            self.clock.record_read(read_start, timestamp)
+            # Decimated frames are dropped before being converted
+            if self.clock.should_publish(timestamp):
+                image = self.pool.convert(buffer)
+                self.slot.put(CapturedFrame(image, self.frame_index, timestamp))
+                self.frame_index += 1
+
+            # Only sleeps for sources that don't block in read()
+            wait_time = self.clock.wait_time(time.monotonic())
+            if wait_time > 0:
+                time.sleep(wait_time)
+
+        self.slot.close()
+
+    def stop(self):
+        self.running = False
+        self.join(timeout=1.0)
@@ -1,49 +1,70 @@
 import cv2
-import mediapipe as mp
-import pyautogui
 import numpy as np
+import os
 import time
-import math
+import sys
 from collections import deque
 
-class KalmanFilter:
-    """
-    A simple Kalman filter for smoothing cursor movement
-    """
-    def __init__(self, process_variance=0.001, measurement_variance=0.1):
-        self.process_variance = process_variance
-        self.measurement_variance = measurement_variance
-        self.posteri_estimate = np.array([0.0, 0.0])
-        self.posteri_error_estimate = np.array([1.0, 1.0])
-
-    def update(self, measurement):
-        # Prediction update
-        priori_estimate = self.posteri_estimate
-        priori_error_estimate = self.posteri_error_estimate + self.process_variance
-
-        # Measurement update
-        blending_factor = priori_error_estimate / (priori_error_estimate + self.measurement_variance)
-        self.posteri_estimate = priori_estimate + blending_factor * (measurement - priori_estimate)
-        self.posteri_error_estimate = (1 - blending_factor) * priori_error_estimate
-
-        return self.posteri_estimate
+import utils
+
+import gesture_features
+from cursor_filters import SETTINGS_KEYS as FILTER_SETTINGS, FilterChain
+from cursor_output import CursorOutput, CursorPath
+from gesture_engine import GestureEngine, GestureSpec
+from gesture_temporal import TemporalRecognizer
+from hand_renderer import HandRenderer
+from input_backends import create_input_backend
+from inference_scheduler import AdaptiveInferenceScheduler
+from landmarks import NUM_LANDMARKS, HandResults, landmarks_to_array, results_from_array
+from overlay import SpriteCache, composite, render_text_sprite
+from presence import PresenceMonitor
+from roi import RoiTracker
+
+# Gesture guide shown in the bottom left of the preview (see CONTROL.md)
+GESTURE_GUIDE = [
+    "👆 Point: Move cursor",
+    "👌 Index+Thumb: Left-click",
+    "👌 Middle+Thumb: Right-click",
+    "✌️ Two fingers: Scroll",
+    "✊ Pinch & hold: Drag"
+]
+
+# Discrete gestures, evaluated by GestureEngine in this order (earlier wins
+# within a group). Actions name HandGestureController methods.
+GESTURES = (
+    # Pinch (index+thumb) while pointing: hold the button until the pinch opens
+    GestureSpec('drag', enter='drag_gesture', keep='index_thumb_pinch', group='pinch',
+                on_fire='start_drag', on_exit='end_drag'),
+    # Pinch index+thumb briefly: left click
+    GestureSpec('left_click', enter='index_thumb_pinch', hold=0.2, group='pinch',
+                on_enter='begin_left_click', on_fire='left_click'),
+    # Pinch middle+thumb briefly: right click
+    GestureSpec('right_click', enter='middle_thumb_pinch', hold=0.2, group='pinch',
+                on_enter='begin_right_click', on_fire='right_click'),
+    # V shape moving up and down: scroll
+    GestureSpec('scroll', enter='v_shape', group='two_finger',
+                on_fire='start_scroll', on_hold='scroll'),
+    # Index+middle held together: double click
+    GestureSpec('double_click', enter='double_click_gesture', hold=0.3, group='two_finger',
+                on_fire='double_click'),
+)
+
+# Browser back and forward, sent by open-hand swipes
+if sys.platform == 'darwin':
+    BACK_KEYS, FORWARD_KEYS = ('command', '['), ('command', ']')
+else:
+    BACK_KEYS, FORWARD_KEYS = ('alt', 'left'), ('alt', 'right')
 
 class HandGestureController:
-    def __init__(self, settings=None):
-        self.mp_hands = mp.solutions.hands
-        self.hands = self.mp_hands.Hands(
-            static_image_mode=False,
-            max_num_hands=1,
-            min_detection_confidence=0.7,
-            min_tracking_confidence=0.7
-        )
-        self.mp_draw = mp.solutions.drawing_utils
-        self.mp_drawing_styles = mp.solutions.drawing_styles
-
-        # Screen dimensions
-        self.screen_width, self.screen_height = pyautogui.size()
-        self.prev_x, self.prev_y = self.screen_width // 2, self.screen_height // 2
-        pyautogui.FAILSAFE = False
+    def __init__(self, settings=None, hands=None, mouse=None, clock=None):
+        """
+        `hands` replaces the MediaPipe detector and `mouse` the input backend
+        (any object with pyautogui's moveTo/click/scroll/... functions), so the
+        gesture and cursor path can run without a camera or a display.
+        `clock` (seconds, time.monotonic by default) times gestures.
+        """
+        self.clock = clock or time.monotonic
+        self.hand_renderer = HandRenderer()
 
         # Default settings
         self.settings = settings or {
@@ -52,52 +73,231 @@ class HandGestureController:
             'dwell_time': 0.8,            # Seconds to hold for a click
             'scroll_sensitivity': 5,      # Scroll speed
             'enabled': True,
-            'pinch_threshold': 0.1        # Distance threshold for pinch detection
+            'pinch_threshold': 0.1,       # Distance threshold for pinch detection
+            'model_complexity': 1,        # 0 = lite, 1 = full hand landmark model
+            'min_detection_confidence': 0.7,
+            'min_tracking_confidence': 0.7,
+            'inference_process': False,   # Run MediaPipe in a separate process
+            'landmark_backend': 'solutions',  # 'solutions' (Hands) or 'tasks' (async HandLandmarker)
+            'hand_landmarker_model': '',  # .task model for the tasks backend (default: assets/)
+            'roi_tracking': False,        # Run inference on a crop around the last hand
+            'roi_padding': 0.25,          # Padding around the hand box, relative to its size
+            'adaptive_inference': False,  # Skip inference on slow hands and extrapolate landmarks
+            'max_skipped_frames': 2,      # Most consecutive frames to extrapolate
+            'presence_detection': False,  # Drop to a cheap motion check when no hand is visible
+            'idle_enter_seconds': 3.0,    # Seconds without a hand before going idle
+            'idle_motion_threshold': 4.0, # Mean gray-level change that wakes up tracking
+            'idle_fps': 5,                # Motion checks per second while idle
+            'gesture_model': False,       # Classify poses with the learned model (gesture_model.py)
+            'gesture_model_path': '',     # Trained model .npz (default: assets/)
+            'gesture_model_confidence': 0.6,  # Less confident predictions count as no gesture
+            'temporal_gestures': False,   # Double pinch, pinch-spread zoom, swipe and flick
+            'double_pinch_window': 0.5,   # Most seconds from the first pinch to the second
+            'zoom_step': 0.03,            # Thumb-index distance change per zoom notch
+            'zoom_range': 0.2,            # Opening past the starting pinch that ends a zoom
+            'swipe_window': 0.4,          # Seconds an open-hand swipe may take
+            'swipe_distance': 0.25,       # Sideways travel that counts as a swipe
+            'flick_window': 0.15,         # Seconds a V-shape flick may take
+            'flick_distance': 0.12,       # Vertical travel that counts as a flick
+            'temporal_cooldown': 0.5,     # Seconds between swipes or flicks
+            'cursor_filter': 'kalman',    # 'kalman' (average + Kalman + blend), 'one_euro', 'predictive' or 'custom'
+            'cursor_filter_chain': [],    # Stages of the 'custom' filter (see cursor_filters.STAGES)
+            'one_euro_min_cutoff': 1.0,   # One Euro cutoff (Hz) for a still hand: lower = less jitter
+            'one_euro_beta': 0.007,       # Cutoff increase per pixel/s: higher = less lag when moving fast
+            'one_euro_d_cutoff': 1.0,     # Cutoff (Hz) of the speed estimate
+            'prediction_horizon': 0.03,   # Seconds predicted beyond the measured pipeline delay
+            'prediction_max_offset': 80,  # Most pixels the prediction may lead the filtered position
+            'cursor_output_rate': 0,      # Cursor moves per second from a separate thread (0 = once per frame)
+            'cursor_output_mode': 'interpolate',  # 'interpolate' (one frame behind) or 'extrapolate'
+            'input_backend': 'auto'       # 'auto', 'xtest' (Linux/X11) or 'pyautogui' (see input_backends)
         }
 
+        # Mouse and keyboard output, created lazily so headless runs don't need a display
+        # (input_backend is only followed when no `mouse` was given)
+        self.input_backend = None if mouse is not None else self.settings.get('input_backend', 'auto')
+        self.mouse = mouse if mouse is not None else create_input_backend(self.input_backend)
+
+        # Screen dimensions
+        self.screen_width, self.screen_height = self.mouse.size()
+        self.prev_x, self.prev_y = self.screen_width // 2, self.screen_height // 2
+
+        # Hand landmark detector
+        self.hands = hands if hands is not None else self.create_hands()
+        # ROI crops get a detector of their own, created on first use: MediaPipe
+        # tracks the hand between calls in input coordinates, which would jump
+        # whenever one detector alternated between crops and full frames
+        self.roi_hands = None
+        self.results_timestamp = None   # Capture time of the frame the last results belong to
+        self.roi_tracker = RoiTracker(padding=self.settings.get('roi_padding', 0.25))
+        self.inference_scheduler = AdaptiveInferenceScheduler(
+            max_skip=self.settings.get('max_skipped_frames', 2))
+        self._observed_landmarks = np.zeros((NUM_LANDMARKS, 3), dtype=np.float32)
+        self.presence_monitor = PresenceMonitor(
+            enter_seconds=self.settings.get('idle_enter_seconds', 3.0),
+            motion_threshold=self.settings.get('idle_motion_threshold', 4.0),
+            idle_fps=self.settings.get('idle_fps', 5))
+
         # Advanced cursor control
-        self.kalman_filter = KalmanFilter()
+        self.cursor_filter = self.create_cursor_filter()
+        self.cursor_output = None   # CursorOutput thread while started and cursor_output_rate is set
+        self.cursor_output_started = False
         self.position_history = deque(maxlen=10)  # Store recent positions for trend analysis
         for _ in range(10):
             self.position_history.append((self.prev_x, self.prev_y))
 
         # Gesture state tracking
+        self.gesture_engine = GestureEngine(GESTURES, self, clock=self.clock)
+        self.temporal_recognizer = TemporalRecognizer(self, self.settings)
         self.hover_start_time = 0
         self.hover_position = None
         self.is_hovering = False
         self.prev_hand_y = 0
         self.scroll_cooldown = 0
-        self.pinch_active = False
-        self.pinch_start_time = 0
 
         # For gesture visualization
+        # Static HUD text is rendered once; dynamic text is cached per value
+        self.overlay = SpriteCache()
+        self.guide_sprite = render_text_sprite(GESTURE_GUIDE, 0.5, (255, 255, 255), 1, line_spacing=30)
         self.last_gesture = None
         self.gesture_time = 0
-        self.gesture_color = (0, 255, 0)  # Default green
+        self.gesture_color = (0, 255, 0)  # Default green (RGB)
 
         # Finger tracking
         self.index_finger_tip = None
         self.middle_finger_tip = None
         self.thumb_tip = None
-        self.index_finger_history = deque(maxlen=15)  # For smoother tracking
+        self._gesture_points = np.zeros((NUM_LANDMARKS, 3), dtype=np.float32)
+        self.gesture_model = None
+        self.load_gesture_model()
+
+    def create_hands(self):
+        """Create the hand landmark detector selected in settings"""
+        hands_options = dict(
+            static_image_mode=False,
+            max_num_hands=1,
+            model_complexity=self.settings.get('model_complexity', 1),
+            min_detection_confidence=self.settings.get('min_detection_confidence', 0.7),
+            min_tracking_confidence=self.settings.get('min_tracking_confidence', 0.7)
+        )
+        if self.settings.get('landmark_backend', 'solutions') == 'tasks':
+            model_path = self.settings.get('hand_landmarker_model') or \
+                utils.resource_path('assets/hand_landmarker.task')
+            if os.path.exists(model_path):
+                from landmark_backends import TasksHandLandmarker
+                return TasksHandLandmarker(model_path, **hands_options)
+            print(f"Hand landmarker model not found at {model_path}, using MediaPipe Hands")
+        if self.settings.get('inference_process', False):
+            # Imported lazily so the default path doesn't pull in multiprocessing
+            from inference_process import ProcessLandmarker
+            return ProcessLandmarker(**hands_options)
+        import mediapipe as mp
+        return mp.solutions.hands.Hands(**hands_options)
+
+    def create_cursor_filter(self):
+        """Build the cursor filter chain selected in settings, remembering the settings it used"""
+        self.cursor_filter_settings = [self.settings.get(key) for key in FILTER_SETTINGS]
+        try:
+            return FilterChain.from_settings(self.settings)
+        except (ValueError, TypeError) as e:
+            print(f"Error in cursor filter settings ({e}), using the default filter")
+            return FilterChain.from_settings({})
+
+    def load_gesture_model(self):
+        """Load the learned gesture classifier when enabled in settings"""
+        self.gesture_model = None
+        if not self.settings.get('gesture_model', False):
+            return
+        model_path = self.settings.get('gesture_model_path') or \
+            utils.resource_path('assets/gesture_model.npz')
+        if not os.path.exists(model_path):
+            print(f"Gesture model not found at {model_path}, using the gesture rules")
+            return
+        try:
+            from gesture_model import GestureModel
+            self.gesture_model = GestureModel.load(
+                model_path, min_confidence=self.settings.get('gesture_model_confidence', 0.6))
+        except Exception as e:
+            print(f"Error loading gesture model: {e}")
+
+    def process_frame(self, frame, timestamp=None):
+        """Detect hands in a mirrored RGB frame"""
+        if timestamp is None:
+            timestamp = time.monotonic()
+        # Asynchronous backends replace this with the capture time of an earlier frame
+        self.results_timestamp = timestamp
+
+        # Low-power presence mode: with nobody in view only a cheap motion check runs
+        if self.settings.get('presence_detection', False):
+            if not self.presence_monitor.should_track(frame, timestamp):
+                return HandResults()
+            results = self.track_hands(frame, timestamp)
+            self.presence_monitor.update(bool(results.multi_hand_landmarks), timestamp)
+            return results
+
+        return self.track_hands(frame, timestamp)
+
+    def track_hands(self, frame, timestamp):
+        """Detect hands, extrapolating instead when adaptive inference allows"""
+        if not self.settings.get('adaptive_inference', False):
+            return self.detect_hands(frame, timestamp)
+
+        # Adaptive mode: skip inference while the hand moves slowly and
+        # extrapolate its landmarks, so gestures still get input every frame
+        scheduler = self.inference_scheduler
+        if not scheduler.should_infer(timestamp):
+            return results_from_array(scheduler.extrapolator.predict(timestamp)[np.newaxis])
+
+        start_time = time.perf_counter()
+        results = self.detect_hands(frame, timestamp)
+        scheduler.record_inference(time.perf_counter() - start_time)
+
+        if results.multi_hand_landmarks:
+            scheduler.extrapolator.observe(
+                landmarks_to_array(results.multi_hand_landmarks[0], self._observed_landmarks),
+                self.results_timestamp)
+        else:
+            scheduler.reset()
+        return results
 
-    def process_frame(self, frame):
-        # Convert BGR to RGB
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        # Process the frame and detect hands
-        results = self.hands.process(rgb_frame)
+    def detect_hands(self, rgb_frame, timestamp=None):
+        """Run hand landmark inference on an RGB frame captured at `timestamp`"""
+        # Asynchronous backends return results for an earlier frame, which
+        # can't be mapped back through the current crop
+        if getattr(self.hands, 'asynchronous', False):
+            results = self.hands.process(rgb_frame, timestamp)
+            if self.hands.results_timestamp is not None:
+                self.results_timestamp = self.hands.results_timestamp
+            return results
+        if not self.settings.get('roi_tracking', False):
+            # Process the whole frame and detect hands
+            return self.hands.process(rgb_frame)
+
+        # Tracking mode: run inference only on the region around the last hand
+        results = None
+        if self.roi_tracker.roi is not None:
+            if self.roi_hands is None:
+                self.roi_hands = self.create_hands()
+            results = self.roi_hands.process(self.roi_tracker.crop(rgb_frame))
+            if results.multi_hand_landmarks:
+                self.roi_tracker.map_to_frame(results, rgb_frame.shape)
+                self.roi_tracker.tracked_frames += 1
+            else:
+                results = None
+
+        # Tracking lost (or never started): fall back to full-frame detection
+        if results is None:
+            results = self.hands.process(rgb_frame)
+            self.roi_tracker.full_frames += 1
+
+        self.roi_tracker.update(results, rgb_frame.shape)
         return results
 
     def draw_landmarks(self, frame, results):
+        """Draw landmarks and gesture feedback on a mirrored RGB frame"""
         if results.multi_hand_landmarks:
             for hand_landmarks in results.multi_hand_landmarks:
-                # Draw hand landmarks with custom style
-                self.mp_draw.draw_landmarks(
-                    frame,
-                    hand_landmarks,
-                    self.mp_hands.HAND_CONNECTIONS,
-                    self.mp_drawing_styles.get_default_hand_landmarks_style(),
-                    self.mp_drawing_styles.get_default_hand_connections_style())
+                # Draw hand skeleton
+                self.hand_renderer.draw(frame, hand_landmarks)
 
                 # Get frame dimensions
                 frame_height, frame_width = frame.shape[:2]
@@ -110,7 +310,7 @@ class HandGestureController:
                     # Outer glow
                     cv2.circle(frame, (x, y), 14, (255, 255, 255, 150), -1)  # White glow
                     # Inner circle
-                    cv2.circle(frame, (x, y), 10, (0, 165, 255), -1)  # Orange circle
+                    cv2.circle(frame, (x, y), 10, (255, 165, 0), -1)  # Orange circle
                     # White outline
                     cv2.circle(frame, (x, y), 12, (255, 255, 255), 2)
 
@@ -118,7 +318,7 @@ class HandGestureController:
                 if self.is_hovering and self.hover_position:
                     hover_x, hover_y = int(self.hover_position[0] * frame_width), int(self.hover_position[1] * frame_height)
                     # Calculate progress for hover animation
-                    hover_progress = min(1.0, (time.time() - self.hover_start_time) / self.settings.get('dwell_time', 0.8))
+                    hover_progress = min(1.0, (self.clock() - self.hover_start_time) / self.settings.get('dwell_time', 0.8))
                     radius = 18
                     thickness = 3
 
@@ -134,389 +334,252 @@ class HandGestureController:
 
                     # Add click text when almost complete
                     if hover_progress > 0.7:
-                        click_text = "CLICK"
-                        text_size = cv2.getTextSize(click_text, cv2.FONT_HERSHEY_SIMPLEX, 0.5, 1)[0]
-                        text_x = hover_x - text_size[0] // 2
-                        text_y = hover_y + radius + 20
-
-                        # Draw text with shadow
-                        cv2.putText(frame, click_text, (text_x+1, text_y+1),
-                                    cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 0, 0), 1)  # Shadow
-                        cv2.putText(frame, click_text, (text_x, text_y),
-                                    cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 1)
+                        sprite = self.overlay.get("CLICK", 0.5, (0, 255, 0), 1, shadow=True)
+                        composite(frame, sprite, hover_x - sprite.size[0] // 2 + sprite.origin[0],
+                                  hover_y + radius + 20)
 
                 # Draw pinch visualization
-                if hasattr(self, 'pinch_active') and self.pinch_active and self.thumb_tip and self.index_finger_tip:
+                pinch_start_time = self.gesture_engine.started('left_click')
+                if pinch_start_time is not None and self.thumb_tip and self.index_finger_tip:
                     thumb_x, thumb_y = int(self.thumb_tip[0] * frame_width), int(self.thumb_tip[1] * frame_height)
                     index_x, index_y = int(self.index_finger_tip[0] * frame_width), int(self.index_finger_tip[1] * frame_height)
 
                     # Draw line between thumb and index
-                    cv2.line(frame, (thumb_x, thumb_y), (index_x, index_y), (0, 165, 255), 2)
+                    cv2.line(frame, (thumb_x, thumb_y), (index_x, index_y), (255, 165, 0), 2)
 
                     # Draw pinch progress
-                    if hasattr(self, 'pinch_start_time'):
-                        pinch_progress = min(1.0, (time.time() - self.pinch_start_time) / 0.3)
-                        mid_x, mid_y = (thumb_x + index_x) // 2, (thumb_y + index_y) // 2
+                    pinch_progress = min(1.0, (self.clock() - pinch_start_time) / 0.3)
+                    mid_x, mid_y = (thumb_x + index_x) // 2, (thumb_y + index_y) // 2
 
-                        # Draw progress circle
-                        radius = 10
-                        cv2.circle(frame, (mid_x, mid_y), radius, (255, 255, 255), 2)
-                        cv2.circle(frame, (mid_x, mid_y), int(radius * pinch_progress), (0, 165, 255), -1)
+                    # Draw progress circle
+                    radius = 10
+                    cv2.circle(frame, (mid_x, mid_y), radius, (255, 255, 255), 2)
+                    cv2.circle(frame, (mid_x, mid_y), int(radius * pinch_progress), (255, 165, 0), -1)
 
                 # Draw drag visualization
-                if hasattr(self, 'drag_active') and self.drag_active:
-                    # Draw drag indicator
-                    drag_text = "DRAGGING"
-                    text_size = cv2.getTextSize(drag_text, cv2.FONT_HERSHEY_SIMPLEX, 0.6, 2)[0]
-                    text_x = frame_width - text_size[0] - 20
-                    text_y = 80
-
-                    # Draw background
-                    cv2.rectangle(frame,
-                                 (text_x - 10, text_y - 25),
-                                 (text_x + text_size[0] + 10, text_y + 5),
-                                 (0, 0, 0, 150), -1)
-
-                    # Draw text
-                    cv2.putText(frame, drag_text, (text_x, text_y),
-                                cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 0, 0), 2)
+                if self.gesture_engine.is_active('drag'):
+                    # Draw drag indicator, right-aligned below the gesture banner
+                    sprite = self.overlay.get("DRAGGING", 0.6, (0, 0, 255), 2, background=(0, 0, 0))
+                    composite(frame, sprite, frame_width - 10 - sprite.size[0] + sprite.origin[0], 80)
 
                 # Add gesture visualization
-                if self.last_gesture and time.time() - self.gesture_time < 1.5:
-                    gesture_text = f"{self.last_gesture}"
-                    text_size = cv2.getTextSize(gesture_text, cv2.FONT_HERSHEY_SIMPLEX, 0.8, 2)[0]
-                    text_x = frame_width - text_size[0] - 20
-                    text_y = 40
-
-                    # Draw background with rounded corners
-                    cv2.rectangle(frame,
-                                 (text_x - 10, text_y - 30),
-                                 (text_x + text_size[0] + 10, text_y + 10),
-                                 (0, 0, 0, 180), -1)
-
-                    # Draw text with shadow for better visibility
-                    cv2.putText(frame, gesture_text, (text_x+1, text_y+1),
-                                cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 0, 0), 2)  # Shadow
-                    cv2.putText(frame, gesture_text, (text_x, text_y),
-                                cv2.FONT_HERSHEY_SIMPLEX, 0.8, self.gesture_color, 2)
+                if self.last_gesture and self.clock() - self.gesture_time < 1.5:
+                    # Text with shadow on a dark background, right-aligned
+                    sprite = self.overlay.get(f"{self.last_gesture}", 0.8, self.gesture_color, 2,
+                                              shadow=True, background=(0, 0, 0))
+                    composite(frame, sprite, frame_width - 10 - sprite.size[0] + sprite.origin[0], 40)
 
                 # Add gesture guide in the bottom left based on CONTROL.md
                 if self.settings.get('show_gestures', True):
-                    guide_x, guide_y = 20, frame_height - 20
-                    cv2.putText(frame, "👆 Point: Move cursor", (guide_x, guide_y - 120),
-                                cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
-                    cv2.putText(frame, "👌 Index+Thumb: Left-click", (guide_x, guide_y - 90),
-                                cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
-                    cv2.putText(frame, "👌 Middle+Thumb: Right-click", (guide_x, guide_y - 60),
-                                cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
-                    cv2.putText(frame, "✌️ Two fingers: Scroll", (guide_x, guide_y - 30),
-                                cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
-                    cv2.putText(frame, "✊ Pinch & hold: Drag", (guide_x, guide_y),
-                                cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
+                    composite(frame, self.guide_sprite, 20, frame_height - 20 - 120)
 
     def get_gesture(self, hand_landmarks):
         """Detect hand gestures and track finger positions based on CONTROL.md recommendations"""
-        # Store all finger positions and joints
-        self.wrist = (hand_landmarks.landmark[0].x, hand_landmarks.landmark[0].y)
-
-        # Thumb landmarks
-        self.thumb_cmc = (hand_landmarks.landmark[1].x, hand_landmarks.landmark[1].y)
-        self.thumb_mcp = (hand_landmarks.landmark[2].x, hand_landmarks.landmark[2].y)
-        self.thumb_ip = (hand_landmarks.landmark[3].x, hand_landmarks.landmark[3].y)
-        self.thumb_tip = (hand_landmarks.landmark[4].x, hand_landmarks.landmark[4].y)
-
-        # Index finger landmarks
-        self.index_mcp = (hand_landmarks.landmark[5].x, hand_landmarks.landmark[5].y)
-        self.index_pip = (hand_landmarks.landmark[6].x, hand_landmarks.landmark[6].y)
-        self.index_dip = (hand_landmarks.landmark[7].x, hand_landmarks.landmark[7].y)
-        self.index_finger_tip = (hand_landmarks.landmark[8].x, hand_landmarks.landmark[8].y)
-
-        # Middle finger landmarks
-        self.middle_mcp = (hand_landmarks.landmark[9].x, hand_landmarks.landmark[9].y)
-        self.middle_pip = (hand_landmarks.landmark[10].x, hand_landmarks.landmark[10].y)
-        self.middle_dip = (hand_landmarks.landmark[11].x, hand_landmarks.landmark[11].y)
-        self.middle_finger_tip = (hand_landmarks.landmark[12].x, hand_landmarks.landmark[12].y)
-
-        # Ring finger landmarks
-        self.ring_mcp = (hand_landmarks.landmark[13].x, hand_landmarks.landmark[13].y)
-        self.ring_pip = (hand_landmarks.landmark[14].x, hand_landmarks.landmark[14].y)
-        self.ring_dip = (hand_landmarks.landmark[15].x, hand_landmarks.landmark[15].y)
-        self.ring_finger_tip = (hand_landmarks.landmark[16].x, hand_landmarks.landmark[16].y)
-
-        # Pinky finger landmarks
-        self.pinky_mcp = (hand_landmarks.landmark[17].x, hand_landmarks.landmark[17].y)
-        self.pinky_pip = (hand_landmarks.landmark[18].x, hand_landmarks.landmark[18].y)
-        self.pinky_dip = (hand_landmarks.landmark[19].x, hand_landmarks.landmark[19].y)
-        self.pinky_finger_tip = (hand_landmarks.landmark[20].x, hand_landmarks.landmark[20].y)
-
-        # Add index finger position to history for smoothing
-        self.index_finger_history.append(self.index_finger_tip)
-
-        # Calculate average position from history (smoothing)
-        avg_x = sum(p[0] for p in self.index_finger_history) / len(self.index_finger_history)
-        avg_y = sum(p[1] for p in self.index_finger_history) / len(self.index_finger_history)
-        smooth_index_tip = (avg_x, avg_y)
-
-        # Calculate hand orientation and pose
-        hand_direction_x = self.index_mcp[0] - self.wrist[0]
-        hand_direction_y = self.index_mcp[1] - self.wrist[1]
-        hand_facing_camera = hand_direction_y < 0  # Hand is facing camera if index MCP is above wrist
-
-        # Detect finger states (extended or not)
-        # A finger is extended if its tip is significantly above its PIP joint
-        extension_threshold = 0.05  # Threshold for determining if a finger is extended
-
-        thumb_extended = self.thumb_tip[1] < self.thumb_ip[1] - extension_threshold
-        index_extended = self.index_finger_tip[1] < self.index_pip[1] - extension_threshold
-        middle_extended = self.middle_finger_tip[1] < self.middle_pip[1] - extension_threshold
-        ring_extended = self.ring_finger_tip[1] < self.ring_pip[1] - extension_threshold
-        pinky_extended = self.pinky_finger_tip[1] < self.pinky_pip[1] - extension_threshold
-
-        # Count extended fingers
-        extended_fingers = sum([thumb_extended, index_extended, middle_extended, ring_extended, pinky_extended])
-
-        # === GESTURE DETECTION BASED ON CONTROL.md ===
-
-        # 1. CURSOR MOVEMENT: Point with index finger (hand relaxed)
-        # "A natural way to move the cursor is by pointing with the index finger"
-        pointing_gesture = index_extended and not middle_extended and not ring_extended and not pinky_extended
-
-        # 2. LEFT CLICK: Pinch index+thumb together (tap)
-        # "Left click: A pinch or tap gesture. For example, touching the tips of thumb and index finger together"
-        index_thumb_distance = self.calculate_distance(self.thumb_tip, self.index_finger_tip)
-        pinch_threshold = self.settings.get('pinch_threshold', 0.1)
-        index_thumb_pinch = index_thumb_distance < pinch_threshold
-
-        # 3. RIGHT CLICK: Pinch middle+thumb together
-        # "Right click: Another pinch combination... HandMouse uses thumb+middle pinch"
-        middle_thumb_distance = self.calculate_distance(self.thumb_tip, self.middle_finger_tip)
-        middle_thumb_pinch = middle_thumb_distance < pinch_threshold
-
-        # 4. DRAG & DROP: Pinch-and-hold + move
-        # "Drag & Drop: 'Click-and-hold' with pinch. Users pinch (index+thumb) and hold while moving"
-        drag_gesture = index_thumb_pinch and pointing_gesture
-
-        # 5. SCROLLING: Two-finger swipe (index+middle extended)
-        # "Scrolling: A swipe or pinch-scroll gesture... raising two fingers (index+middle) like a 'two-finger swipe'"
-        two_finger_gesture = index_extended and middle_extended and not ring_extended and not pinky_extended
-
-        # Calculate angle between index and middle finger for V shape detection
-        finger_angle = self.calculate_angle(self.index_finger_tip, self.middle_mcp, self.middle_finger_tip)
-        v_shape = two_finger_gesture and finger_angle > 15  # V shape with significant angle
-
-        # 6. DOUBLE CLICK: Quick double pinch or raise index+middle
-        # "Double Click: Quick double pinch or raise index+middle"
-        double_click_gesture = index_extended and middle_extended and not ring_extended and not pinky_extended and finger_angle < 15
-
-        # 7. ZOOM: Pinch together / spread apart
-        # "Zoom: A classic pinch/spread gesture. Bringing thumb and index together"
-        # (This would require tracking pinch distance changes over time)
-
-        # 8. OPEN HAND: All fingers extended
-        open_hand = thumb_extended and index_extended and middle_extended and ring_extended and pinky_extended
-
-        # Return comprehensive gesture state
-        return {
-            'smooth_index_tip': smooth_index_tip,
-            'pointing_gesture': pointing_gesture,
-            'index_thumb_pinch': index_thumb_pinch,  # Left click
-            'middle_thumb_pinch': middle_thumb_pinch,  # Right click
-            'drag_gesture': drag_gesture,  # Drag and drop
-            'two_finger_gesture': two_finger_gesture,  # General two-finger gesture
-            'v_shape': v_shape,  # V shape for scrolling
-            'double_click_gesture': double_click_gesture,  # Double click
-            'open_hand': open_hand,  # Open hand gesture
-            'extended_fingers': extended_fingers,
-            'hand_facing_camera': hand_facing_camera
-        }
-
-    def calculate_angle(self, point1, point2, point3):
-        """Calculate angle between three points in degrees"""
-        # Convert points to numpy arrays for vector calculations
-        p1 = np.array([point1[0], point1[1]])
-        p2 = np.array([point2[0], point2[1]])
-        p3 = np.array([point3[0], point3[1]])
-
-        # Calculate vectors
-        v1 = p1 - p2
-        v2 = p3 - p2
-
-        # Calculate angle using dot product
-        dot_product = np.dot(v1, v2)
-        norm_v1 = np.linalg.norm(v1)
-        norm_v2 = np.linalg.norm(v2)
-
-        # Avoid division by zero
-        if norm_v1 == 0 or norm_v2 == 0:
-            return 0
-
-        cos_angle = dot_product / (norm_v1 * norm_v2)
-        # Clamp to avoid numerical errors
-        cos_angle = max(min(cos_angle, 1.0), -1.0)
-        angle_rad = np.arccos(cos_angle)
-
-        # Convert to degrees
-        angle_deg = np.degrees(angle_rad)
-
-        return angle_deg
-
-    def calculate_distance(self, point1, point2):
-        """Calculate normalized distance between two points"""
-        return math.sqrt((point1[0] - point2[0])**2 + (point1[1] - point2[1])**2)
-
-    def control_mouse(self, hand_landmarks, gesture_state):
-        """Control mouse based on detected gestures from CONTROL.md recommendations"""
-        if not self.settings.get('enabled', True):
-            return
-
-        # Only process if hand is facing the camera
-        if not gesture_state.get('hand_facing_camera', True):
+        # Every feature of this one hand (see gesture_features.frame_features)
+        features = gesture_features.frame_features(hand_landmarks)
+
+        # Positions needed for drawing and scrolling
+        positions = features[gesture_features.POSITIONS]
+        self.wrist = (positions[0], positions[1])
+        self.thumb_tip = (positions[2], positions[3])
+        self.index_finger_tip = (positions[4], positions[5])
+        self.middle_finger_tip = (positions[6], positions[7])
+
+        # Gesture rules based on CONTROL.md (see gesture_features.classify)
+        gesture_state = gesture_features.classify(
+            features, pinch_threshold=self.settings.get('pinch_threshold', 0.1))
+
+        # The learned classifier, when loaded, decides the pose instead of the rules
+        if self.gesture_model is not None:
+            self.gesture_model.apply(landmarks_to_array(hand_landmarks, self._gesture_points), gesture_state)
+        return gesture_state
+
+    def control_mouse(self, hand_landmarks, gesture_state, capture_time=None):
+        """
+        Control mouse based on detected gestures from CONTROL.md recommendations.
+
+        `capture_time` is when the frame was taken (clock seconds); the
+        predictive cursor filter uses it to make up for the pipeline delay.
+        """
+        # Only process if enabled and the hand is facing the camera (ending any
+        # gesture in progress, so a drag never leaves the button held)
+        if not self.settings.get('enabled', True) or not gesture_state.get('hand_facing_camera', True):
+            self.release_gestures()
             return
 
         # 1. CURSOR MOVEMENT: Point with index finger (hand relaxed)
         # "A natural way to move the cursor is by pointing with the index finger"
         if gesture_state.get('pointing_gesture', False) or gesture_state.get('two_finger_gesture', False):
-            # Get smoothed index finger tip position
-            smooth_tip = gesture_state['smooth_index_tip']
-            raw_x = int(smooth_tip[0] * self.screen_width)
-            raw_y = int(smooth_tip[1] * self.screen_height)
-
-            # Apply Kalman filter for smoother movement (recommended in CONTROL.md)
             # "MediaPipe hand landmarks can fluctuate, so smoothing is essential. Common techniques include low-pass filters and Kalman filters."
-            filtered_pos = self.kalman_filter.update(np.array([raw_x, raw_y]))
-            x, y = int(filtered_pos[0]), int(filtered_pos[1])
-
-            # Apply stability threshold to reduce jitter
-            # "It also helps to ignore tiny hand tremors by thresholding movement"
-            stability_threshold = self.settings.get('stability_threshold', 5)
-            if abs(x - self.prev_x) < stability_threshold and abs(y - self.prev_y) < stability_threshold:
-                x, y = self.prev_x, self.prev_y
-
-            # Apply additional smoothing based on movement speed
-            # "Combining a Kalman filter with a small deadzone (ignore sub-pixel jitter) usually works well."
-            distance = math.sqrt((x - self.prev_x)**2 + (y - self.prev_y)**2)
-
-            # Adaptive smoothing - more smoothing for small movements, less for large movements
-            if distance < 50:  # Small movement
-                smoothing_factor = self.settings.get('smoothing_factor', 0.8)
-            else:  # Large movement
-                smoothing_factor = max(0.3, self.settings.get('smoothing_factor', 0.8) - 0.3)
-
-            x = int(self.prev_x + (x - self.prev_x) * (1 - smoothing_factor))
-            y = int(self.prev_y + (y - self.prev_y) * (1 - smoothing_factor))
-
-            # Move mouse cursor
-            pyautogui.moveTo(x, y)
+            # Filter the fingertip through the configured chain (see cursor_filters),
+            # at the time its frame was captured, for display now
+            tip = self.index_finger_tip
+            now = self.clock()
+            x, y = self.cursor_filter.step(now if capture_time is None else capture_time,
+                                           tip[0] * self.screen_width, tip[1] * self.screen_height, now=now)
+            # Move mouse cursor, or let the output thread move it towards here
+            cursor_output = self.cursor_output
+            if cursor_output is not None:
+                cursor_output.push(now, x, y)
+            x, y = int(x), int(y)
+            if cursor_output is None:
+                self.mouse.moveTo(x, y)
 
             # Store position history
             self.position_history.append((x, y))
             self.prev_x, self.prev_y = x, y
 
-        # 2. LEFT CLICK: Pinch index+thumb together (tap)
-        # "Left click: A pinch or tap gesture. For example, touching the tips of thumb and index finger together"
-        if gesture_state.get('index_thumb_pinch', False) and not hasattr(self, 'index_thumb_pinch_active'):
-            # Start pinch timer
-            self.index_thumb_pinch_active = True
-            self.index_thumb_pinch_start_time = time.time()
-            self.last_gesture = "Left Click Started"
-            self.gesture_color = (0, 255, 0)  # Green
-            self.gesture_time = time.time()
-        elif gesture_state.get('index_thumb_pinch', False) and hasattr(self, 'index_thumb_pinch_active') and self.index_thumb_pinch_active:
-            # Pinch is still active, check if we should perform click
-            if time.time() - self.index_thumb_pinch_start_time > 0.2 and not hasattr(self, 'left_click_performed'):
-                # Perform click after short delay
-                pyautogui.click(button='left')
-                self.left_click_performed = True
-                self.last_gesture = "Left Click"
-                self.gesture_color = (0, 255, 0)  # Green
-                self.gesture_time = time.time()
-        elif not gesture_state.get('index_thumb_pinch', False) and hasattr(self, 'index_thumb_pinch_active'):
-            # Reset pinch state
-            self.index_thumb_pinch_active = False
-            if hasattr(self, 'left_click_performed'):
-                delattr(self, 'left_click_performed')
-
-        # 3. RIGHT CLICK: Pinch middle+thumb together
-        # "Right click: Another pinch combination... HandMouse uses thumb+middle pinch"
-        if gesture_state.get('middle_thumb_pinch', False) and not hasattr(self, 'middle_thumb_pinch_active'):
-            # Start pinch timer
-            self.middle_thumb_pinch_active = True
-            self.middle_thumb_pinch_start_time = time.time()
-            self.last_gesture = "Right Click Started"
-            self.gesture_color = (0, 165, 255)  # Orange
-            self.gesture_time = time.time()
-        elif gesture_state.get('middle_thumb_pinch', False) and hasattr(self, 'middle_thumb_pinch_active') and self.middle_thumb_pinch_active:
-            # Pinch is still active, check if we should perform click
-            if time.time() - self.middle_thumb_pinch_start_time > 0.2 and not hasattr(self, 'right_click_performed'):
-                # Perform click after short delay
-                pyautogui.click(button='right')
-                self.right_click_performed = True
-                self.last_gesture = "Right Click"
-                self.gesture_color = (0, 165, 255)  # Orange
-                self.gesture_time = time.time()
-        elif not gesture_state.get('middle_thumb_pinch', False) and hasattr(self, 'middle_thumb_pinch_active'):
-            # Reset pinch state
-            self.middle_thumb_pinch_active = False
-            if hasattr(self, 'right_click_performed'):
-                delattr(self, 'right_click_performed')
-
-        # 4. DRAG & DROP: Pinch-and-hold + move
-        # "Drag & Drop: 'Click-and-hold' with pinch. Users pinch (index+thumb) and hold while moving"
-        if gesture_state.get('drag_gesture', False):
-            if not hasattr(self, 'drag_active') or not self.drag_active:
-                # Start drag operation
-                pyautogui.mouseDown()
-                self.drag_active = True
-                self.last_gesture = "Drag Start"
-                self.gesture_color = (255, 0, 0)  # Red
-                self.gesture_time = time.time()
-        elif hasattr(self, 'drag_active') and self.drag_active and not gesture_state.get('index_thumb_pinch', False):
-            # End drag operation when pinch is released
-            pyautogui.mouseUp()
-            self.drag_active = False
-            self.last_gesture = "Drag End"
-            self.gesture_color = (0, 255, 0)  # Green
-            self.gesture_time = time.time()
-
-        # 5. SCROLLING: Two-finger swipe (index+middle extended)
-        # "Scrolling: A swipe or pinch-scroll gesture... raising two fingers (index+middle) like a 'two-finger swipe'"
-        if gesture_state.get('v_shape', False):
-            # Calculate vertical movement for scrolling
-            current_y = self.wrist[1]
-
-            if time.time() > self.scroll_cooldown:
-                y_diff = current_y - self.prev_hand_y
-                if abs(y_diff) > 0.01:  # Threshold to avoid accidental scrolls
-                    # Invert scroll direction for more natural feel
-                    scroll_amount = -int(y_diff * self.settings.get('scroll_sensitivity', 5) * 10)
-                    pyautogui.scroll(scroll_amount)
-                    self.scroll_cooldown = time.time() + 0.05  # Reduced cooldown for smoother scrolling
-
-                    if abs(scroll_amount) > 0:
-                        self.last_gesture = "Scrolling" + (" Down" if scroll_amount > 0 else " Up")
-                        self.gesture_color = (255, 165, 0)  # Orange
-                        self.gesture_time = time.time()
-
-            self.prev_hand_y = current_y
-
-        # 6. DOUBLE CLICK: Quick double pinch or raise index+middle
-        # "Double Click: Quick double pinch or raise index+middle"
-        if gesture_state.get('double_click_gesture', False) and not hasattr(self, 'double_click_active'):
-            self.double_click_active = True
-            self.double_click_start_time = time.time()
-        elif gesture_state.get('double_click_gesture', False) and hasattr(self, 'double_click_active'):
-            if time.time() - self.double_click_start_time > 0.3 and not hasattr(self, 'double_click_performed'):
-                # Perform double click
-                pyautogui.doubleClick()
-                self.double_click_performed = True
-                self.last_gesture = "Double Click"
-                self.gesture_color = (0, 255, 255)  # Cyan
-                self.gesture_time = time.time()
-        elif not gesture_state.get('double_click_gesture', False) and hasattr(self, 'double_click_active'):
-            # Reset double click state
-            self.double_click_active = False
-            if hasattr(self, 'double_click_performed'):
-                delattr(self, 'double_click_performed')
+        # 7-9. Time-based gestures see the frame first, so a zoom can keep
+        # its pinch from clicking
+        if self.settings.get('temporal_gestures', False):
+            self.temporal_recognizer.update(self.clock(), gesture_state, self.wrist[0], self.wrist[1],
+                                            (self.prev_x, self.prev_y))
+
+        # 2-6. Clicks, drag, scrolling and double click run through the gesture
+        # table (GESTURES), which keeps conflicting gestures from firing together
+        self.gesture_engine.update(gesture_state)
+
+    def release_gestures(self):
+        """End all gestures (releasing a held drag), e.g. when the hand is lost"""
+        self.gesture_engine.reset()
+        self.temporal_recognizer.reset()
+        self.cursor_filter.reset()
+        if self.cursor_output is not None:
+            self.cursor_output.reset()
+
+    def set_input_backend(self, mouse):
+        """Send mouse and keyboard events to another backend, closing the current one"""
+        previous, self.mouse = self.mouse, mouse
+        if self.cursor_output is not None:
+            self.cursor_output.mouse = mouse
+        previous.close()
+
+    def start_cursor_output(self):
+        """
+        Move the cursor from a CursorOutput thread at cursor_output_rate, between
+        the positions tracking produces, until stop_cursor_output. With a rate
+        of 0 the cursor keeps moving once per processed frame.
+        """
+        self.cursor_output_started = True
+        self.configure_cursor_output()
+
+    def stop_cursor_output(self):
+        self.cursor_output_started = False
+        self.configure_cursor_output()
+
+    def configure_cursor_output(self):
+        """Start, stop or retune the cursor output thread to match the settings"""
+        rate = self.settings.get('cursor_output_rate', 0) if self.cursor_output_started else 0
+        cursor_output = self.cursor_output
+        if cursor_output is not None and cursor_output.rate != rate:
+            self.cursor_output = None
+            cursor_output.stop()
+            cursor_output = None
+        if cursor_output is None and rate > 0:
+            cursor_output = CursorOutput(self.mouse, CursorPath(), rate, clock=self.clock)
+            cursor_output.start()
+            self.cursor_output = cursor_output
+        if cursor_output is not None:
+            cursor_output.path.mode = self.settings.get('cursor_output_mode', 'interpolate')
+
+    def show_gesture(self, text, color):
+        """Show a gesture banner on the preview"""
+        self.last_gesture = text
+        self.gesture_color = color
+        self.gesture_time = self.clock()
+
+    # Gesture actions, named in GESTURES
+
+    # 2. LEFT CLICK: Pinch index+thumb together (tap)
+    # "Left click: A pinch or tap gesture. For example, touching the tips of thumb and index finger together"
+    def begin_left_click(self, gesture_state):
+        self.show_gesture("Left Click Started", (0, 255, 0))  # Green
+
+    def left_click(self, gesture_state):
+        self.mouse.click(button='left')
+        self.show_gesture("Left Click", (0, 255, 0))  # Green
+
+    # 3. RIGHT CLICK: Pinch middle+thumb together
+    # "Right click: Another pinch combination... HandMouse uses thumb+middle pinch"
+    def begin_right_click(self, gesture_state):
+        self.show_gesture("Right Click Started", (255, 165, 0))  # Orange
+
+    def right_click(self, gesture_state):
+        self.mouse.click(button='right')
+        self.show_gesture("Right Click", (255, 165, 0))  # Orange
+
+    # 4. DRAG & DROP: Pinch-and-hold + move
+    # "Drag & Drop: 'Click-and-hold' with pinch. Users pinch (index+thumb) and hold while moving"
+    def start_drag(self, gesture_state):
+        self.mouse.mouseDown()
+        self.show_gesture("Drag Start", (0, 0, 255))  # Blue
+
+    def end_drag(self, gesture_state):
+        self.mouse.mouseUp()
+        self.show_gesture("Drag End", (0, 255, 0))  # Green
+
+    # 5. SCROLLING: Two-finger swipe (index+middle extended)
+    # "Scrolling: A swipe or pinch-scroll gesture... raising two fingers (index+middle) like a 'two-finger swipe'"
+    def start_scroll(self, gesture_state):
+        # Measure movement from where the V shape started
+        self.prev_hand_y = self.wrist[1]
+
+    def scroll(self, gesture_state):
+        # Calculate vertical movement for scrolling
+        current_y = self.wrist[1]
+        now = self.clock()
+
+        if now > self.scroll_cooldown:
+            y_diff = current_y - self.prev_hand_y
+            if abs(y_diff) > 0.01:  # Threshold to avoid accidental scrolls
+                # Invert scroll direction for more natural feel
+                scroll_amount = -int(y_diff * self.settings.get('scroll_sensitivity', 5) * 10)
+                self.mouse.scroll(scroll_amount)
+                self.scroll_cooldown = now + 0.05  # Reduced cooldown for smoother scrolling
+
+                if abs(scroll_amount) > 0:
+                    self.show_gesture("Scrolling" + (" Down" if scroll_amount > 0 else " Up"),
+                                      (0, 165, 255))  # Light blue
+
+        self.prev_hand_y = current_y
+
+    # 6. DOUBLE CLICK: Quick double pinch or raise index+middle
+    # "Double Click: Quick double pinch or raise index+middle"
+    def double_click(self, gesture_state):
+        self.mouse.doubleClick()
+        self.show_gesture("Double Click", (255, 255, 0))  # Yellow
+
+    # Actions of the temporal recognizer (gesture_temporal.py)
+
+    # A quick pinch, held back in case it was the first of a double pinch:
+    # click where the cursor was at the pinch, not where the hand is now
+    def click_at(self, gesture_state, cursor):
+        if cursor is not None:
+            self.mouse.moveTo(*cursor)
+        self.mouse.click(button='left')
+        self.show_gesture("Left Click", (0, 255, 0))  # Green
+
+    # 7. ZOOM: Pinch together / spread apart
+    # "Zoom: A classic pinch/spread gesture. Bringing thumb and index together"
+    def zoom(self, gesture_state, notches):
+        # Ctrl + mouse wheel zooms in most applications
+        self.mouse.keyDown('ctrl')
+        try:
+            self.mouse.scroll(notches)
+        finally:
+            self.mouse.keyUp('ctrl')
+        self.show_gesture("Zoom In" if notches > 0 else "Zoom Out", (255, 0, 255))  # Magenta
+
+    # 8. SWIPE: Open hand moved sideways (browser back / forward)
+    def swipe(self, gesture_state, direction):
+        self.mouse.hotkey(*(FORWARD_KEYS if direction > 0 else BACK_KEYS))
+        self.show_gesture("Swipe Forward" if direction > 0 else "Swipe Back", (255, 255, 255))  # White
+
+    # 9. FLICK: Quick V-shape flick up or down (scroll a long way)
+    def flick(self, gesture_state, direction):
+        # Same direction as scroll(): moving the hand down scrolls down
+        self.mouse.scroll(-direction * self.settings.get('scroll_sensitivity', 5) * 10)
+        self.show_gesture("Flick" + (" Down" if direction > 0 else " Up"), (0, 165, 255))  # Light blue
 
     def is_stable_position(self, threshold):
         """Check if the cursor position is stable (not moving much)"""
@@ -532,3 +595,51 @@ class HandGestureController:
     def update_settings(self, settings):
         """Update controller settings"""
         self.settings.update(settings)
+        self.roi_tracker.padding = self.settings.get('roi_padding', 0.25)
+        if not self.settings.get('roi_tracking', False):
+            self.roi_tracker.reset()
+            if self.roi_hands is not None:
+                self.roi_hands.close()
+                self.roi_hands = None
+        self.inference_scheduler.max_skip = self.settings.get('max_skipped_frames', 2)
+        if not self.settings.get('adaptive_inference', False):
+            self.inference_scheduler.reset()
+        self.presence_monitor.configure(
+            enter_seconds=self.settings.get('idle_enter_seconds', 3.0),
+            motion_threshold=self.settings.get('idle_motion_threshold', 4.0),
+            idle_fps=self.settings.get('idle_fps', 5))
+        self.temporal_recognizer.configure(self.settings)
+        if [self.settings.get(key) for key in FILTER_SETTINGS] != self.cursor_filter_settings:
+            # Rebuilding restarts the filter state, so only do it when the filter changed
+            self.cursor_filter = self.create_cursor_filter()
+        if not self.settings.get('temporal_gestures', False):
+            self.temporal_recognizer.reset()
+        self.configure_cursor_output()
+        if any(key.startswith('gesture_model') for key in settings):
+            self.load_gesture_model()
+        backend = self.settings.get('input_backend', 'auto')
+        if self.input_backend is not None and backend != self.input_backend:
+            self.input_backend = backend
+            self.set_input_backend(create_input_backend(backend))
+
+    def inference_stats(self):
+        """Get inference scheduling statistics"""
+        stats = self.inference_scheduler.stats()
+        stats['roi_tracked_frames'] = self.roi_tracker.tracked_frames
+        stats['roi_full_frames'] = self.roi_tracker.full_frames
+        stats.update(self.presence_monitor.stats())
+        stats['cursor_filter'] = self.cursor_filter.stats()
+        if self.cursor_output is not None:
+            stats['cursor_output'] = self.cursor_output.stats()
+        if hasattr(self.mouse, 'stats'):
+            stats['input'] = self.mouse.stats()
+        return stats
+
+    def close(self):
+        """Stop the cursor output thread and release the hand landmark detector and input backend"""
+        self.stop_cursor_output()
+        self.hands.close()
+        if self.roi_hands is not None:
+            self.roi_hands.close()
+        if hasattr(self.mouse, 'close'):
+            self.mouse.close()
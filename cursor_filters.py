@@ -0,0 +1,423 @@
+"""
+Cursor filters. Each one is a stage with `reset()` and `step(t, x, y)`,
+returning the filtered (x, y) for a sample taken at time t (seconds), and
+`from_settings(settings, **params)` to build it from the app settings.
+Stages are combined with FilterChain, which passes its final output to
+`settle(x, y)` of stages marked `follows_output`.
+"""
+
+import math
+import time
+from collections import deque
+
+class MovingAverage:
+    """Mean of the last `window` samples, kept as a running sum"""
+    __slots__ = ('window', 'history', 'sum_x', 'sum_y')
+
+    def __init__(self, window=15):
+        self.window = window
+        self.reset()
+
+    @classmethod
+    def from_settings(cls, settings, window=15):
+        return cls(window)
+
+    def reset(self):
+        self.history = deque(maxlen=self.window)
+        self.sum_x = self.sum_y = 0.0
+
+    def step(self, t, x, y):
+        if len(self.history) == self.window:
+            old_x, old_y = self.history[0]
+            self.sum_x -= old_x
+            self.sum_y -= old_y
+        self.history.append((x, y))
+        self.sum_x += x
+        self.sum_y += y
+        count = len(self.history)
+        return self.sum_x / count, self.sum_y / count
+
+
+class KalmanFilter:
+    """
+    A simple Kalman filter for smoothing cursor movement: a random walk per
+    axis, so it smooths but always lags (see KalmanPredictor).
+    """
+    __slots__ = ('process_variance', 'measurement_variance', 'x', 'y', 'error_estimate')
+
+    def __init__(self, process_variance=0.001, measurement_variance=0.1):
+        self.process_variance = process_variance
+        self.measurement_variance = measurement_variance
+        self.reset()
+
+    @classmethod
+    def from_settings(cls, settings, process_variance=0.001, measurement_variance=0.1):
+        return cls(process_variance, measurement_variance)
+
+    def reset(self):
+        self.x = self.y = None
+        self.error_estimate = 1.0
+
+    def step(self, t, x, y):
+        if self.x is None:
+            self.x, self.y = x, y
+            return x, y
+
+        # Prediction update
+        priori_error_estimate = self.error_estimate + self.process_variance
+
+        # Measurement update
+        blending_factor = priori_error_estimate / (priori_error_estimate + self.measurement_variance)
+        self.x += blending_factor * (x - self.x)
+        self.y += blending_factor * (y - self.y)
+        self.error_estimate = (1 - blending_factor) * priori_error_estimate
+        return self.x, self.y
+
+
+class Deadzone:
+    """
+    Hold the output still until the input moves `threshold` units away on
+    either axis, ignoring small tremors.
+
+    In a FilterChain the held position follows the chain's output, so the
+    input is compared against where the cursor is rather than where this
+    stage last let it go.
+    """
+    follows_output = True
+
+    __slots__ = ('threshold', 'x', 'y')
+
+    def __init__(self, threshold=5):
+        self.threshold = threshold
+        self.reset()
+
+    @classmethod
+    def from_settings(cls, settings, threshold=None):
+        return cls(settings.get('stability_threshold', 5) if threshold is None else threshold)
+
+    def reset(self):
+        self.x = self.y = None
+
+    def step(self, t, x, y):
+        if self.x is None or abs(x - self.x) >= self.threshold or abs(y - self.y) >= self.threshold:
+            self.x, self.y = x, y
+        return self.x, self.y
+
+    def settle(self, x, y):
+        """Hold the chain's final output for the next sample"""
+        self.x, self.y = x, y
+
+
+class AdaptiveBlend:
+    """
+    Exponential blend towards the input: keeps `smoothing_factor` of the
+    previous output for small movements, and less for movements of at
+    least `fast_distance` units so fast motion catches up sooner.
+    """
+    __slots__ = ('smoothing_factor', 'fast_distance', 'fast_reduction', 'min_factor', 'x', 'y')
+
+    def __init__(self, smoothing_factor=0.8, fast_distance=50.0, fast_reduction=0.3, min_factor=0.3):
+        self.smoothing_factor = smoothing_factor
+        self.fast_distance = fast_distance
+        self.fast_reduction = fast_reduction
+        self.min_factor = min_factor
+        self.reset()
+
+    @classmethod
+    def from_settings(cls, settings, **params):
+        params.setdefault('smoothing_factor', settings.get('smoothing_factor', 0.8))
+        return cls(**params)
+
+    def reset(self):
+        self.x = self.y = None
+
+    def step(self, t, x, y):
+        if self.x is None:
+            self.x, self.y = x, y
+            return x, y
+        factor = self.smoothing_factor
+        if math.hypot(x - self.x, y - self.y) >= self.fast_distance:
+            factor = max(self.min_factor, factor - self.fast_reduction)
+        self.x += (x - self.x) * (1 - factor)
+        self.y += (y - self.y) * (1 - factor)
+        return self.x, self.y
+
+
+class OneEuroFilter:
+    """
+    One Euro filter (Casiez et al., CHI 2012) for a 2D cursor position.
+
+    A low-pass filter whose cutoff rises with speed: slow movements are
+    smoothed heavily (`min_cutoff` Hz), fast ones barely, so jitter is
+    removed without the cursor trailing behind quick motion. `beta` sets
+    how fast the cutoff grows with speed (per unit/s) and `d_cutoff` (Hz)
+    smooths the speed estimate.
+
+    State is a handful of floats updated in place, O(1) per sample.
+    """
+    __slots__ = ('min_cutoff', 'beta', 'd_cutoff', 'max_gap', 't', 'x', 'y', 'dx', 'dy')
+
+    def __init__(self, min_cutoff=1.0, beta=0.007, d_cutoff=1.0, max_gap=0.5):
+        self.min_cutoff = min_cutoff
+        self.beta = beta
+        self.d_cutoff = d_cutoff
+        self.max_gap = max_gap  # Seconds without samples after which filtering restarts
+        self.reset()
+
+    @classmethod
+    def from_settings(cls, settings, **params):
+        params.setdefault('min_cutoff', settings.get('one_euro_min_cutoff', 1.0))
+        params.setdefault('beta', settings.get('one_euro_beta', 0.007))
+        params.setdefault('d_cutoff', settings.get('one_euro_d_cutoff', 1.0))
+        return cls(**params)
+
+    def reset(self):
+        self.t = None
+        self.x = self.y = 0.0
+        self.dx = self.dy = 0.0
+
+    def step(self, t, x, y):
+        """Filter the sample (x, y) taken at time t (seconds)"""
+        if self.t is None or t - self.t > self.max_gap:
+            self.t, self.x, self.y = t, x, y
+            self.dx = self.dy = 0.0
+            return x, y
+        dt = t - self.t
+        if dt <= 0:
+            return self.x, self.y
+        self.t = t
+
+        # Smoothed speed, then a cutoff that follows it
+        alpha = _smoothing(self.d_cutoff, dt)
+        self.dx += alpha * ((x - self.x) / dt - self.dx)
+        self.dy += alpha * ((y - self.y) / dt - self.dy)
+        speed = math.hypot(self.dx, self.dy)
+
+        alpha = _smoothing(self.min_cutoff + self.beta * speed, dt)
+        self.x += alpha * (x - self.x)
+        self.y += alpha * (y - self.y)
+        return self.x, self.y
+
+
+def _smoothing(cutoff, dt):
+    """Exponential smoothing factor of a first-order low-pass filter at `cutoff` Hz"""
+    tau = 1.0 / (2.0 * math.pi * cutoff)
+    return 1.0 / (1.0 + tau / dt)
+
+
+class KalmanPredictor:
+    """
+    Constant-velocity Kalman filter for a 2D cursor position that predicts
+    ahead to hide pipeline latency.
+
+    Samples are filtered at the time their frame was captured. The cursor is
+    then placed where the finger should be the measured capture-to-output
+    delay (smoothed, so per-frame timing noise doesn't shake the cursor)
+    plus `horizon` seconds later, the horizon being the latency before the
+    capture timestamp (exposure, USB, driver). The
+    predicted offset from the filtered position is capped at `max_offset`,
+    so a sudden stop or reversal overshoots by at most that many units.
+
+    `acceleration_noise` (units/s^2) is how quickly the velocity may change
+    and `measurement_noise` (units) the jitter of the samples. Both axes
+    share one covariance, as they are measured together under the same
+    model, so each sample is a few float operations.
+
+    In a FilterChain it is given the output time as `now`, so it should be
+    the last stage.
+    """
+    uses_now = True
+
+    __slots__ = ('acceleration_noise', 'measurement_noise', 'horizon', 'max_offset', 'max_lead',
+                 'max_gap', 't', 'x', 'y', 'vx', 'vy', 'p00', 'p01', 'p11', 'delay')
+
+    def __init__(self, acceleration_noise=500.0, measurement_noise=10.0, horizon=0.03,
+                 max_offset=80.0, max_lead=0.25, max_gap=0.5):
+        self.acceleration_noise = acceleration_noise
+        self.measurement_noise = measurement_noise
+        self.horizon = horizon
+        self.max_offset = max_offset
+        self.max_lead = max_lead  # Longest prediction, whatever the measured delay
+        self.max_gap = max_gap    # Seconds without samples after which filtering restarts
+        self.delay = None         # Smoothed capture-to-output delay (seconds), from the first sample
+        self.reset()
+
+    @classmethod
+    def from_settings(cls, settings, **params):
+        params.setdefault('horizon', settings.get('prediction_horizon', 0.03))
+        params.setdefault('max_offset', settings.get('prediction_max_offset', 80))
+        return cls(**params)
+
+    def reset(self):
+        self.t = None
+        self.x = self.y = self.vx = self.vy = 0.0
+        self.p00 = self.p01 = self.p11 = 0.0
+
+    def observe(self, t, x, y):
+        """Correct the state with the sample (x, y) captured at time t (seconds)"""
+        r = self.measurement_noise ** 2
+        if self.t is None or t - self.t > self.max_gap:
+            # Start at the sample, at rest but with a very uncertain velocity
+            self.t, self.x, self.y, self.vx, self.vy = t, x, y, 0.0, 0.0
+            self.p00, self.p01, self.p11 = r, 0.0, (self.acceleration_noise * self.max_gap) ** 2
+            return
+        dt = t - self.t
+        if dt <= 0:
+            return
+        self.t = t
+
+        # Predict: constant velocity, white-noise acceleration
+        q = self.acceleration_noise ** 2
+        self.x += self.vx * dt
+        self.y += self.vy * dt
+        p01 = self.p01 + dt * self.p11
+        self.p00 += dt * (self.p01 + p01) + q * dt ** 3 / 3.0
+        self.p01 = p01 + q * dt ** 2 / 2.0
+        self.p11 += q * dt
+
+        # Update with the measured position
+        s = self.p00 + r
+        k0, k1 = self.p00 / s, self.p01 / s
+        ex, ey = x - self.x, y - self.y
+        self.x += k0 * ex
+        self.y += k0 * ey
+        self.vx += k1 * ex
+        self.vy += k1 * ey
+        self.p11 -= k1 * self.p01
+        self.p00 *= 1.0 - k0
+        self.p01 *= 1.0 - k0
+
+    def predict(self, lead):
+        """Position `lead` seconds after the last sample, with the offset capped"""
+        dx, dy = self.vx * lead, self.vy * lead
+        offset = math.hypot(dx, dy)
+        if offset > self.max_offset:
+            scale = self.max_offset / offset
+            dx, dy = dx * scale, dy * scale
+        return self.x + dx, self.y + dy
+
+    def step(self, t, x, y, now=None):
+        """
+        Filter the sample (x, y) captured at time t and return the position
+        predicted for `now` (defaults to t) plus the horizon.
+        """
+        self.observe(t, x, y)
+        delay = max(0.0, now - t) if now is not None else 0.0
+        if self.delay is None:
+            self.delay = delay
+        else:
+            self.delay += 0.1 * (delay - self.delay)
+        return self.predict(min(self.delay + self.horizon, self.max_lead))
+
+
+# Stage names usable in the cursor_filter_chain setting
+STAGES = {
+    'moving_average': MovingAverage,
+    'kalman': KalmanFilter,
+    'deadzone': Deadzone,
+    'blend': AdaptiveBlend,
+    'one_euro': OneEuroFilter,
+    'predictive': KalmanPredictor,
+}
+
+# Chains behind the cursor_filter choices ('custom' uses cursor_filter_chain)
+PRESETS = {
+    'kalman': ['moving_average', 'kalman', 'deadzone', 'blend'],
+    'one_euro': ['one_euro'],
+    'predictive': ['predictive'],
+}
+
+# Settings FilterChain.from_settings reads; a chain only changes when one of them does
+SETTINGS_KEYS = ('cursor_filter', 'cursor_filter_chain', 'stability_threshold', 'smoothing_factor',
+                 'one_euro_min_cutoff', 'one_euro_beta', 'one_euro_d_cutoff',
+                 'prediction_horizon', 'prediction_max_offset')
+
+# Input speed (units/s) below which a stage's lag is not estimated
+_LAG_MIN_SPEED = 50.0
+
+class FilterChain:
+    """
+    Stages applied in order, with per-stage statistics.
+
+    For each stage it records the time spent in step() and estimates the
+    lag it adds: the stage's output offset from its input, projected onto
+    the input's direction of motion and divided by its speed.
+    """
+    def __init__(self, stages, names=None):
+        self.stages = list(stages)
+        self.names = list(names or (type(stage).__name__ for stage in self.stages))
+        self._uses_now = [getattr(stage, 'uses_now', False) for stage in self.stages]
+        self._followers = [stage for stage in self.stages if getattr(stage, 'follows_output', False)]
+        self._previous = [None] * len(self.stages)  # (t, x, y) of each stage's previous input
+        self.reset_stats()
+
+    @classmethod
+    def from_settings(cls, settings):
+        """
+        Build the chain selected by cursor_filter, or from cursor_filter_chain
+        when that is 'custom'. Chain entries are stage names or dicts like
+        {'stage': 'deadzone', 'threshold': 3}; parameters not given come
+        from the settings.
+        """
+        name = settings.get('cursor_filter', 'kalman')
+        if name == 'custom':
+            specs = settings.get('cursor_filter_chain') or []
+        else:
+            specs = PRESETS.get(name, PRESETS['kalman'])
+
+        stages, names = [], []
+        for spec in specs:
+            params = dict(spec) if isinstance(spec, dict) else {'stage': spec}
+            stage_name = params.pop('stage', None)
+            if stage_name not in STAGES:
+                raise ValueError(f"unknown stage {stage_name!r}")
+            stages.append(STAGES[stage_name].from_settings(settings, **params))
+            names.append(stage_name)
+        return cls(stages, names)
+
+    def reset(self):
+        for stage in self.stages:
+            stage.reset()
+        self._previous = [None] * len(self.stages)
+
+    def reset_stats(self):
+        count = len(self.stages)
+        self.seconds = [0.0] * count
+        self.lag_sum = [0.0] * count
+        self.lag_samples = [0] * count
+        self.samples = 0
+
+    def step(self, t, x, y, now=None):
+        """Run a sample taken at time t through every stage; `now` is when it will be shown"""
+        self.samples += 1
+        clock = time.perf_counter
+        for i, stage in enumerate(self.stages):
+            start_time = clock()
+            if self._uses_now[i]:
+                out_x, out_y = stage.step(t, x, y, now=now)
+            else:
+                out_x, out_y = stage.step(t, x, y)
+            self.seconds[i] += clock() - start_time
+
+            previous = self._previous[i]
+            self._previous[i] = (t, x, y)
+            if previous is not None and t > previous[0]:
+                dt = t - previous[0]
+                vx, vy = (x - previous[1]) / dt, (y - previous[2]) / dt
+                speed_squared = vx * vx + vy * vy
+                if speed_squared >= _LAG_MIN_SPEED * _LAG_MIN_SPEED:
+                    # Positive when the output trails the input along the motion
+                    self.lag_sum[i] += ((x - out_x) * vx + (y - out_y) * vy) / speed_squared
+                    self.lag_samples[i] += 1
+            x, y = out_x, out_y
+        for stage in self._followers:
+            stage.settle(x, y)
+        return x, y
+
+    def stats(self):
+        """Per stage: name, mean microseconds per sample and mean added lag in milliseconds"""
+        return [{
+            'stage': name,
+            'us_per_sample': self.seconds[i] / self.samples * 1e6 if self.samples else 0.0,
+            'lag_ms': self.lag_sum[i] / self.lag_samples[i] * 1000 if self.lag_samples[i] else 0.0
+        } for i, name in enumerate(self.names)]
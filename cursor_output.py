@@ -0,0 +1,144 @@
+"""
+High-rate cursor output. Tracking produces a filtered cursor position once
+per camera frame; CursorOutput moves the cursor on its own clock (e.g. at
+the display's 120 Hz) along the path between those positions, so it glides
+instead of jumping once per frame.
+"""
+
+import threading
+import time
+
+# Cursor output modes
+INTERPOLATE = 'interpolate'   # Trail the newest position by one frame and move between the last two
+EXTRAPOLATE = 'extrapolate'   # Continue from the newest position along the last frame's motion
+
+class CursorPath:
+    """
+    The last two filtered cursor positions and where the cursor should be
+    between and after them.
+
+    In 'interpolate' mode the cursor is shown one frame interval behind the
+    newest position, so it always moves between two known points at the
+    cost of a frame of lag. In 'extrapolate' mode it is shown at the
+    current time, continuing the last frame's motion for at most
+    `max_extrapolation` seconds past the newest position. Either way it
+    holds still once positions stop arriving.
+    """
+    __slots__ = ('mode', 'max_extrapolation', 'max_gap', 'interval',
+                 't0', 'x0', 'y0', 't1', 'x1', 'y1')
+
+    def __init__(self, mode=INTERPOLATE, max_extrapolation=0.05, max_gap=0.25):
+        self.mode = mode
+        self.max_extrapolation = max_extrapolation
+        self.max_gap = max_gap      # Seconds between positions after which the path restarts
+        self.interval = 1.0 / 30    # Smoothed seconds between positions
+        self.reset()
+
+    def reset(self):
+        """Forget the positions, e.g. when the hand is lost: the cursor stays where it is"""
+        self.t0 = self.t1 = None
+        self.x0 = self.y0 = self.x1 = self.y1 = 0.0
+
+    def push(self, t, x, y):
+        """Add the filtered position (x, y) meant for time t (seconds)"""
+        if self.t1 is None or t - self.t1 > self.max_gap:
+            # Start from rest at the new position
+            self.t0, self.x0, self.y0 = t - self.interval, x, y
+        elif t > self.t1:
+            self.interval += 0.1 * (t - self.t1 - self.interval)
+            self.t0, self.x0, self.y0 = self.t1, self.x1, self.y1
+        else:
+            return
+        self.t1, self.x1, self.y1 = t, x, y
+
+    def position(self, now):
+        """Cursor position at time `now`, or None before the first position"""
+        if self.t1 is None:
+            return None
+        if self.mode == INTERPOLATE:
+            now -= self.interval
+        span = self.t1 - self.t0
+        # Fraction of the way from the previous position to the newest one,
+        # past 1 when extrapolating
+        u = (now - self.t0) / span
+        u = min(max(u, 0.0), 1.0 + self.max_extrapolation / span)
+        return self.x0 + u * (self.x1 - self.x0), self.y0 + u * (self.y1 - self.y0)
+
+
+class CursorOutput(threading.Thread):
+    """
+    Thread that moves the cursor `rate` times per second along a CursorPath.
+
+    Ticks are scheduled on absolute deadlines, so the rate does not drift
+    with the time spent moving the mouse; a tick that is more than a whole
+    period late is skipped rather than run in a burst. The cursor is only
+    moved when its pixel position changes.
+    """
+    def __init__(self, mouse, path, rate=120, clock=time.monotonic):
+        super().__init__(name='CursorOutput', daemon=True)
+        self.mouse = mouse
+        self.path = path
+        self.rate = rate
+        self.clock = clock
+        self.lock = threading.Lock()
+        self.running = True
+        self.position = None
+
+        # Statistics
+        self.ticks = 0
+        self.moves = 0
+        self.late = 0
+        self.busy_time = 0.0
+
+    def push(self, t, x, y):
+        """Hand over a new filtered position (called from the gesture thread)"""
+        with self.lock:
+            self.path.push(t, x, y)
+
+    def reset(self):
+        with self.lock:
+            self.path.reset()
+
+    def tick(self, now):
+        """Move the cursor to where the path is at `now`"""
+        with self.lock:
+            position = self.path.position(now)
+        self.ticks += 1
+        if position is None:
+            return
+        position = int(position[0]), int(position[1])
+        if position != self.position:
+            self.position = position
+            # No pyautogui pause after the move, or it would cap the rate
+            self.mouse.moveTo(position[0], position[1], _pause=False)
+            self.moves += 1
+
+    def run(self):
+        period = 1.0 / self.rate
+        deadline = self.clock()
+        while self.running:
+            start_time = time.perf_counter()
+            self.tick(self.clock())
+            self.busy_time += time.perf_counter() - start_time
+
+            deadline += period
+            wait_time = deadline - self.clock()
+            if wait_time > 0:
+                time.sleep(wait_time)
+            elif wait_time < -period:
+                self.late += 1
+                deadline = self.clock()
+
+    def stop(self):
+        self.running = False
+        if self.is_alive() and threading.current_thread() is not self:
+            self.join(timeout=1.0)
+
+    def stats(self):
+        return {
+            'rate': self.rate,
+            'ticks': self.ticks,
+            'moves': self.moves,
+            'late_ticks': self.late,
+            'avg_us': 1e6 * self.busy_time / self.ticks if self.ticks else 0.0
+        }
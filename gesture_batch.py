@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+NoMouse - Batch gesture evaluation
+Runs the gesture classifier over recorded landmark sessions in bulk, for
+tuning thresholds offline:
+
+    python3 gesture_batch.py session.npz
+    python3 gesture_batch.py session.npz --sweep pinch_threshold 0.05 0.15 11
+    python3 gesture_batch.py session.npz --check
+
+Features are computed once per frame; every threshold setting afterwards is
+just a few vectorized comparisons, so sweeps over millions of frames take
+seconds.
+"""
+
+import argparse
+import sys
+import time
+
+import numpy as np
+
+import gesture_features
+from gesture_features import GESTURE_FLAGS, classify, classify_batch, compute_features, frame_features
+from landmarks import array_to_landmarks
+
+THRESHOLDS = ('pinch_threshold', 'extension_threshold', 'v_shape_angle')
+
+def batch_features(points, chunk_size=65536):
+    """(N, NUM_FEATURES) features for (N, 21, 3) landmarks, computed in bounded chunks"""
+    points = np.ascontiguousarray(points, dtype=np.float32)
+    features = np.empty((len(points), gesture_features.NUM_FEATURES), dtype=np.float32)
+    for start in range(0, len(points), chunk_size):
+        compute_features(points[start:start + chunk_size], features[start:start + chunk_size])
+    return features
+
+
+def evaluate(points, **thresholds):
+    """Gesture flags (N, len(GESTURE_FLAGS)) and features (N, NUM_FEATURES) for (N, 21, 3) landmarks"""
+    features = batch_features(points)
+    return classify_batch(features, **thresholds), features
+
+
+def check_consistency(points, flags=None, **thresholds):
+    """
+    Compare the batch flags with the streaming path (frame_features + classify
+    one frame at a time, as get_gesture does). Returns the mismatching frame indices.
+    """
+    if flags is None:
+        flags, _ = evaluate(points, **thresholds)
+    mismatches = []
+    for i, hand in enumerate(np.asarray(points, dtype=np.float32)):
+        record = classify(frame_features(array_to_landmarks(hand)), **thresholds)
+        if any(bool(getattr(record, name)) != flags[i, column] for column, name in enumerate(GESTURE_FLAGS)):
+            mismatches.append(i)
+    return mismatches
+
+
+def sweep(features, parameter, values, labels=None, **thresholds):
+    """
+    Fraction of frames raising each gesture flag for every value of one threshold.
+
+    Returns {value: {label: rates}} where rates is a (len(GESTURE_FLAGS),)
+    array; all frames are reported under the label None.
+    """
+    groups = {None: slice(None)}
+    if labels is not None:
+        groups.update({label: labels == label for label in np.unique(labels) if label})
+
+    results = {}
+    for value in values:
+        flags = classify_batch(features, **dict(thresholds, **{parameter: value}))
+        results[value] = {label: flags[rows].mean(axis=0) for label, rows in groups.items()}
+    return results
+
+
+def load_session(path):
+    """Landmarks and labels of the frames with a hand from a session file"""
+    with np.load(path) as session:
+        present = session['present'].astype(bool)
+        points = session['landmarks'][present].astype(np.float32)
+        labels = session['labels'][present] if 'labels' in session.files else None
+    return points, labels
+
+
+def print_rates(title, rates):
+    print(title)
+    for name, rate in zip(GESTURE_FLAGS, rates):
+        print(f"  {name:<24} {rate * 100:6.1f}%")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Evaluate gestures over recorded landmark sessions")
+    parser.add_argument('sessions', nargs='+', help=".npz sessions written by landmark_sources.py")
+    parser.add_argument('--sweep', nargs=4, metavar=('THRESHOLD', 'START', 'STOP', 'STEPS'),
+                        help=f"Sweep one of {', '.join(THRESHOLDS)}")
+    parser.add_argument('--check', action='store_true', help="Verify against the streaming classifier")
+    args = parser.parse_args()
+
+    sessions = [load_session(path) for path in args.sessions]
+    points = np.concatenate([points for points, _ in sessions])
+    labels = None
+    if all(labels is not None for _, labels in sessions):
+        labels = np.concatenate([labels for _, labels in sessions])
+
+    start_time = time.perf_counter()
+    flags, features = evaluate(points)
+    elapsed = time.perf_counter() - start_time
+    print(f"{len(points)} frames evaluated in {elapsed:.2f}s")
+    print_rates("All frames:", flags.mean(axis=0) if len(flags) else np.zeros(len(GESTURE_FLAGS)))
+
+    if args.check:
+        mismatches = check_consistency(points, flags)
+        print(f"Streaming path: {len(mismatches)} mismatching frames"
+              + (f" (first: {mismatches[:10]})" if mismatches else ""))
+
+    if args.sweep:
+        parameter, first, last, steps = args.sweep
+        if parameter not in THRESHOLDS:
+            parser.error(f"Unknown threshold {parameter}")
+        values = np.linspace(float(first), float(last), int(steps))
+        start_time = time.perf_counter()
+        results = sweep(features, parameter, values, labels)
+        print(f"Swept {parameter} over {len(values)} values in {time.perf_counter() - start_time:.2f}s")
+        for value, groups in results.items():
+            for label, rates in groups.items():
+                print_rates(f"{parameter} = {value:.4g}" + (f", label {label}" if label else ""), rates)
+
+    return 1 if args.check and mismatches else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
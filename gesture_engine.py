@@ -0,0 +1,129 @@
+import time
+
+# Gesture states
+IDLE = 0      # Condition not met
+PENDING = 1   # Condition met, waiting for the hold time
+ACTIVE = 2    # Fired, until the keep condition ends
+
+class GestureSpec:
+    """
+    Declarative description of one discrete gesture.
+
+    The gesture enters when the `enter` feature is true and fires once it has
+    stayed true (or `keep`, when given) for `hold` seconds. It ends as soon
+    as the keep condition is false. At most one gesture per `group` can be
+    pending or active; earlier specs win and pre-empt later pending ones.
+
+    `on_enter`, `on_fire`, `on_hold` (every active frame after firing) and
+    `on_exit` name methods on the engine's action object, called with the
+    current features.
+    """
+    __slots__ = ('name', 'enter', 'keep', 'hold', 'group',
+                 'on_enter', 'on_fire', 'on_hold', 'on_exit')
+
+    def __init__(self, name, enter, keep=None, hold=0.0, group=None,
+                 on_enter=None, on_fire=None, on_hold=None, on_exit=None):
+        self.name = name
+        self.enter = enter
+        self.keep = keep or enter
+        self.hold = hold
+        self.group = group
+        self.on_enter = on_enter
+        self.on_fire = on_fire
+        self.on_hold = on_hold
+        self.on_exit = on_exit
+
+
+class GestureEngine:
+    """
+    Evaluates a table of GestureSpecs in one pass per frame.
+
+    State lives in fixed-size lists indexed like the table, so no attributes
+    are added or removed while running. `clock` returns seconds and can be
+    replaced to drive the engine from recorded or simulated time.
+    """
+    def __init__(self, specs, actions, clock=time.monotonic):
+        self.specs = tuple(specs)
+        self.clock = clock
+        size = len(self.specs)
+        self.state = [IDLE] * size
+        self.since = [0.0] * size
+        self.fired = [0] * size
+        self.owner = {}   # Group -> index of the gesture holding it
+
+        # Resolve action names once
+        def resolve(name):
+            return getattr(actions, name) if name else None
+        self._actions = [(resolve(spec.on_enter), resolve(spec.on_fire),
+                          resolve(spec.on_hold), resolve(spec.on_exit)) for spec in self.specs]
+        self.index = {spec.name: i for i, spec in enumerate(self.specs)}
+
+    def update(self, features, now=None):
+        """Advance every gesture by one frame of features"""
+        if now is None:
+            now = self.clock()
+
+        for i, spec in enumerate(self.specs):
+            state = self.state[i]
+            on_enter, on_fire, on_hold, _ = self._actions[i]
+
+            if state == IDLE:
+                if not features.get(spec.enter, False):
+                    continue
+                group = spec.group
+                if group is not None:
+                    owner = self.owner.get(group)
+                    if owner is not None:
+                        # Only a pending gesture of lower priority can be pre-empted
+                        if owner < i or self.state[owner] == ACTIVE:
+                            continue
+                        self._end(owner, features)
+                    self.owner[group] = i
+                self.state[i] = state = PENDING
+                self.since[i] = now
+                if on_enter:
+                    on_enter(features)
+
+            elif not features.get(spec.keep, False):
+                self._end(i, features)
+                continue
+
+            if state == PENDING:
+                if now - self.since[i] < spec.hold:
+                    continue
+                self.state[i] = ACTIVE
+                self.fired[i] += 1
+                if on_fire:
+                    on_fire(features)
+            elif on_hold:
+                on_hold(features)
+
+    def _end(self, i, features):
+        """Return a gesture to idle, running its exit action if it had fired"""
+        if self.state[i] == ACTIVE and self._actions[i][3]:
+            self._actions[i][3](features)
+        self.state[i] = IDLE
+        group = self.specs[i].group
+        if group is not None and self.owner.get(group) == i:
+            del self.owner[group]
+
+    def reset(self, features=None):
+        """End every gesture, e.g. when the hand is lost"""
+        for i in range(len(self.specs)):
+            if self.state[i] != IDLE:
+                self._end(i, features)
+
+    def started(self, name):
+        """When a pending or active gesture entered, or None when idle"""
+        i = self.index[name]
+        return self.since[i] if self.state[i] != IDLE else None
+
+    def is_active(self, name):
+        return self.state[self.index[name]] == ACTIVE
+
+    def is_pending(self, name):
+        return self.state[self.index[name]] == PENDING
+
+    def stats(self):
+        """Times each gesture fired"""
+        return {spec.name: self.fired[i] for i, spec in enumerate(self.specs)}
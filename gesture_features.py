@@ -0,0 +1,229 @@
+import math
+
+import numpy as np
+
+from landmarks import NUM_LANDMARKS
+
+# Landmark indices
+WRIST = 0
+THUMB_MCP, THUMB_IP, THUMB_TIP = 2, 3, 4
+INDEX_MCP, INDEX_PIP, INDEX_TIP = 5, 6, 8
+MIDDLE_MCP, MIDDLE_PIP, MIDDLE_TIP = 9, 10, 12
+RING_MCP, RING_PIP, RING_TIP = 13, 14, 16
+PINKY_MCP, PINKY_PIP, PINKY_TIP = 17, 18, 20
+
+FINGERS = ('thumb', 'index', 'middle', 'ring', 'pinky')
+FINGER_TIPS = (THUMB_TIP, INDEX_TIP, MIDDLE_TIP, RING_TIP, PINKY_TIP)
+# A finger is extended when its tip is well above this joint
+EXTENSION_JOINTS = (THUMB_IP, INDEX_PIP, MIDDLE_PIP, RING_PIP, PINKY_PIP)
+
+# Pairs of fingertips, in the order of the tip_distances feature
+TIP_PAIRS = tuple((a, b) for a in range(5) for b in range(a + 1, 5))
+THUMB_INDEX, THUMB_MIDDLE = TIP_PAIRS.index((0, 1)), TIP_PAIRS.index((0, 2))
+
+# Joint angles as (point, vertex, point): the index/middle spread measured at
+# the middle MCP, then the bend of each finger at its middle joint
+ANGLES = (
+    (INDEX_TIP, MIDDLE_MCP, MIDDLE_TIP),
+    (THUMB_MCP, THUMB_IP, THUMB_TIP),
+    (INDEX_MCP, INDEX_PIP, INDEX_TIP),
+    (MIDDLE_MCP, MIDDLE_PIP, MIDDLE_TIP),
+    (RING_MCP, RING_PIP, RING_TIP),
+    (PINKY_MCP, PINKY_PIP, PINKY_TIP),
+)
+SPREAD_ANGLE = 0
+
+# Landmarks whose positions are part of the features (used for drawing and scrolling)
+TRACKED_POINTS = (WRIST, THUMB_TIP, INDEX_TIP, MIDDLE_TIP)
+# Real-valued columns (positions and heights) ahead of the complex ones
+_NUM_REAL = 2 * len(TRACKED_POINTS) + 6
+
+EXTENSION_THRESHOLD = 0.05   # Normalized height a tip must rise above its joint
+V_SHAPE_ANGLE = 15.0         # Degrees between index and middle for a V shape
+
+def _feature_matrix():
+    """
+    Linear part of the features as one (63, columns) matrix for flattened (21, 3) landmarks.
+
+    Output columns: the (x, y) of the TRACKED_POINTS, the height of each
+    fingertip above its joint and of the index MCP above the wrist (image y
+    points down), then (x, y) pairs read as complex numbers: tip - tip for
+    each pair in TIP_PAIRS, the second arm of each angle, and the complex
+    conjugate of the first arm.
+    """
+    heights = [(joint, tip) for tip, joint in zip(FINGER_TIPS, EXTENSION_JOINTS)] + [(WRIST, INDEX_MCP)]
+    vectors = [(FINGER_TIPS[b], FINGER_TIPS[a]) for a, b in TIP_PAIRS]
+    vectors += [(b, vertex) for a, vertex, b in ANGLES]
+    conjugates = [(a, vertex) for a, vertex, b in ANGLES]
+
+    matrix = np.zeros((NUM_LANDMARKS, 3, _NUM_REAL + 2 * (len(vectors) + len(conjugates))),
+                      dtype=np.float32)
+    for i, landmark in enumerate(TRACKED_POINTS):
+        matrix[landmark, 0, 2 * i] = 1.0
+        matrix[landmark, 1, 2 * i + 1] = 1.0
+    for column, (head, tail) in enumerate(heights, 2 * len(TRACKED_POINTS)):
+        matrix[head, 1, column] += 1.0
+        matrix[tail, 1, column] -= 1.0
+    column = _NUM_REAL
+    for sign, pairs in ((1.0, vectors), (-1.0, conjugates)):
+        for head, tail in pairs:
+            matrix[head, 0, column] += 1.0
+            matrix[tail, 0, column] -= 1.0
+            matrix[head, 1, column + 1] += sign
+            matrix[tail, 1, column + 1] -= sign
+            column += 2
+    return matrix.reshape(NUM_LANDMARKS * 3, -1)
+
+
+FEATURE_MATRIX = _feature_matrix()
+_PAIR_VECTORS = slice(0, len(TIP_PAIRS))
+_SECOND_ARMS = slice(_PAIR_VECTORS.stop, _PAIR_VECTORS.stop + len(ANGLES))
+_FIRST_ARMS_CONJUGATE = slice(_SECOND_ARMS.stop, _SECOND_ARMS.stop + len(ANGLES))
+
+# Layout of the feature vector
+POSITIONS = slice(0, 2 * len(TRACKED_POINTS))  # x, y of each of the TRACKED_POINTS
+EXTENSION = slice(POSITIONS.stop, POSITIONS.stop + 5)  # Height of each fingertip above its joint
+FACING = EXTENSION.stop                    # Height of the index MCP above the wrist
+TIP_DISTANCES = slice(FACING + 1, FACING + 1 + len(TIP_PAIRS))  # Distance between each pair in TIP_PAIRS
+ANGLE_FEATURES = slice(TIP_DISTANCES.stop, TIP_DISTANCES.stop + len(ANGLES))  # Degrees, see ANGLES
+NUM_FEATURES = ANGLE_FEATURES.stop
+
+def compute_features(points, out=None):
+    """
+    Feature vectors for (..., 21, 3) float32 landmarks, over any leading dimensions.
+
+    See POSITIONS, EXTENSION, FACING, TIP_DISTANCES and ANGLE_FEATURES for the layout of
+    the last axis of the (..., NUM_FEATURES) result.
+    """
+    linear = np.matmul(points.reshape(points.shape[:-2] + (NUM_LANDMARKS * 3,)), FEATURE_MATRIX)
+    # The (x, y) pairs after the positions and heights are read as complex numbers x + iy,
+    # so lengths and angles are single ufunc calls
+    vectors = linear[..., _NUM_REAL:].view(np.complex64)
+    if out is None:
+        out = np.empty(linear.shape[:-1] + (NUM_FEATURES,), dtype=np.float32)
+
+    out[..., :_NUM_REAL] = linear[..., :_NUM_REAL]
+    np.abs(vectors[..., _PAIR_VECTORS], out=out[..., TIP_DISTANCES])
+
+    # Angle between the two arms of each joint: the argument of b * conj(a)
+    # (a zero-length arm gives a zero angle)
+    turns = vectors[..., _SECOND_ARMS] * vectors[..., _FIRST_ARMS_CONJUGATE]
+    angles = out[..., ANGLE_FEATURES]
+    np.arctan2(turns.imag, turns.real, out=angles)
+    np.abs(angles, out=angles)
+    np.degrees(angles, out=angles)
+    return out
+
+
+# Index pairs for frame_features: (tip, joint) of each height, then the fingertips of each TIP_PAIRS pair
+_HEIGHTS = tuple(zip(FINGER_TIPS, EXTENSION_JOINTS)) + ((INDEX_MCP, WRIST),)
+_TIP_PAIR_LANDMARKS = tuple((FINGER_TIPS[a], FINGER_TIPS[b]) for a, b in TIP_PAIRS)
+
+def frame_features(hand_landmarks):
+    """
+    Feature list for one hand's landmark list, in the layout of compute_features.
+
+    Computed in plain Python (double precision): for a single frame this is
+    about twice as fast as packing an array and running compute_features,
+    whose numpy call overhead outweighs the arithmetic.
+    """
+    xs, ys = [], []
+    for landmark in hand_landmarks.landmark:
+        xs.append(landmark.x)
+        ys.append(landmark.y)
+
+    hypot, atan2 = math.hypot, math.atan2
+    features = [value for i in TRACKED_POINTS for value in (xs[i], ys[i])]
+    features += [ys[joint] - ys[tip] for tip, joint in _HEIGHTS]
+    features += [hypot(xs[b] - xs[a], ys[b] - ys[a]) for a, b in _TIP_PAIR_LANDMARKS]
+    for a, vertex, b in ANGLES:
+        ax, ay = xs[a] - xs[vertex], ys[a] - ys[vertex]
+        bx, by = xs[b] - xs[vertex], ys[b] - ys[vertex]
+        features.append(abs(math.degrees(atan2(ax * by - ay * bx, ax * bx + ay * by))))
+    return features
+
+
+class GestureFeatures:
+    """
+    Per-frame gesture record: continuous features plus the derived gesture flags.
+
+    Supports `record['name']` and `record.get('name', default)` like the
+    dict `get_gesture` used to return.
+    """
+    __slots__ = ('extension', 'tip_distances', 'angles',
+                 'extended', 'extended_fingers', 'hand_facing_camera',
+                 'pointing_gesture', 'index_thumb_pinch', 'middle_thumb_pinch',
+                 'drag_gesture', 'two_finger_gesture', 'v_shape',
+                 'double_click_gesture', 'open_hand')
+
+    def __getitem__(self, name):
+        try:
+            return getattr(self, name)
+        except AttributeError:
+            raise KeyError(name) from None
+
+    def get(self, name, default=None):
+        return getattr(self, name, default)
+
+    def as_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__ if hasattr(self, name)}
+
+
+def classify(features, pinch_threshold=0.1, extension_threshold=EXTENSION_THRESHOLD,
+             v_shape_angle=V_SHAPE_ANGLE):
+    """Gesture record for one hand's feature vector (a list from frame_features or compute_features)"""
+    record = GestureFeatures()
+    record.extension = extension = features[EXTENSION]
+    record.tip_distances = tip_distances = features[TIP_DISTANCES]
+    record.angles = angles = features[ANGLE_FEATURES]
+
+    thumb, index, middle, ring, pinky = extended = [height > extension_threshold for height in extension]
+    record.extended = extended
+    record.extended_fingers = sum(extended)
+    record.hand_facing_camera = features[FACING] > 0
+
+    # Point with the index finger: moves the cursor
+    record.pointing_gesture = index and not middle and not ring and not pinky
+    # Thumb pinched against the index (left click) or middle finger (right click)
+    record.index_thumb_pinch = tip_distances[THUMB_INDEX] < pinch_threshold
+    record.middle_thumb_pinch = tip_distances[THUMB_MIDDLE] < pinch_threshold
+    # Pinch and hold while pointing: drag
+    record.drag_gesture = record.index_thumb_pinch and record.pointing_gesture
+    # Index and middle raised: spread apart to scroll, held together to double click
+    record.two_finger_gesture = index and middle and not ring and not pinky
+    spread = angles[SPREAD_ANGLE]
+    record.v_shape = record.two_finger_gesture and spread > v_shape_angle
+    record.double_click_gesture = record.two_finger_gesture and spread < v_shape_angle
+    record.open_hand = thumb and index and middle and ring and pinky
+    return record
+
+
+# Columns of the classify_batch flag matrix
+GESTURE_FLAGS = ('hand_facing_camera', 'pointing_gesture', 'index_thumb_pinch', 'middle_thumb_pinch',
+                 'drag_gesture', 'two_finger_gesture', 'v_shape', 'double_click_gesture', 'open_hand')
+
+def classify_batch(features, pinch_threshold=0.1, extension_threshold=EXTENSION_THRESHOLD,
+                   v_shape_angle=V_SHAPE_ANGLE):
+    """
+    The rules of `classify` over an (N, NUM_FEATURES) feature matrix.
+
+    Returns an (N, len(GESTURE_FLAGS)) boolean matrix.
+    """
+    extended = features[:, EXTENSION] > extension_threshold
+    thumb, index, middle, ring, pinky = extended.T
+    tip_distances = features[:, TIP_DISTANCES]
+    spread = features[:, ANGLE_FEATURES.start + SPREAD_ANGLE]
+
+    flags = np.empty((len(features), len(GESTURE_FLAGS)), dtype=bool)
+    facing, pointing, index_pinch, middle_pinch, drag, two_finger, v_shape, double_click, open_hand = flags.T
+    np.greater(features[:, FACING], 0, out=facing)
+    lower_fingers_down = ~(ring | pinky)
+    np.logical_and(index, ~middle & lower_fingers_down, out=pointing)
+    np.less(tip_distances[:, THUMB_INDEX], pinch_threshold, out=index_pinch)
+    np.less(tip_distances[:, THUMB_MIDDLE], pinch_threshold, out=middle_pinch)
+    np.logical_and(index_pinch, pointing, out=drag)
+    np.logical_and(index & middle, lower_fingers_down, out=two_finger)
+    np.logical_and(two_finger, spread > v_shape_angle, out=v_shape)
+    np.logical_and(two_finger, spread < v_shape_angle, out=double_click)
+    np.all(extended, axis=1, out=open_hand)
+    return flags
@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+NoMouse - Learned gesture classifier
+An optional replacement for the hand-written pose rules, trained from
+labeled sessions recorded with landmark_sources.py:
+
+    python3 landmark_sources.py record point.npz --label point --seconds 20
+    python3 gesture_model.py train model.npz point.npz pinch.npz none.npz --augment 4
+    python3 gesture_model.py evaluate model.npz test.npz
+
+Session labels name poses in POSE_FLAGS. The model is a linear softmax
+classifier over landmarks normalized to the hand (translated to the wrist,
+rotated upright and scaled to the palm), so unlike the rules it still
+recognizes tilted hands and hands far from the camera.
+"""
+
+import argparse
+import sys
+import time
+
+import numpy as np
+
+from gesture_batch import batch_features, load_session
+from gesture_features import GESTURE_FLAGS, MIDDLE_MCP, WRIST, classify_batch
+from landmarks import NUM_LANDMARKS
+
+# Gesture flags raised by each pose label; any other label raises none
+POSE_FLAGS = {
+    'none': (),
+    'point': ('pointing_gesture',),
+    'pinch': ('index_thumb_pinch',),
+    'drag': ('pointing_gesture', 'index_thumb_pinch', 'drag_gesture'),
+    'right_pinch': ('middle_thumb_pinch',),
+    'v_scroll': ('two_finger_gesture', 'v_shape'),
+    'two_finger': ('two_finger_gesture', 'double_click_gesture'),
+    'open': ('open_hand',),
+}
+
+# Flags the model decides; hand_facing_camera still comes from the rules
+MODEL_FLAGS = tuple(name for name in GESTURE_FLAGS if name != 'hand_facing_camera')
+
+def normalize(points):
+    """
+    Landmarks relative to the hand: (..., 21, 3) -> (..., 63) float32.
+
+    Positions are translated to the wrist, rotated so the middle finger MCP
+    points straight up and scaled so it is one unit away. The layout is the
+    21 x values, then the 21 y values, then the 21 z values.
+    """
+    points = np.asarray(points, dtype=np.float32)
+    positions = points[..., 0] + 1j * points[..., 1]
+    positions = positions - positions[..., WRIST, np.newaxis]
+    palm = positions[..., MIDDLE_MCP, np.newaxis]
+    palm = np.where(palm == 0, 1, palm)
+    # Dividing by the palm vector rotates and scales in one step; -1j turns it upright
+    # (image y points down)
+    upright = positions * (-1j / palm)
+    depth = (points[..., 2] - points[..., WRIST, np.newaxis, 2]) / np.abs(palm)
+    return np.concatenate([upright.real, upright.imag, depth], axis=-1).astype(np.float32)
+
+
+def augment(points, copies, seed=0, max_rotation=45.0, scale_range=(0.5, 1.2), max_shift=0.15):
+    """
+    Tilted, scaled and shifted copies of (N, 21, 3) hands, as if held at
+    other angles and distances from the camera. Returns (N * copies, 21, 3).
+    """
+    rng = np.random.default_rng(seed)
+    points = np.repeat(np.asarray(points, dtype=np.float32), copies, axis=0)
+    count = len(points)
+    turns = np.exp(1j * np.radians(rng.uniform(-max_rotation, max_rotation, count)))
+    scales = rng.uniform(*scale_range, count)
+    shifts = rng.uniform(-max_shift, max_shift, (count, 2))
+
+    wrists = points[:, WRIST, np.newaxis, :2]
+    relative = points[..., :2] - wrists
+    moved = (relative[..., 0] + 1j * relative[..., 1]) * (turns * scales)[:, np.newaxis]
+    points[..., 0] = moved.real + wrists[..., 0] + shifts[:, np.newaxis, 0]
+    points[..., 1] = moved.imag + wrists[..., 1] + shifts[:, np.newaxis, 1]
+    points[..., 2] *= scales[:, np.newaxis]
+    return points
+
+
+def labels_from_flags(flags, classes):
+    """
+    Pose label matching each row of a classify_batch flag matrix exactly,
+    or '' when the rules raised a combination no label has.
+    """
+    columns = [GESTURE_FLAGS.index(name) for name in MODEL_FLAGS]
+    flags = flags[:, columns]
+    labels = np.full(len(flags), '', dtype=object)
+    for label in classes:
+        expected = np.array([name in POSE_FLAGS.get(label, ()) for name in MODEL_FLAGS])
+        labels[(flags == expected).all(axis=1)] = label
+    return labels
+
+
+class GestureModel:
+    """
+    Linear softmax classifier over normalized landmarks (see normalize).
+
+    `weights` is (63, classes) and `bias` (classes,). Predictions below
+    `min_confidence` count as 'none', so an unsure model never clicks.
+    """
+    def __init__(self, classes, weights, bias, min_confidence=0.0):
+        self.classes = [str(label) for label in classes]
+        self.weights = np.asarray(weights, dtype=np.float32)
+        self.bias = np.asarray(bias, dtype=np.float32)
+        self.min_confidence = min_confidence
+
+        # Flag values set by each class, in MODEL_FLAGS order
+        self._flag_values = [tuple(name in POSE_FLAGS.get(label, ()) for name in MODEL_FLAGS)
+                             for label in self.classes]
+        self._none_flags = (False,) * len(MODEL_FLAGS)
+
+        # normalize() folded into the weights for single frames: with d the
+        # landmarks relative to the wrist and c = -1j / palm, the logits are
+        #   Re(c) * (dx.Wx + dy.Wy) + Im(c) * (dx.Wy - dy.Wx) + (dz.Wz) / |palm| + bias
+        # The palm vector and the three dot products are linear in the raw
+        # landmarks, so one matmul gives them all
+        classes_count = len(self.classes)
+        wx, wy, wz = self.weights.reshape(3, NUM_LANDMARKS, classes_count)
+        products = np.zeros((NUM_LANDMARKS, 3, 3, classes_count), dtype=np.float32)
+        products[:, 0, 0], products[:, 1, 0] = wx, wy
+        products[:, 0, 1], products[:, 1, 1] = wy, -wx
+        products[:, 2, 2] = wz
+        palm = np.zeros((NUM_LANDMARKS, 3, 2), dtype=np.float32)
+        palm[MIDDLE_MCP, :2] = np.eye(2)
+        matrix = np.concatenate([palm, products.reshape(NUM_LANDMARKS, 3, -1)], axis=-1)
+        matrix[WRIST] -= matrix.sum(axis=0)
+        self._matrix = matrix.reshape(NUM_LANDMARKS * 3, -1)
+
+        # Matmul output, followed by the bias so the logits are one dot product
+        # of (Re(c), Im(c), 1 / |palm|, 1) with the rows after the palm vector
+        self._linear = np.empty(self._matrix.shape[1] + classes_count, dtype=np.float32)
+        self._linear[self._matrix.shape[1]:] = self.bias
+        self._products = self._linear[2:].reshape(4, classes_count)
+        self._coefficients = np.ones(4, dtype=np.float32)
+
+    def predict(self, points):
+        """Class index for one (21, 3) float32 hand, or None below min_confidence"""
+        linear = self._linear
+        np.dot(points.reshape(-1), self._matrix, out=linear[:self._matrix.shape[1]])
+        palm = complex(linear[0], linear[1])
+        if palm == 0:
+            return None
+        rotation = -1j / palm
+        coefficients = self._coefficients
+        coefficients[0], coefficients[1], coefficients[2] = rotation.real, rotation.imag, 1.0 / abs(palm)
+
+        logits = np.dot(coefficients, self._products)
+        index = int(logits.argmax())
+        if self.min_confidence > 0:
+            # Softmax probability of the winning class
+            logits -= logits[index]
+            if 1.0 / float(np.exp(logits).sum()) < self.min_confidence:
+                return None
+        return index
+
+    def apply(self, points, record):
+        """Replace the pose flags of a gesture_features.classify record with the prediction"""
+        index = self.predict(points)
+        values = self._none_flags if index is None else self._flag_values[index]
+        for name, value in zip(MODEL_FLAGS, values):
+            setattr(record, name, value)
+        return record
+
+    def probabilities(self, points):
+        """(N, classes) class probabilities for (N, 21, 3) hands"""
+        logits = normalize(points) @ self.weights + self.bias
+        logits -= logits.max(axis=-1, keepdims=True)
+        probabilities = np.exp(logits)
+        probabilities /= probabilities.sum(axis=-1, keepdims=True)
+        return probabilities
+
+    def predict_batch(self, points):
+        """(N,) predicted labels for (N, 21, 3) hands, 'none' below min_confidence"""
+        probabilities = self.probabilities(points)
+        labels = np.array(self.classes, dtype=object)[probabilities.argmax(axis=-1)]
+        labels[probabilities.max(axis=-1) < self.min_confidence] = 'none'
+        return labels
+
+    def save(self, path):
+        np.savez_compressed(path, classes=np.array(self.classes), weights=self.weights, bias=self.bias)
+
+    @classmethod
+    def load(cls, path, min_confidence=0.0):
+        with np.load(path) as data:
+            return cls(data['classes'], data['weights'], data['bias'], min_confidence)
+
+
+def train(points, labels, iterations=500, learning_rate=0.5, l2=1e-4):
+    """
+    Fit a GestureModel to (N, 21, 3) hands and their (N,) labels with
+    full-batch gradient descent on the class-balanced cross-entropy.
+    """
+    classes = np.unique(labels)
+    targets = np.searchsorted(classes, labels)
+    features = normalize(points)
+    mean = features.mean(axis=0)
+    std = features.std(axis=0) + 1e-6
+    features = (features - mean) / std
+
+    one_hot = np.eye(len(classes), dtype=np.float32)[targets]
+    counts = np.bincount(targets, minlength=len(classes))
+    sample_weights = (1.0 / (len(classes) * counts))[targets][:, np.newaxis].astype(np.float32)
+
+    weights = np.zeros((features.shape[1], len(classes)), dtype=np.float32)
+    bias = np.zeros(len(classes), dtype=np.float32)
+    for _ in range(iterations):
+        logits = features @ weights + bias
+        logits -= logits.max(axis=1, keepdims=True)
+        probabilities = np.exp(logits)
+        probabilities /= probabilities.sum(axis=1, keepdims=True)
+        gradient = (probabilities - one_hot) * sample_weights
+        weights -= learning_rate * (features.T @ gradient + l2 * weights)
+        bias -= learning_rate * gradient.sum(axis=0)
+
+    # Fold the standardization into the weights so inference skips it
+    weights /= std[:, np.newaxis]
+    bias -= mean @ weights
+    return GestureModel(classes, weights, bias)
+
+
+def load_labeled(paths):
+    """Landmarks and labels of the labeled frames with a hand from session files"""
+    points, labels = [], []
+    for path in paths:
+        session_points, session_labels = load_session(path)
+        if session_labels is None:
+            raise ValueError(f"{path} has no labels (record it with --label)")
+        labeled = session_labels != ''
+        points.append(session_points[labeled])
+        labels.append(session_labels[labeled].astype(str))
+    return np.concatenate(points), np.concatenate(labels)
+
+
+def print_accuracy(model, points, labels):
+    """Per-label accuracy of the model and of the gesture rules"""
+    predicted = model.predict_batch(points)
+    ruled = labels_from_flags(classify_batch(batch_features(points)), model.classes)
+    print(f"  {'label':<14} {'frames':>8} {'model':>8} {'rules':>8}")
+    for label in [None] + sorted(set(labels)):
+        rows = slice(None) if label is None else labels == label
+        count = len(labels) if label is None else int(rows.sum())
+        print(f"  {label or 'all':<14} {count:8d} {np.mean(predicted[rows] == labels[rows]) * 100:7.1f}%"
+              f" {np.mean(ruled[rows] == labels[rows]) * 100:7.1f}%")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Train and evaluate the learned gesture classifier")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    train_parser = commands.add_parser('train', help="Train a model from labeled sessions")
+    train_parser.add_argument('model', help="Output .npz (the app loads assets/gesture_model.npz by default)")
+    train_parser.add_argument('sessions', nargs='+')
+    train_parser.add_argument('--augment', type=int, default=0,
+                              help="Add this many tilted/scaled copies of every frame")
+    train_parser.add_argument('--iterations', type=int, default=500)
+
+    evaluate_parser = commands.add_parser('evaluate', help="Compare a model with the rules on labeled sessions")
+    evaluate_parser.add_argument('model')
+    evaluate_parser.add_argument('sessions', nargs='+')
+
+    args = parser.parse_args()
+    try:
+        points, labels = load_labeled(args.sessions)
+    except ValueError as e:
+        parser.error(str(e))
+
+    if args.command == 'evaluate':
+        print_accuracy(GestureModel.load(args.model), points, labels)
+        return 0
+
+    unknown = sorted(set(labels) - set(POSE_FLAGS))
+    if unknown:
+        print(f"Labels without gesture flags (treated like 'none'): {', '.join(unknown)}")
+    training_points, training_labels = points, labels
+    if args.augment:
+        training_points = np.concatenate([points, augment(points, args.augment)])
+        training_labels = np.concatenate([labels, np.repeat(labels, args.augment)])
+
+    start_time = time.perf_counter()
+    model = train(training_points, training_labels, iterations=args.iterations)
+    print(f"Trained on {len(training_points)} frames ({', '.join(model.classes)}) "
+          f"in {time.perf_counter() - start_time:.1f}s")
+    print_accuracy(model, points, labels)
+    model.save(args.model)
+    print(f"Saved model to {args.model}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
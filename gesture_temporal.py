@@ -0,0 +1,210 @@
+import numpy as np
+
+from gesture_features import THUMB_INDEX
+
+# Channels of the feature ring buffer
+TIME, X, Y, PINCH_DISTANCE = range(4)
+NUM_CHANNELS = 4
+
+# Poses the time-based patterns look at
+NO_POSE, PINCH_POSE, ZOOM_POSE, SWIPE_POSE, FLICK_POSE = range(5)
+
+# Seconds and normalized distances; the same keys are used in Settings
+DEFAULT_WINDOWS = {
+    'double_pinch_window': 0.5,   # Most seconds from the first pinch to the second
+    'zoom_step': 0.03,            # Change in thumb-index distance per zoom notch
+    'zoom_range': 0.2,            # Opening past the starting pinch that ends the zoom
+    'swipe_window': 0.4,          # Seconds a swipe may take
+    'swipe_distance': 0.25,       # Horizontal travel of an open hand that counts as a swipe
+    'flick_window': 0.15,         # Seconds a flick may take
+    'flick_distance': 0.12,       # Vertical travel of the V shape that counts as a flick
+    'temporal_cooldown': 0.5      # Seconds after a swipe or flick before the next one
+}
+
+class TemporalRecognizer:
+    """
+    Detects gestures defined by timing rather than a single pose:
+
+    - double pinch: two quick index+thumb pinches within double_pinch_window
+    - pinch-spread zoom: pinch index+thumb with the other fingers raised,
+      then opening or closing the gap zooms by one notch per zoom_step,
+      until it opens more than zoom_range past where it started
+    - swipe: an open hand travelling swipe_distance sideways within swipe_window
+    - flick: the V shape travelling flick_distance up or down within flick_window
+
+    Per-frame features go into a preallocated ring buffer. Pinches are
+    tracked by their edges, and the swipe/flick windows by a tail index
+    that only moves forward, so every frame costs O(1).
+
+    A quick pinch could be the first half of a double pinch, so its click
+    is held back: the pinch flag is cleared for GestureEngine, and the
+    recognizer clicks itself, at the cursor position the pinch started at,
+    once double_pinch_window passes without a second pinch or the history
+    is reset. Pinches held longer than that are left to GestureEngine, as
+    are pinches while pointing (drags).
+
+    Actions are methods on `actions`, like GestureEngine's:
+    click_at(state, cursor) with the held-back pinch's cursor position
+    (state is None when flushed by reset()), double_click(state),
+    zoom(state, notches), swipe(state, direction) with
+    direction -1 (left) or 1 (right), and flick(state, direction) with -1
+    (up) or 1 (down).
+    """
+    def __init__(self, actions, windows=None, capacity=256):
+        self.windows = dict(DEFAULT_WINDOWS)
+        self.configure(windows or {})
+        self.buffer = np.zeros((capacity, NUM_CHANNELS), dtype=np.float64)
+        self.capacity = capacity
+        self._click_at = actions.click_at
+        self._double_click = actions.double_click
+        self._zoom = actions.zoom
+        self._swipe = actions.swipe
+        self._flick = actions.flick
+        self.fired = {'pinch_click': 0, 'double_pinch': 0, 'zoom': 0, 'swipe': 0, 'flick': 0}
+        self.pose = NO_POSE
+        self.last_tap = None
+        self.reset()
+
+    def configure(self, windows):
+        """Update time windows and distances (keys of DEFAULT_WINDOWS)"""
+        self.windows.update({key: windows[key] for key in DEFAULT_WINDOWS if key in windows})
+
+    def reset(self):
+        """Forget the history, e.g. when the hand is lost, clicking a held-back pinch first"""
+        if self.pose == PINCH_POSE and self.pinch_held_back and self.pinch_start is not None:
+            # Lost while pinching: the pinch ends here, as a tap
+            self.last_tap, self.tap_cursor = self.pinch_start, self.pinch_cursor
+        if self.last_tap is not None:
+            self._tap_click(None)
+        self.count = 0          # Frames pushed; the newest is at (count - 1) % capacity
+        self.pose = NO_POSE
+        self.pose_start = 0     # Frame number where the current pose began
+        self.tail = 0           # Oldest frame inside the swipe/flick window
+        self.pinch_start = None
+        self.pinch_cursor = None      # Cursor position where the current pinch started
+        self.pinch_held_back = False  # The current pinch is hidden from GestureEngine
+        self.last_tap = None    # Start time of the last quick pinch, whose click is pending
+        self.tap_cursor = None  # and the cursor position to click at
+        self.zoom_origin = None
+        self.zoom_reference = None
+        self.cooldown = float('-inf')
+
+    def update(self, now, gesture_state, x, y, cursor=None):
+        """
+        Add one frame (the hand at normalized x, y, the cursor at screen
+        position `cursor`) and fire any completed pattern.
+
+        While the zoom pose is held, or a quick pinch may still become a
+        double pinch, the pinch flags are cleared on `gesture_state`, so
+        GestureEngine does not click or drag.
+        """
+        windows = self.windows
+        frame = self.count
+        row = self.buffer[frame % self.capacity]
+        row[TIME], row[X], row[Y] = now, x, y
+        row[PINCH_DISTANCE] = distance = gesture_state.tip_distances[THUMB_INDEX]
+        self.count = frame + 1
+
+        # A tap with no second pinch in time was a single click
+        if self.last_tap is not None and now - self.last_tap > windows['double_pinch_window']:
+            self._tap_click(gesture_state)
+
+        pose = self.frame_pose(gesture_state)
+        if pose != self.pose:
+            self._pose_changed(now, pose, frame, gesture_state, cursor)
+
+        if pose == PINCH_POSE and self.pinch_held_back:
+            if self.pinch_start is not None and now - self.pinch_start > windows['double_pinch_window']:
+                # Held too long for a tap: from now on GestureEngine clicks as usual
+                self.pinch_held_back = False
+            else:
+                gesture_state.index_thumb_pinch = False
+
+        elif pose == ZOOM_POSE:
+            gesture_state.index_thumb_pinch = gesture_state.drag_gesture = False
+            notches = int((distance - self.zoom_reference) / windows['zoom_step'])
+            if notches:
+                self.zoom_reference += notches * windows['zoom_step']
+                self.fired['zoom'] += 1
+                self._zoom(gesture_state, notches)
+
+        elif pose == SWIPE_POSE or pose == FLICK_POSE:
+            window = windows['swipe_window'] if pose == SWIPE_POSE else windows['flick_window']
+            # Slide the window start forward, never past the start of this pose
+            # or out of the buffer
+            tail = max(self.tail, self.pose_start, self.count - self.capacity)
+            while self.buffer[tail % self.capacity, TIME] < now - window:
+                tail += 1
+            self.tail = tail
+
+            if now >= self.cooldown:
+                start = self.buffer[tail % self.capacity]
+                dx, dy = x - start[X], y - start[Y]
+                if pose == SWIPE_POSE and abs(dx) >= windows['swipe_distance'] and abs(dx) > 2 * abs(dy):
+                    self._fired('swipe', now)
+                    self._swipe(gesture_state, 1 if dx > 0 else -1)
+                elif pose == FLICK_POSE and abs(dy) >= windows['flick_distance'] and abs(dy) > 2 * abs(dx):
+                    self._fired('flick', now)
+                    self._flick(gesture_state, 1 if dy > 0 else -1)
+
+    def frame_pose(self, gesture_state):
+        """The pose of one frame's gesture record, as far as the patterns care"""
+        thumb, index, middle, ring, pinky = gesture_state.extended
+        if middle and ring and pinky:
+            # Entered with an OK-sign pinch, and kept while the thumb and index
+            # open up to zoom_range past where they started
+            if self.pose == ZOOM_POSE:
+                if gesture_state.tip_distances[THUMB_INDEX] <= self.zoom_origin + self.windows['zoom_range']:
+                    return ZOOM_POSE
+            elif gesture_state.index_thumb_pinch:
+                return ZOOM_POSE
+        if gesture_state.open_hand:
+            return SWIPE_POSE
+        if gesture_state.two_finger_gesture:
+            return FLICK_POSE
+        if gesture_state.index_thumb_pinch and not gesture_state.drag_gesture:
+            return PINCH_POSE
+        return NO_POSE
+
+    def _tap_click(self, gesture_state):
+        """Click for a held-back tap, where the cursor was when it was pinched"""
+        self.last_tap = None
+        self.fired['pinch_click'] += 1
+        self._click_at(gesture_state, self.tap_cursor)
+
+    def _pose_changed(self, now, pose, frame, gesture_state, cursor):
+        """Track pinch edges and restart the windows of the new pose"""
+        if self.pose == PINCH_POSE and self.pinch_start is not None:
+            # Pinch released: a quick one is a tap, the first half of a double pinch
+            if now - self.pinch_start <= self.windows['double_pinch_window']:
+                self.last_tap = self.pinch_start
+                self.tap_cursor = self.pinch_cursor
+        if pose == PINCH_POSE:
+            # Hidden from GestureEngine until it is known whether it was a tap
+            self.pinch_held_back = True
+            if self.last_tap is not None and now - self.last_tap <= self.windows['double_pinch_window']:
+                self.last_tap = None
+                self.pinch_start = None
+                self.fired['double_pinch'] += 1
+                self._double_click(gesture_state)
+            else:
+                self.pinch_start = now
+                self.pinch_cursor = cursor
+        else:
+            self.pinch_held_back = False
+        if pose == ZOOM_POSE:
+            self.zoom_origin = self.zoom_reference = float(self.buffer[frame % self.capacity, PINCH_DISTANCE])
+
+        self.pose = pose
+        self.pose_start = frame
+        self.tail = frame
+
+    def _fired(self, name, now):
+        self.fired[name] += 1
+        self.cooldown = now + self.windows['temporal_cooldown']
+        # The next swipe or flick needs a fresh stroke
+        self.pose_start = self.tail = self.count - 1
+
+    def stats(self):
+        """Times each pattern fired"""
+        return dict(self.fired)
@@ -0,0 +1,97 @@
+import time
+
+import cv2
+import numpy as np
+
+from landmarks import HAND_CONNECTIONS, NUM_LANDMARKS, landmarks_to_array
+
+# Landmark colors per finger, matching mediapipe's default hand style (RGB)
+PALM_COLOR = (255, 48, 48)
+FINGER_COLORS = [
+    ((1, 2, 3, 4), (255, 229, 180)),       # Thumb
+    ((6, 7, 8), (128, 64, 128)),           # Index
+    ((10, 11, 12), (255, 204, 0)),         # Middle
+    ((14, 15, 16), (48, 255, 48)),         # Ring
+    ((18, 19, 20), (21, 101, 192)),        # Pinky
+]
+CONNECTION_COLOR = (224, 224, 224)
+OUTLINE_COLOR = (255, 255, 255)
+
+# Quality levels, dropped one at a time while drawing runs over budget
+QUALITY_FULL = 0      # Outlined joints
+QUALITY_FAST = 1      # Plain joints
+QUALITY_MINIMAL = 2   # Connections only
+
+class HandRenderer:
+    """
+    NumPy/OpenCV hand skeleton renderer.
+
+    Landmarks are turned into one (21, 2) pixel array per frame. All 21
+    connections are drawn with a single cv2.polylines call over the
+    (21, 2, 2) segment array, and joints are drawn in batches (one call per
+    color) as zero-length thick polylines, which OpenCV renders as dots.
+
+    When drawing takes longer than `budget_ms` the renderer steps down in
+    quality, and steps back up once it is comfortably within budget again.
+    """
+    def __init__(self, budget_ms=1.0, line_thickness=2, joint_radius=4):
+        self.budget = budget_ms / 1000.0
+        self.line_thickness = line_thickness
+        self.joint_radius = joint_radius
+        self.quality = QUALITY_FULL
+
+        self.connections = np.array(sorted(HAND_CONNECTIONS), dtype=np.intp)
+        palm = [i for i in range(NUM_LANDMARKS) if not any(i in ids for ids, _ in FINGER_COLORS)]
+        self.joint_groups = [(np.array(palm, dtype=np.intp), PALM_COLOR)] + [
+            (np.array(ids, dtype=np.intp), color) for ids, color in FINGER_COLORS
+        ]
+
+        # Preallocated per-frame buffers
+        self._points = np.empty((NUM_LANDMARKS, 3), dtype=np.float32)
+        self._pixels = np.empty((NUM_LANDMARKS, 2), dtype=np.int32)
+        self._joints = np.empty((NUM_LANDMARKS, 2, 2), dtype=np.int32)
+
+        # Statistics
+        self.draw_time = 0.0   # Smoothed seconds per draw
+        self.over_budget = 0
+
+    def to_pixels(self, hand_landmarks, frame_shape):
+        """Convert landmarks to a (21, 2) int32 pixel array"""
+        frame_height, frame_width = frame_shape[:2]
+        points = landmarks_to_array(hand_landmarks, self._points)
+        np.multiply(points[:, :2], (frame_width, frame_height), out=points[:, :2])
+        self._pixels[...] = points[:, :2]
+        return self._pixels
+
+    def draw(self, frame, hand_landmarks):
+        start_time = time.perf_counter()
+
+        pixels = self.to_pixels(hand_landmarks, frame.shape)
+
+        # All connections in one call
+        cv2.polylines(frame, pixels[self.connections], False, CONNECTION_COLOR,
+                      self.line_thickness)
+
+        if self.quality < QUALITY_MINIMAL:
+            # Joints as zero-length segments, one call per color
+            self._joints[:, 0] = pixels
+            self._joints[:, 1] = pixels
+            if self.quality == QUALITY_FULL:
+                cv2.polylines(frame, self._joints, False, OUTLINE_COLOR,
+                              2 * self.joint_radius + 3)
+            for ids, color in self.joint_groups:
+                cv2.polylines(frame, self._joints[ids], False, color,
+                              2 * self.joint_radius)
+
+        self._update_quality(time.perf_counter() - start_time)
+
+    def _update_quality(self, elapsed):
+        self.draw_time += 0.1 * (elapsed - self.draw_time)
+        if elapsed > self.budget:
+            self.over_budget += 1
+        if self.draw_time > self.budget and self.quality < QUALITY_MINIMAL:
+            self.quality += 1
+            # Restart the average midway so the next level gets a fair trial
+            self.draw_time = 0.5 * self.budget
+        elif self.draw_time < 0.25 * self.budget and self.quality > QUALITY_FULL:
+            self.quality -= 1
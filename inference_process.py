@@ -0,0 +1,161 @@
+import multiprocessing as mp_proc
+import queue
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from landmarks import NUM_LANDMARKS, results_from_array, results_to_array
+
+def _inference_worker(requests, responses, hands_options):
+    """Worker process: read frames from shared memory and run MediaPipe Hands"""
+    import mediapipe as mp
+
+    hands = mp.solutions.hands.Hands(**hands_options)
+    segments = {}
+
+    while True:
+        request = requests.get()
+        if request is None:
+            break
+
+        seq, name, slot, slot_size, shape = request
+        shm = segments.get(name)
+        if shm is None:
+            # The parent re-created the ring (e.g. resolution change)
+            for old in segments.values():
+                old.close()
+            # Spawned workers share the parent's resource tracker, which
+            # unlinks the segment once the parent releases it
+            segments = {name: shared_memory.SharedMemory(name=name)}
+            shm = segments[name]
+
+        frame = np.ndarray(shape, dtype=np.uint8, buffer=shm.buf, offset=slot * slot_size)
+        hands_array = results_to_array(hands.process(frame))
+        del frame
+
+        # Only the compact (num_hands, 21, 3) landmark array travels back
+        responses.put((seq, slot, hands_array))
+
+    for shm in segments.values():
+        shm.close()
+    hands.close()
+
+
+class ProcessLandmarker:
+    """
+    Runs MediaPipe Hands in a separate process.
+
+    Frames are copied into a ring of shared memory slots instead of being
+    pickled, and only landmark arrays come back, so hand tracking no longer
+    competes with the GUI and gesture logic for the GIL.
+
+    `process()` mirrors `Hands.process()`. `submit()`/`poll()` allow keeping
+    several frames in flight; frames are dropped when every slot is busy.
+    """
+    def __init__(self, slots=3, timeout=1.0, **hands_options):
+        self.num_slots = slots
+        self.timeout = timeout
+
+        context = mp_proc.get_context('spawn')
+        self._requests = context.Queue()
+        self._responses = context.Queue()
+        self._worker = context.Process(
+            target=_inference_worker,
+            args=(self._requests, self._responses, hands_options),
+            name='NoMouseInference',
+            daemon=True)
+        self._worker.start()
+
+        self._shm = None
+        self._slot_size = 0
+        self._free_slots = []
+        self._seq = 0
+        self.latest = None   # (seq, HandResults) of the newest completed frame
+
+        # Statistics
+        self.submitted = 0
+        self.completed = 0
+        self.dropped = 0
+
+    def _ensure_ring(self, shape):
+        """(Re)allocate the shared memory ring if frames of this shape don't fit"""
+        frame_size = shape[0] * shape[1] * shape[2]
+        if self._shm is not None and frame_size <= self._slot_size:
+            return
+
+        # Wait for in-flight frames before releasing the old ring
+        while self._shm is not None and len(self._free_slots) < self.num_slots:
+            if not self._collect(self.timeout):
+                break
+        self._release_ring()
+
+        self._slot_size = frame_size
+        self._shm = shared_memory.SharedMemory(create=True, size=frame_size * self.num_slots)
+        self._free_slots = list(range(self.num_slots))
+
+    def _release_ring(self):
+        if self._shm is None:
+            return
+        self._shm.close()
+        self._shm.unlink()
+        self._shm = None
+        self._slot_size = 0
+
+    def _collect(self, timeout):
+        """Receive one finished frame from the worker. Returns False on timeout."""
+        try:
+            seq, slot, hands_array = self._responses.get(timeout=timeout)
+        except queue.Empty:
+            return False
+
+        self._free_slots.append(slot)
+        self.completed += 1
+        if self.latest is None or seq > self.latest[0]:
+            self.latest = (seq, results_from_array(hands_array))
+        return True
+
+    def submit(self, rgb_frame):
+        """Queue a frame for inference. Returns its sequence number, or None if dropped."""
+        self._ensure_ring(rgb_frame.shape)
+
+        # Pick up whatever finished meanwhile to free slots
+        while self._collect(0):
+            pass
+        if not self._free_slots:
+            self.dropped += 1
+            return None
+
+        slot = self._free_slots.pop()
+        shape = rgb_frame.shape
+        view = np.ndarray(shape, dtype=np.uint8, buffer=self._shm.buf, offset=slot * self._slot_size)
+        view[...] = rgb_frame
+        del view
+        self._seq += 1
+        self._requests.put((self._seq, self._shm.name, slot, self._slot_size, shape))
+        self.submitted += 1
+        return self._seq
+
+    def poll(self, timeout=0):
+        """Get the newest completed results (or None if nothing finished yet)"""
+        while self._collect(timeout):
+            timeout = 0
+        return self.latest[1] if self.latest else None
+
+    def process(self, rgb_frame):
+        """Run inference on one frame and wait for its landmarks"""
+        seq = self.submit(rgb_frame)
+        if seq is not None:
+            while self.latest is None or self.latest[0] < seq:
+                if not self._collect(self.timeout):
+                    break
+        return self.latest[1] if self.latest else results_from_array(
+            np.empty((0, NUM_LANDMARKS, 3), dtype=np.float32))
+
+    def close(self):
+        """Stop the worker and release shared memory"""
+        if self._worker.is_alive():
+            self._requests.put(None)
+            self._worker.join(self.timeout)
+            if self._worker.is_alive():
+                self._worker.terminate()
+        self._release_ring()
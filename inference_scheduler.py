@@ -0,0 +1,132 @@
+import numpy as np
+
+from landmarks import NUM_LANDMARKS
+
+class LandmarkExtrapolator:
+    """
+    Constant-velocity landmark predictor used on frames where inference is skipped.
+
+    Keeps the last observed landmarks and their per-landmark velocity and
+    predicts into a preallocated buffer. Every real observation is compared
+    with what would have been predicted for it, giving a running prediction
+    error (mean landmark distance in normalized units).
+    """
+    def __init__(self):
+        self.points = np.zeros((NUM_LANDMARKS, 3), dtype=np.float32)
+        self.velocity = np.zeros((NUM_LANDMARKS, 3), dtype=np.float32)
+        self.prediction = np.zeros((NUM_LANDMARKS, 3), dtype=np.float32)
+        self.timestamp = None
+        self.has_velocity = False
+
+        # Statistics
+        self.error_sum = 0.0
+        self.error_count = 0
+        self.predicted_since_observation = False
+
+    def reset(self):
+        self.timestamp = None
+        self.has_velocity = False
+        self.predicted_since_observation = False
+
+    def ready(self):
+        return self.has_velocity
+
+    def speed(self):
+        """Mean landmark speed in normalized units per second"""
+        if not self.has_velocity:
+            return 0.0
+        return float(np.sqrt((self.velocity[:, :2] ** 2).sum(axis=1)).mean())
+
+    def predict(self, timestamp):
+        """Predict landmarks at `timestamp`; returns the shared prediction buffer"""
+        np.multiply(self.velocity, timestamp - self.timestamp, out=self.prediction)
+        self.prediction += self.points
+        self.predicted_since_observation = True
+        return self.prediction
+
+    def observe(self, points, timestamp):
+        """Record measured landmarks and update the velocity estimate"""
+        if self.timestamp is not None and timestamp > self.timestamp:
+            dt = timestamp - self.timestamp
+
+            # Only frames that were actually bridged by prediction count towards the error
+            if self.has_velocity and self.predicted_since_observation:
+                predicted = self.points + self.velocity * dt
+                self.error_sum += float(np.sqrt(((predicted[:, :2] - points[:, :2]) ** 2).sum(axis=1)).mean())
+                self.error_count += 1
+
+            np.subtract(points, self.points, out=self.velocity)
+            self.velocity /= dt
+            self.has_velocity = True
+
+        self.points[...] = points
+        self.timestamp = timestamp
+        self.predicted_since_observation = False
+
+    def mean_error(self):
+        return self.error_sum / self.error_count if self.error_count else 0.0
+
+
+class AdaptiveInferenceScheduler:
+    """
+    Decides per frame whether to run landmark inference or extrapolate.
+
+    A still hand is re-measured only every `max_skip + 1` frames; the faster
+    the hand moves, the fewer frames are skipped, down to inference on every
+    frame above `fast_speed`. When inference takes more than `cpu_budget` of
+    the frame interval (little CPU headroom) one extra frame may be skipped,
+    but never more than `max_skip` in a row.
+    """
+    def __init__(self, max_skip=2, fast_speed=1.5, cpu_budget=0.6):
+        self.max_skip = max_skip        # Most consecutive frames to extrapolate
+        self.fast_speed = fast_speed    # Hand speed (normalized units/s) that forces every-frame inference
+        self.cpu_budget = cpu_budget    # Fraction of the frame interval inference may use
+        self.extrapolator = LandmarkExtrapolator()
+        self.skipped_in_row = 0
+        self.inference_time = 0.0       # Smoothed inference duration in seconds
+        self.frame_interval = 1.0 / 30  # Smoothed time between frames in seconds
+        self.last_frame_time = None
+
+        # Statistics
+        self.frames = 0
+        self.skipped = 0
+
+    def reset(self):
+        self.extrapolator.reset()
+        self.skipped_in_row = 0
+
+    def allowed_skip(self):
+        """Number of consecutive frames that may currently be extrapolated"""
+        if self.max_skip <= 0:
+            return 0
+        speed_ratio = min(1.0, self.extrapolator.speed() / self.fast_speed)
+        allowed = int(round(self.max_skip * (1.0 - speed_ratio)))
+        if self.inference_time > self.cpu_budget * self.frame_interval:
+            allowed += 1
+        return min(allowed, self.max_skip)
+
+    def should_infer(self, timestamp):
+        """Call once per frame; True when this frame needs real inference"""
+        if self.last_frame_time is not None:
+            self.frame_interval += 0.1 * ((timestamp - self.last_frame_time) - self.frame_interval)
+        self.last_frame_time = timestamp
+        self.frames += 1
+
+        if not self.extrapolator.ready() or self.skipped_in_row >= self.allowed_skip():
+            self.skipped_in_row = 0
+            return True
+
+        self.skipped_in_row += 1
+        self.skipped += 1
+        return False
+
+    def record_inference(self, duration):
+        """Feed back how long the last inference call took"""
+        self.inference_time += 0.1 * (duration - self.inference_time)
+
+    def stats(self):
+        return {
+            'skip_ratio': self.skipped / self.frames if self.frames else 0.0,
+            'prediction_error': self.extrapolator.mean_error(),
+            'inference_ms': 1000 * self.inference_time
+        }
@@ -0,0 +1,344 @@
+"""
+Mouse and keyboard output. Every backend implements the pyautogui functions
+the controller uses (size, moveTo, click, doubleClick, mouseDown, mouseUp,
+scroll, keyDown, keyUp, hotkey) on top of four primitives, and measures the
+time each injected event takes. The pyautogui backend keeps pyautogui's own
+click calls.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import sys
+import threading
+import time
+from collections import deque
+
+class InputBackend:
+    """
+    Base class: the pyautogui-style calls, built from the `_move`, `_button`,
+    `_scroll` and `_key` primitives a backend implements.
+
+    Calls are serialized with a lock, as the cursor output thread and the
+    gesture thread both inject events, and timed per event type.
+    """
+    name = 'base'
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.timings = {}   # Event type -> [count, seconds]
+
+    def _timed(self, event, primitive, *args):
+        with self.lock:
+            start_time = time.perf_counter()
+            primitive(*args)
+            elapsed = time.perf_counter() - start_time
+            timing = self.timings.get(event)
+            if timing is None:
+                self.timings[event] = [1, elapsed]
+            else:
+                timing[0] += 1
+                timing[1] += elapsed
+
+    def size(self):
+        raise NotImplementedError
+
+    def moveTo(self, x, y, *args, **kwargs):
+        self._timed('move', self._move, int(x), int(y))
+
+    def mouseDown(self, *args, button='left', **kwargs):
+        self._timed('button', self._button, button, True)
+
+    def mouseUp(self, *args, button='left', **kwargs):
+        self._timed('button', self._button, button, False)
+
+    def click(self, *args, button='left', **kwargs):
+        self._timed('button', self._button, button, True)
+        self._timed('button', self._button, button, False)
+
+    def doubleClick(self, *args, button='left', **kwargs):
+        for _ in range(2):
+            self._timed('button', self._button, button, True)
+            self._timed('button', self._button, button, False)
+
+    def scroll(self, clicks, *args, **kwargs):
+        """Scroll `clicks` wheel notches, positive up"""
+        self._timed('scroll', self._scroll, int(clicks))
+
+    def keyDown(self, key, *args, **kwargs):
+        self._timed('key', self._key, key, True)
+
+    def keyUp(self, key, *args, **kwargs):
+        self._timed('key', self._key, key, False)
+
+    def hotkey(self, *keys, **kwargs):
+        for key in keys:
+            self._timed('key', self._key, key, True)
+        for key in reversed(keys):
+            self._timed('key', self._key, key, False)
+
+    def stats(self):
+        """Events injected and mean microseconds per event, by event type"""
+        return {event: {'count': count, 'us_per_event': seconds / count * 1e6}
+                for event, (count, seconds) in self.timings.items()}
+
+    def close(self):
+        pass
+
+
+class PyAutoGuiBackend(InputBackend):
+    """
+    pyautogui, for every platform. Its PAUSE sleep after each call (0.1 s by
+    default) is skipped, so the tracking thread never blocks on it.
+
+    Clicks go through pyautogui's own click and doubleClick: on macOS a
+    double click is only recognized with the click count pyautogui sets
+    there, not from two separate down/up pairs.
+    """
+    name = 'pyautogui'
+
+    def __init__(self):
+        super().__init__()
+        import pyautogui
+        pyautogui.FAILSAFE = False
+        self.pyautogui = pyautogui
+
+    def size(self):
+        return self.pyautogui.size()
+
+    def click(self, *args, button='left', **kwargs):
+        self._timed('click', self._click, button, 1)
+
+    def doubleClick(self, *args, button='left', **kwargs):
+        self._timed('click', self._click, button, 2)
+
+    def _click(self, button, clicks):
+        if clicks == 2:
+            self.pyautogui.doubleClick(button=button, _pause=False)
+        else:
+            self.pyautogui.click(button=button, _pause=False)
+
+    def _move(self, x, y):
+        self.pyautogui.moveTo(x, y, _pause=False)
+
+    def _button(self, button, down):
+        if down:
+            self.pyautogui.mouseDown(button=button, _pause=False)
+        else:
+            self.pyautogui.mouseUp(button=button, _pause=False)
+
+    def _scroll(self, clicks):
+        self.pyautogui.scroll(clicks, _pause=False)
+
+    def _key(self, key, down):
+        if down:
+            self.pyautogui.keyDown(key, _pause=False)
+        else:
+            self.pyautogui.keyUp(key, _pause=False)
+
+
+# X buttons for pyautogui button names, and the wheel buttons
+X_BUTTONS = {'left': 1, 'middle': 2, 'right': 3}
+X_WHEEL_UP, X_WHEEL_DOWN = 4, 5
+
+# X keysym names for pyautogui key names; others are used as they are
+X_KEYSYMS = {
+    'ctrl': 'Control_L', 'ctrlleft': 'Control_L', 'ctrlright': 'Control_R',
+    'alt': 'Alt_L', 'altleft': 'Alt_L', 'altright': 'Alt_R',
+    'shift': 'Shift_L', 'shiftleft': 'Shift_L', 'shiftright': 'Shift_R',
+    'command': 'Super_L', 'win': 'Super_L', 'winleft': 'Super_L', 'winright': 'Super_R',
+    'left': 'Left', 'right': 'Right', 'up': 'Up', 'down': 'Down',
+    'enter': 'Return', 'return': 'Return', 'esc': 'Escape', 'escape': 'Escape',
+    'tab': 'Tab', 'space': 'space', 'backspace': 'BackSpace', 'delete': 'Delete',
+    'home': 'Home', 'end': 'End', 'pageup': 'Prior', 'pagedown': 'Next',
+    '[': 'bracketleft', ']': 'bracketright', '+': 'plus', '-': 'minus',
+}
+
+class XTestBackend(InputBackend):
+    """
+    Linux/X11 through the XTest extension over one persistent display
+    connection, called directly with ctypes: each event is a single
+    request written to the X socket, with no per-call setup.
+
+    Raises OSError when libX11/libXtst or the display are not available.
+    """
+    name = 'xtest'
+
+    def __init__(self, display_name=None):
+        super().__init__()
+        x11_path, xtst_path = ctypes.util.find_library('X11'), ctypes.util.find_library('Xtst')
+        if not x11_path or not xtst_path:
+            raise OSError("libX11 and libXtst are required for the XTest backend")
+        self.x11 = x11 = ctypes.CDLL(x11_path)
+        self.xtst = xtst = ctypes.CDLL(xtst_path)
+
+        x11.XOpenDisplay.argtypes = [ctypes.c_char_p]
+        x11.XOpenDisplay.restype = ctypes.c_void_p
+        x11.XCloseDisplay.argtypes = [ctypes.c_void_p]
+        x11.XFlush.argtypes = [ctypes.c_void_p]
+        x11.XDefaultScreen.argtypes = [ctypes.c_void_p]
+        x11.XDisplayWidth.argtypes = x11.XDisplayHeight.argtypes = [ctypes.c_void_p, ctypes.c_int]
+        x11.XStringToKeysym.argtypes = [ctypes.c_char_p]
+        x11.XStringToKeysym.restype = ctypes.c_ulong
+        x11.XKeysymToKeycode.argtypes = [ctypes.c_void_p, ctypes.c_ulong]
+        x11.XKeysymToKeycode.restype = ctypes.c_ubyte
+        xtst.XTestQueryExtension.argtypes = [ctypes.c_void_p] + [ctypes.POINTER(ctypes.c_int)] * 4
+        xtst.XTestFakeMotionEvent.argtypes = [ctypes.c_void_p, ctypes.c_int, ctypes.c_int,
+                                              ctypes.c_int, ctypes.c_ulong]
+        xtst.XTestFakeButtonEvent.argtypes = [ctypes.c_void_p, ctypes.c_uint, ctypes.c_int, ctypes.c_ulong]
+        xtst.XTestFakeKeyEvent.argtypes = [ctypes.c_void_p, ctypes.c_uint, ctypes.c_int, ctypes.c_ulong]
+
+        name = display_name or os.environ.get('DISPLAY')
+        self.display = x11.XOpenDisplay(name.encode() if name else None)
+        if not self.display:
+            raise OSError(f"Could not open X display {name!r}")
+        values = [ctypes.c_int() for _ in range(4)]
+        if not xtst.XTestQueryExtension(self.display, *(ctypes.byref(value) for value in values)):
+            self.close()
+            raise OSError("The X server does not support the XTest extension")
+        self.screen = x11.XDefaultScreen(self.display)
+        self.keycodes = {}
+
+    def size(self):
+        return (self.x11.XDisplayWidth(self.display, self.screen),
+                self.x11.XDisplayHeight(self.display, self.screen))
+
+    def keycode(self, key):
+        """X keycode for a pyautogui key name (0 if the keyboard has no such key)"""
+        keycode = self.keycodes.get(key)
+        if keycode is None:
+            keysym = self.x11.XStringToKeysym(X_KEYSYMS.get(key.lower(), key).encode())
+            keycode = self.keycodes[key] = self.x11.XKeysymToKeycode(self.display, keysym) if keysym else 0
+        return keycode
+
+    # Events are ignored once the display is closed
+    def _move(self, x, y):
+        if self.display:
+            self.xtst.XTestFakeMotionEvent(self.display, self.screen, x, y, 0)
+            self.x11.XFlush(self.display)
+
+    def _button(self, button, down):
+        if self.display:
+            self.xtst.XTestFakeButtonEvent(self.display, X_BUTTONS[button], down, 0)
+            self.x11.XFlush(self.display)
+
+    def _scroll(self, clicks):
+        if self.display:
+            button = X_WHEEL_UP if clicks > 0 else X_WHEEL_DOWN
+            for _ in range(abs(clicks)):
+                self.xtst.XTestFakeButtonEvent(self.display, button, True, 0)
+                self.xtst.XTestFakeButtonEvent(self.display, button, False, 0)
+            self.x11.XFlush(self.display)
+
+    def _key(self, key, down):
+        keycode = self.keycode(key) if self.display else 0
+        if keycode:
+            self.xtst.XTestFakeKeyEvent(self.display, keycode, down, 0)
+            self.x11.XFlush(self.display)
+
+    def close(self):
+        with self.lock:
+            if self.display:
+                self.x11.XCloseDisplay(self.display)
+                self.display = None
+
+
+class RecordingBackend(InputBackend):
+    """
+    Backend for headless runs and tests: performs nothing, counts each call
+    in `calls` and keeps the most recent `max_events` as (name, args) in
+    `events`.
+    """
+    name = 'recording'
+
+    def __init__(self, screen_size=(1920, 1080), max_events=10000):
+        super().__init__()
+        self.screen_size = screen_size
+        self.position = (screen_size[0] // 2, screen_size[1] // 2)
+        self.pressed = set()    # Buttons and keys currently held
+        self.calls = {}
+        self.events = deque(maxlen=max_events)
+
+    def _record(self, name, *args):
+        self.calls[name] = self.calls.get(name, 0) + 1
+        self.events.append((name, args))
+
+    def size(self):
+        return self.screen_size
+
+    def moveTo(self, x, y, *args, **kwargs):
+        super().moveTo(x, y)
+        self._record('moveTo', x, y)
+
+    def mouseDown(self, *args, button='left', **kwargs):
+        super().mouseDown(button=button)
+        self._record('mouseDown', button)
+
+    def mouseUp(self, *args, button='left', **kwargs):
+        super().mouseUp(button=button)
+        self._record('mouseUp', button)
+
+    def click(self, *args, button='left', **kwargs):
+        super().click(button=button)
+        self._record(f"click_{button}")
+
+    def doubleClick(self, *args, button='left', **kwargs):
+        super().doubleClick(button=button)
+        self._record('doubleClick')
+
+    def scroll(self, clicks, *args, **kwargs):
+        super().scroll(clicks)
+        self._record('scroll', clicks)
+
+    def keyDown(self, key, *args, **kwargs):
+        super().keyDown(key)
+        self._record(f"keyDown_{key}")
+
+    def keyUp(self, key, *args, **kwargs):
+        super().keyUp(key)
+        self._record(f"keyUp_{key}")
+
+    def hotkey(self, *keys, **kwargs):
+        super().hotkey(*keys)
+        self._record(f"hotkey_{'+'.join(keys)}")
+
+    def _move(self, x, y):
+        self.position = (x, y)
+
+    def _button(self, button, down):
+        if down:
+            self.pressed.add(button)
+        else:
+            self.pressed.discard(button)
+
+    def _scroll(self, clicks):
+        pass
+
+    def _key(self, key, down):
+        if down:
+            self.pressed.add(key)
+        else:
+            self.pressed.discard(key)
+
+
+BACKENDS = {
+    'xtest': XTestBackend,
+    'pyautogui': PyAutoGuiBackend,
+    'recording': RecordingBackend,
+}
+
+def create_input_backend(name='auto'):
+    """
+    The input backend called `name` (see BACKENDS). 'auto' uses XTest on
+    Linux under X11 and pyautogui elsewhere or when XTest is unavailable,
+    as does a backend that fails to start.
+    """
+    if name == 'auto':
+        name = 'xtest' if sys.platform.startswith('linux') and os.environ.get('DISPLAY') else 'pyautogui'
+    if name != 'pyautogui':
+        try:
+            return BACKENDS[name]()
+        except (KeyError, OSError) as e:
+            print(f"Input backend {name!r} unavailable ({e}), using pyautogui")
+    return PyAutoGuiBackend()
+
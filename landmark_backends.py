@@ -0,0 +1,84 @@
+import threading
+import time
+
+from landmarks import HandResults, NormalizedLandmark, NormalizedLandmarkList
+
+class TasksHandLandmarker:
+    """
+    Hand landmark detection with the MediaPipe Tasks HandLandmarker in LIVE_STREAM mode.
+
+    Frames are submitted with their capture timestamps and results arrive on
+    mediapipe's own thread through a callback, so `process()` never waits for
+    inference: it submits the new frame and returns the newest finished
+    results (usually those of the previous frame), whose capture time is then
+    in `results_timestamp`. Frames submitted while the graph is still busy
+    are dropped by mediapipe.
+
+    Results use the same landmark structure as `Hands.process()`, so gesture
+    and actuation code work unchanged with either backend.
+    """
+    asynchronous = True
+
+    def __init__(self, model_path, max_num_hands=1, min_detection_confidence=0.7,
+                 min_tracking_confidence=0.7, **unused_options):
+        import mediapipe as mp
+        from mediapipe.tasks.python import BaseOptions
+        from mediapipe.tasks.python import vision
+
+        self._mp = mp
+        self._lock = threading.Lock()
+        self._last_timestamp_ms = -1
+        self.latest = HandResults()
+        self.latest_timestamp_ms = None
+        self.results_timestamp = None   # Capture time (seconds) of the results process() last returned
+
+        # Statistics
+        self.submitted = 0
+        self.completed = 0
+
+        options = vision.HandLandmarkerOptions(
+            base_options=BaseOptions(model_asset_path=model_path),
+            running_mode=vision.RunningMode.LIVE_STREAM,
+            num_hands=max_num_hands,
+            min_hand_detection_confidence=min_detection_confidence,
+            min_hand_presence_confidence=min_tracking_confidence,
+            min_tracking_confidence=min_tracking_confidence,
+            result_callback=self._on_result)
+        self.landmarker = vision.HandLandmarker.create_from_options(options)
+
+    def _on_result(self, result, output_image, timestamp_ms):
+        """Called by mediapipe when a frame has been processed"""
+        hands = [
+            NormalizedLandmarkList([NormalizedLandmark(landmark.x, landmark.y, landmark.z)
+                                    for landmark in hand])
+            for hand in result.hand_landmarks
+        ]
+        handedness = [categories[0].category_name for categories in result.handedness if categories]
+        with self._lock:
+            self.latest = HandResults(hands, handedness)
+            self.latest_timestamp_ms = timestamp_ms
+            self.completed += 1
+
+    def process(self, rgb_frame, timestamp=None):
+        """
+        Submit a frame captured at `timestamp` (time.monotonic() seconds, now
+        if None) and return the newest available results.
+        """
+        if timestamp is None:
+            timestamp = time.monotonic()
+        # Timestamps must be strictly increasing
+        timestamp_ms = max(int(timestamp * 1000), self._last_timestamp_ms + 1)
+        self._last_timestamp_ms = timestamp_ms
+
+        # mp.Image copies the pixels, so the pooled frame buffer can be reused right away
+        image = self._mp.Image(image_format=self._mp.ImageFormat.SRGB, data=rgb_frame)
+        self.landmarker.detect_async(image, timestamp_ms)
+        self.submitted += 1
+
+        with self._lock:
+            if self.latest_timestamp_ms is not None:
+                self.results_timestamp = self.latest_timestamp_ms / 1000.0
+            return self.latest
+
+    def close(self):
+        self.landmarker.close()
@@ -0,0 +1,397 @@
+#!/usr/bin/env python3
+"""
+NoMouse - Landmark sources
+Interchangeable producers of hand landmarks for the gesture and cursor path:
+
+    LiveSource       camera frames through the controller's landmark detector
+    ReplaySource     a session recorded to a .npz file
+    SyntheticSource  scripted hand trajectories (point, pinch, v_scroll)
+
+All of them yield LandmarkSample objects whose results look like
+`Hands.process()` output, so `drive()` can feed any of them into an
+unmodified HandGestureController. Record and replay sessions with:
+
+    python3 landmark_sources.py record session.npz --label point --seconds 10
+    python3 landmark_sources.py synth session.npz --script point:2 pinch:2 v_scroll:2
+    python3 landmark_sources.py replay session.npz
+"""
+
+import argparse
+import sys
+import time
+
+import numpy as np
+
+from input_backends import RecordingBackend
+from landmarks import NUM_LANDMARKS, HandResults, results_from_array, results_to_array
+
+class LandmarkSample:
+    """Hand landmarks for one frame, with an optional gesture label"""
+    __slots__ = ('results', 'timestamp', 'label')
+
+    def __init__(self, results, timestamp, label=None):
+        self.results = results
+        self.timestamp = timestamp
+        self.label = label
+
+
+class LandmarkSource:
+    """
+    Base class for landmark sources: iterate to get LandmarkSamples.
+
+    With `realtime` set, samples are released at the pace of their
+    timestamps; otherwise they are produced as fast as possible.
+    """
+    def __init__(self, realtime=False):
+        self.realtime = realtime
+        self._start = None
+
+    def __iter__(self):
+        self._start = None
+        for sample in self.samples():
+            if self.realtime:
+                self._pace(sample.timestamp)
+            yield sample
+
+    def samples(self):
+        raise NotImplementedError
+
+    def _pace(self, timestamp):
+        now = time.monotonic()
+        if self._start is None:
+            self._start = now - timestamp
+        delay = self._start + timestamp - now
+        if delay > 0:
+            time.sleep(delay)
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class LiveSource(LandmarkSource):
+    """Camera frames run through `controller.process_frame()`"""
+    def __init__(self, controller, camera_index=0, target_fps=30, label=None):
+        super().__init__(realtime=False)  # The camera sets the pace
+        import cv2
+        from capture import FramePool
+
+        self.controller = controller
+        self.label = label
+        self.pool = FramePool(size=2)
+        self.cap = cv2.VideoCapture(camera_index)
+        self.cap.set(cv2.CAP_PROP_FPS, target_fps)
+        if not self.cap.isOpened():
+            raise RuntimeError(f"Could not open camera {camera_index}")
+
+    def samples(self):
+        while True:
+            ret, frame = self.pool.read(self.cap)
+            if not ret:
+                return
+            results = self.controller.process_frame(frame, time.monotonic())
+            yield LandmarkSample(results, self.controller.results_timestamp, self.label)
+
+    def close(self):
+        self.cap.release()
+
+
+class ReplaySource(LandmarkSource):
+    """
+    Landmarks from a session file written by SessionRecorder.
+
+    The file holds `timestamps` (N,), `landmarks` (N, 21, 3), `present` (N,)
+    and optionally `labels` (N,).
+    """
+    def __init__(self, path, realtime=False, loop=False):
+        super().__init__(realtime)
+        self.loop = loop
+        with np.load(path) as session:
+            self.timestamps = session['timestamps'].astype(np.float64)
+            self.landmarks = session['landmarks'].astype(np.float32)
+            self.present = session['present'].astype(bool)
+            self.labels = session['labels'] if 'labels' in session.files else None
+        self.timestamps -= self.timestamps[0] if len(self.timestamps) else 0.0
+
+    def __len__(self):
+        return len(self.timestamps)
+
+    def samples(self):
+        duration = self.timestamps[-1] + (self.timestamps[-1] / max(len(self) - 1, 1)) if len(self) else 0.0
+        offset = 0.0
+        while True:
+            for i in range(len(self)):
+                results = results_from_array(self.landmarks[i:i + 1]) if self.present[i] else HandResults()
+                label = str(self.labels[i]) if self.labels is not None else None
+                yield LandmarkSample(results, offset + self.timestamps[i], label)
+            if not self.loop or not len(self):
+                return
+            offset += duration
+
+
+# Upright right hand, palm towards the camera, in mirrored normalized image
+# coordinates. Curled fingers keep their tip just below the PIP joint.
+_WRIST = (0.50, 0.80)
+_THUMB = [(0.44, 0.76), (0.40, 0.71), (0.37, 0.66), (0.35, 0.62)]
+_FINGER_X = (0.46, 0.50, 0.54, 0.58)
+_FINGER_MCP_Y = (0.62, 0.61, 0.62, 0.65)
+_EXTENDED = (0.08, 0.13, 0.18)   # PIP, DIP and tip heights above the MCP
+_CURLED = (0.06, 0.03, 0.04)     # PIP above the MCP, DIP and tip folded back down
+
+def hand_pose(extended=(), tips=None):
+    """
+    Build a (21, 3) landmark array with the given fingers extended.
+
+    Fingers are numbered 0 (index) to 3 (pinky); `tips` overrides the (x, y)
+    of individual fingertips.
+    """
+    points = np.zeros((NUM_LANDMARKS, 3), dtype=np.float32)
+    points[0, :2] = _WRIST
+    points[1:5, :2] = _THUMB
+    for finger in range(4):
+        base = 5 + 4 * finger
+        x, mcp_y = _FINGER_X[finger], _FINGER_MCP_Y[finger]
+        points[base, :2] = (x, mcp_y)
+        if finger in extended:
+            for joint, height in enumerate(_EXTENDED, 1):
+                points[base + joint, :2] = (x, mcp_y - height)
+        else:
+            pip_y = mcp_y - _CURLED[0]
+            points[base + 1, :2] = (x, pip_y)
+            points[base + 2, :2] = (x, pip_y + _CURLED[1])
+            points[base + 3, :2] = (x, pip_y + 0.02)
+    for finger, tip in (tips or {}).items():
+        points[8 + 4 * finger, :2] = tip
+    return points
+
+
+GESTURE_POSES = {
+    'none': hand_pose(),
+    'point': hand_pose(extended=(0,)),
+    # Index curled onto the thumb tip
+    'pinch': hand_pose(tips={0: (_THUMB[3][0] + 0.01, _THUMB[3][1] - 0.01)}),
+    # Index and middle extended and spread apart
+    'v_scroll': hand_pose(extended=(0, 1), tips={0: (0.42, 0.44), 1: (0.54, 0.44)}),
+}
+
+
+class SyntheticSource(LandmarkSource):
+    """
+    Scripted hand trajectories sampled at `fps` on a simulated clock.
+
+    `script` is a list of (gesture, seconds) steps using GESTURE_POSES:
+    'point' sweeps the hand around the frame, 'pinch' taps the index onto
+    the thumb twice a second and 'v_scroll' moves the V shape up and down.
+    'absent' produces frames without a hand.
+    """
+    def __init__(self, script=(('point', 2.0), ('pinch', 2.0), ('v_scroll', 2.0)),
+                 fps=30, noise=0.002, seed=0, realtime=False, loop=False):
+        super().__init__(realtime)
+        for gesture, _ in script:
+            if gesture not in GESTURE_POSES and gesture != 'absent':
+                raise ValueError(f"Unknown gesture {gesture!r}")
+        self.script = list(script)
+        self.fps = fps
+        self.noise = noise
+        self.loop = loop
+        self.rng = np.random.default_rng(seed)
+
+    def trajectory(self, gesture, times):
+        """Landmarks for one script step as an (N, 21, 3) array"""
+        offsets = np.zeros((len(times), 3), dtype=np.float32)
+        present = np.full(len(times), gesture != 'absent')
+        if gesture == 'absent':
+            return np.zeros((len(times), NUM_LANDMARKS, 3), dtype=np.float32), present
+        if gesture == 'point':
+            offsets[:, 0] = 0.15 * np.sin(2 * np.pi * 0.5 * times)
+            offsets[:, 1] = 0.10 * np.sin(2 * np.pi * 0.7 * times)
+        elif gesture == 'v_scroll':
+            offsets[:, 1] = 0.08 * np.sin(2 * np.pi * 0.5 * times)
+
+        points = GESTURE_POSES[gesture] + offsets[:, np.newaxis, :]
+        if gesture == 'pinch':
+            # Open (pointing) for the first half of every half second
+            released = (times % 0.5) < 0.25
+            points[released] = GESTURE_POSES['point']
+        if self.noise:
+            points += self.rng.normal(0.0, self.noise, points.shape).astype(np.float32)
+        return points, present
+
+    def samples(self):
+        timestamp = 0.0
+        while True:
+            for gesture, seconds in self.script:
+                times = np.arange(int(round(seconds * self.fps))) / self.fps
+                points, present = self.trajectory(gesture, times)
+                for i in range(len(times)):
+                    results = results_from_array(points[i:i + 1]) if present[i] else HandResults()
+                    yield LandmarkSample(results, timestamp + times[i], gesture)
+                timestamp += seconds
+            if not self.loop:
+                return
+
+
+class SessionRecorder:
+    """Collect landmark samples and save them as a session file for ReplaySource"""
+    def __init__(self):
+        self.timestamps = []
+        self.landmarks = []
+        self.present = []
+        self.labels = []
+
+    def __len__(self):
+        return len(self.timestamps)
+
+    def add(self, sample):
+        hands = results_to_array(sample.results)
+        self.timestamps.append(sample.timestamp)
+        self.present.append(len(hands) > 0)
+        self.landmarks.append(hands[0] if len(hands) else np.zeros((NUM_LANDMARKS, 3), dtype=np.float32))
+        self.labels.append(sample.label or '')
+
+    def save(self, path):
+        session = dict(
+            timestamps=np.array(self.timestamps, dtype=np.float64),
+            landmarks=np.array(self.landmarks, dtype=np.float32).reshape(-1, NUM_LANDMARKS, 3),
+            present=np.array(self.present, dtype=bool)
+        )
+        if any(self.labels):
+            session['labels'] = np.array(self.labels)
+        np.savez_compressed(path, **session)
+
+
+class SampleClock:
+    """Controller clock that follows sample timestamps instead of wall time (set by drive)"""
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class NullDetector:
+    """Landmark detector stand-in for controllers fed by a landmark source"""
+    def process(self, rgb_frame):
+        return HandResults()
+
+    def close(self):
+        pass
+
+
+def headless_controller(settings=None, mouse=None):
+    """
+    A HandGestureController that needs neither a camera, mediapipe nor a display.
+
+    Its gesture timing follows sample timestamps, so accelerated replays
+    click and scroll as they would in real time.
+    """
+    from controller import HandGestureController
+    return HandGestureController(settings, hands=NullDetector(), mouse=mouse or RecordingBackend(),
+                                 clock=SampleClock())
+
+
+def drive(controller, source, limit=None, latency=0.0):
+    """
+    Feed samples from a landmark source through the gesture and cursor path,
+    exactly as the tracking loop does, and return throughput statistics.
+
+    `latency` simulates the pipeline delay: the controller's clock reads
+    that many seconds past each sample's capture timestamp.
+    """
+    clock = controller.clock if isinstance(controller.clock, SampleClock) else None
+    samples = hands = 0
+    start_time = time.perf_counter()
+    for sample in source:
+        if limit is not None and samples >= limit:
+            break
+        samples += 1
+        if clock is not None:
+            clock.now = sample.timestamp + latency
+        if sample.results.multi_hand_landmarks:
+            hands += 1
+            hand_landmarks = sample.results.multi_hand_landmarks[0]
+            gesture_state = controller.get_gesture(hand_landmarks)
+            controller.control_mouse(hand_landmarks, gesture_state, sample.timestamp)
+        else:
+            controller.release_gestures()
+    elapsed = time.perf_counter() - start_time
+
+    return {
+        'samples': samples,
+        'hands': hands,
+        'seconds': elapsed,
+        'samples_per_second': samples / elapsed if elapsed > 0 else 0.0,
+        'mouse_calls': dict(getattr(controller.mouse, 'calls', {})),
+        'gestures': controller.gesture_engine.stats(),
+        'temporal_gestures': controller.temporal_recognizer.stats()
+    }
+
+
+def parse_script(steps):
+    """Parse 'gesture:seconds' command line steps"""
+    script = []
+    for step in steps:
+        gesture, _, seconds = step.partition(':')
+        script.append((gesture, float(seconds or 2.0)))
+    return script
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Record, generate and replay landmark sessions")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    record = commands.add_parser('record', help="Record a session from the camera")
+    record.add_argument('path')
+    record.add_argument('--label', default=None, help="Gesture label stored with every sample")
+    record.add_argument('--seconds', type=float, default=10.0)
+    record.add_argument('--camera', type=int, default=0)
+
+    synth = commands.add_parser('synth', help="Save a synthetic session")
+    synth.add_argument('path')
+    synth.add_argument('--script', nargs='+', default=['point:2', 'pinch:2', 'v_scroll:2'])
+    synth.add_argument('--fps', type=float, default=30)
+
+    replay = commands.add_parser('replay', help="Drive a headless controller from a session")
+    replay.add_argument('path')
+    replay.add_argument('--realtime', action='store_true')
+
+    args = parser.parse_args()
+
+    if args.command == 'replay':
+        stats = drive(headless_controller(), ReplaySource(args.path, realtime=args.realtime))
+        print(f"{stats['samples']} samples ({stats['hands']} with a hand) in {stats['seconds']:.2f}s, "
+              f"{stats['samples_per_second']:.0f} samples/s")
+        print(f"Mouse actions: {stats['mouse_calls']}")
+        print(f"Gestures fired: {stats['gestures']}")
+        print(f"Temporal gestures fired: {stats['temporal_gestures']}")
+        return 0
+
+    recorder = SessionRecorder()
+    if args.command == 'synth':
+        for sample in SyntheticSource(parse_script(args.script), fps=args.fps):
+            recorder.add(sample)
+    else:
+        from controller import HandGestureController
+        from settings import Settings
+
+        controller = HandGestureController(Settings().get_all(), mouse=RecordingBackend())
+        with LiveSource(controller, args.camera, label=args.label) as source:
+            print(f"Recording for {args.seconds:.0f} seconds...")
+            end_time = time.monotonic() + args.seconds
+            for sample in source:
+                recorder.add(sample)
+                if sample.timestamp >= end_time:
+                    break
+        controller.close()
+
+    recorder.save(args.path)
+    print(f"Saved {len(recorder)} samples to {args.path}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
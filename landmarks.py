@@ -0,0 +1,87 @@
+import struct
+
+import numpy as np
+
+NUM_LANDMARKS = 21
+_LANDMARK_STRUCT = struct.Struct(f'{NUM_LANDMARKS * 3}f')
+
+# Same topology as mp.solutions.hands.HAND_CONNECTIONS, available without mediapipe
+HAND_CONNECTIONS = frozenset([
+    (0, 1), (1, 2), (2, 3), (3, 4),
+    (0, 5), (5, 6), (6, 7), (7, 8),
+    (5, 9), (9, 10), (10, 11), (11, 12),
+    (9, 13), (13, 14), (14, 15), (15, 16),
+    (13, 17), (0, 17), (17, 18), (18, 19), (19, 20)
+])
+
+class NormalizedLandmark:
+    """
+    Lightweight stand-in for mediapipe's NormalizedLandmark proto.
+
+    Exposes the same x/y/z attributes, so gesture code and mediapipe's
+    drawing utilities accept it unchanged.
+    """
+    __slots__ = ('x', 'y', 'z')
+
+    def __init__(self, x=0.0, y=0.0, z=0.0):
+        self.x = x
+        self.y = y
+        self.z = z
+
+    def HasField(self, name):
+        # No visibility/presence information is carried
+        return False
+
+
+class NormalizedLandmarkList:
+    """Stand-in for mediapipe's NormalizedLandmarkList proto"""
+    __slots__ = ('landmark',)
+
+    def __init__(self, landmark=None):
+        self.landmark = landmark if landmark is not None else []
+
+
+class HandResults:
+    """
+    Hand detection results with the same shape as `Hands.process()` output.
+
+    `multi_hand_landmarks` is None when no hand was found, like mediapipe.
+    """
+    __slots__ = ('multi_hand_landmarks', 'multi_handedness')
+
+    def __init__(self, multi_hand_landmarks=None, multi_handedness=None):
+        self.multi_hand_landmarks = multi_hand_landmarks or None
+        self.multi_handedness = multi_handedness
+
+
+def landmarks_to_array(hand_landmarks, out=None):
+    """Copy a landmark list into a contiguous (21, 3) float32 array"""
+    if out is None:
+        out = np.empty((NUM_LANDMARKS, 3), dtype=np.float32)
+    # Packing all 63 values into the array's buffer at once is several times
+    # faster than assigning them through numpy
+    _LANDMARK_STRUCT.pack_into(out, 0, *[value for landmark in hand_landmarks.landmark
+                                         for value in (landmark.x, landmark.y, landmark.z)])
+    return out
+
+
+def array_to_landmarks(points):
+    """Build a landmark list from a (21, 3) or (21, 2) array"""
+    if points.shape[1] > 2:
+        return NormalizedLandmarkList([NormalizedLandmark(x, y, z) for x, y, z in points[:, :3].tolist()])
+    return NormalizedLandmarkList([NormalizedLandmark(x, y) for x, y in points.tolist()])
+
+
+def results_to_array(results):
+    """Pack all detected hands into a (num_hands, 21, 3) float32 array"""
+    if not results.multi_hand_landmarks:
+        return np.empty((0, NUM_LANDMARKS, 3), dtype=np.float32)
+    hands = np.empty((len(results.multi_hand_landmarks), NUM_LANDMARKS, 3), dtype=np.float32)
+    for i, hand_landmarks in enumerate(results.multi_hand_landmarks):
+        landmarks_to_array(hand_landmarks, hands[i])
+    return hands
+
+
+def results_from_array(hands):
+    """Unpack a (num_hands, 21, 3) array into HandResults"""
+    return HandResults([array_to_landmarks(points) for points in hands])
@@ -0,0 +1,126 @@
+from collections import OrderedDict
+
+import cv2
+import numpy as np
+
+FONT = cv2.FONT_HERSHEY_SIMPLEX
+
+def ascii_text(text):
+    """Hershey fonts only cover ASCII; drop emoji and other symbols"""
+    return text.encode('ascii', 'ignore').decode('ascii').strip()
+
+
+class Sprite:
+    """
+    Pre-rendered overlay element: an RGB image plus a binary alpha mask.
+
+    `origin` is the position of the first line's text baseline inside the
+    sprite, so a sprite can be placed exactly where cv2.putText would draw.
+    """
+    __slots__ = ('image', 'mask', 'origin')
+
+    def __init__(self, image, mask, origin):
+        self.image = image
+        self.mask = mask
+        self.origin = origin
+
+    @property
+    def size(self):
+        return self.image.shape[1], self.image.shape[0]
+
+
+def render_text_sprite(lines, font_scale, color, thickness=1, line_spacing=30,
+                       shadow=False, background=None, padding=10):
+    """
+    Render one or more text lines into a Sprite.
+
+    `background` is an RGB color for a filled box behind the text, `shadow`
+    adds a black copy of the text offset by one pixel.
+    """
+    if isinstance(lines, str):
+        lines = [lines]
+    lines = [ascii_text(line) for line in lines]
+
+    sizes = [cv2.getTextSize(line, FONT, font_scale, thickness) for line in lines]
+    text_width = max(size[0][0] for size in sizes)
+    ascent = sizes[0][0][1]
+    descent = max(size[1] for size in sizes) + thickness
+    margin = padding if background is not None else 2
+    width = text_width + 2 * margin + 1
+    height = ascent + line_spacing * (len(lines) - 1) + descent + 2 * margin + 1
+
+    image = np.zeros((height, width, 3), dtype=np.uint8)
+    mask = np.zeros((height, width), dtype=np.uint8)
+    if background is not None:
+        image[...] = background
+        mask[...] = 255
+
+    origin = (margin, margin + ascent)
+    for i, line in enumerate(lines):
+        org = (origin[0], origin[1] + i * line_spacing)
+        if shadow:
+            shadow_org = (org[0] + 1, org[1] + 1)
+            cv2.putText(image, line, shadow_org, FONT, font_scale, (0, 0, 0), thickness)
+            cv2.putText(mask, line, shadow_org, FONT, font_scale, 255, thickness)
+        cv2.putText(image, line, org, FONT, font_scale, color, thickness)
+        cv2.putText(mask, line, org, FONT, font_scale, 255, thickness)
+
+    return Sprite(image, mask, origin)
+
+
+def composite(frame, sprite, x, y):
+    """Blend a sprite onto the frame with its text baseline at (x, y), clipped to the frame"""
+    left = x - sprite.origin[0]
+    top = y - sprite.origin[1]
+    width, height = sprite.size
+    frame_height, frame_width = frame.shape[:2]
+
+    x0, y0 = max(left, 0), max(top, 0)
+    x1, y1 = min(left + width, frame_width), min(top + height, frame_height)
+    if x0 >= x1 or y0 >= y1:
+        return
+
+    sx, sy = x0 - left, y0 - top
+    region = frame[y0:y1, x0:x1]
+    cv2.copyTo(sprite.image[sy:sy + (y1 - y0), sx:sx + (x1 - x0)],
+               sprite.mask[sy:sy + (y1 - y0), sx:sx + (x1 - x0)], region)
+
+
+class SpriteCache:
+    """
+    Least-recently-used cache of text sprites.
+
+    Static HUD text is rendered once; dynamic text that only takes a few
+    values (gesture banners, FPS readout) is rendered the first time a value
+    appears and composited from the cache afterwards.
+    """
+    def __init__(self, max_entries=64):
+        self.max_entries = max_entries
+        self._sprites = OrderedDict()
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, lines, font_scale, color, thickness=1, **options):
+        key = (tuple(lines) if isinstance(lines, list) else lines, font_scale, tuple(color), thickness,
+               tuple(sorted((name, tuple(value) if isinstance(value, (list, tuple)) else value)
+                            for name, value in options.items())))
+        sprite = self._sprites.get(key)
+        if sprite is not None:
+            self._sprites.move_to_end(key)
+            self.hits += 1
+            return sprite
+
+        self.misses += 1
+        sprite = render_text_sprite(lines, font_scale, color, thickness, **options)
+        self._sprites[key] = sprite
+        if len(self._sprites) > self.max_entries:
+            self._sprites.popitem(last=False)
+        return sprite
+
+    def draw(self, frame, lines, org, font_scale, color, thickness=1, **options):
+        """Composite cached text at `org` (the first line's baseline, like cv2.putText)"""
+        sprite = self.get(lines, font_scale, color, thickness, **options)
+        composite(frame, sprite, org[0], org[1])
+        return sprite
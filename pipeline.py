@@ -0,0 +1,135 @@
+import threading
+import time
+from collections import deque
+
+class DropOldestQueue:
+    """
+    Bounded FIFO queue that never blocks the producer.
+
+    When the queue is full the oldest item is discarded to make room, so a
+    slow consumer always works on recent data and never stalls the stage
+    feeding it.
+    """
+    def __init__(self, maxsize=2):
+        self._items = deque(maxlen=maxsize)
+        self._condition = threading.Condition()
+        self.closed = False
+
+        # Statistics
+        self.put_count = 0
+        self.dropped = 0
+
+    def put(self, item):
+        with self._condition:
+            if len(self._items) == self._items.maxlen:
+                self.dropped += 1
+            self._items.append(item)
+            self.put_count += 1
+            self._condition.notify()
+
+    def get(self, timeout=None):
+        """Wait for the oldest queued item. Returns None on timeout or close."""
+        with self._condition:
+            if not self._condition.wait_for(lambda: self._items or self.closed, timeout):
+                return None
+            if not self._items:
+                return None
+            return self._items.popleft()
+
+    def close(self):
+        with self._condition:
+            self.closed = True
+            self._condition.notify_all()
+
+    def __len__(self):
+        return len(self._items)
+
+
+class PipelineStage(threading.Thread):
+    """
+    One stage of the frame pipeline running on its own thread.
+
+    `source` is a callable returning the next input item (or None when there is
+    nothing to do yet), `process` turns an item into an output item (or None to
+    drop it) and the output is pushed into every queue in `outputs`.
+    """
+    def __init__(self, name, source, process, outputs=()):
+        super().__init__(name=name, daemon=True)
+        self.source = source
+        self.process = process
+        self.outputs = list(outputs)
+        self.running = True
+
+        # Statistics
+        self.processed = 0
+        self.busy_time = 0.0
+        self.last_time = 0.0
+
+    def run(self):
+        while self.running:
+            item = self.source()
+            if item is None:
+                continue
+
+            start_time = time.perf_counter()
+            result = self.process(item)
+            self.last_time = time.perf_counter() - start_time
+            self.busy_time += self.last_time
+            self.processed += 1
+
+            if result is not None:
+                for queue in self.outputs:
+                    queue.put(result)
+
+        for queue in self.outputs:
+            queue.close()
+
+    def stop(self):
+        self.running = False
+
+    def stats(self):
+        return {
+            'processed': self.processed,
+            'avg_ms': 1000 * self.busy_time / self.processed if self.processed else 0.0,
+            'last_ms': 1000 * self.last_time
+        }
+
+
+class Pipeline:
+    """A set of stages joined by drop-oldest queues, started and stopped together"""
+    def __init__(self):
+        self.stages = []
+        self.queues = {}
+
+    def add_queue(self, name, maxsize=2):
+        queue = DropOldestQueue(maxsize)
+        self.queues[name] = queue
+        return queue
+
+    def add_stage(self, name, source, process, outputs=()):
+        stage = PipelineStage(name, source, process, outputs)
+        self.stages.append(stage)
+        return stage
+
+    def start(self):
+        for stage in self.stages:
+            stage.start()
+
+    def stop(self, timeout=1.0):
+        for stage in self.stages:
+            stage.stop()
+        for queue in self.queues.values():
+            queue.close()
+        for stage in self.stages:
+            if stage.is_alive():
+                stage.join(timeout)
+
+    def is_alive(self):
+        return any(stage.is_alive() for stage in self.stages)
+
+    def stats(self):
+        """Per-stage timing and per-queue drop counters"""
+        return {
+            'stages': {stage.name: stage.stats() for stage in self.stages},
+            'queue_dropped': {name: queue.dropped for name, queue in self.queues.items()}
+        }
@@ -0,0 +1,102 @@
+import time
+
+import cv2
+import numpy as np
+
+TRACKING = 'tracking'
+IDLE = 'idle'
+
+class PresenceMonitor:
+    """
+    Switches between full hand tracking and a low-power idle state.
+
+    After `enter_seconds` without a detected hand the monitor goes idle: only
+    `idle_fps` frames per second are looked at, and only through a cheap
+    downscaled grayscale frame difference. As soon as the difference exceeds
+    `motion_threshold` (mean absolute gray-level change) it switches back to
+    tracking, so the very next frame runs full inference again.
+    """
+    def __init__(self, enter_seconds=3.0, motion_threshold=4.0, idle_fps=5, probe_size=(80, 60)):
+        self.enter_seconds = enter_seconds
+        self.motion_threshold = motion_threshold
+        self.idle_fps = idle_fps
+        self.probe_size = probe_size
+
+        self.state = TRACKING
+        self.last_hand_time = None
+        self.last_probe_time = None
+        self.state_since = None
+        self._probe = np.zeros(probe_size[::-1], dtype=np.uint8)
+        self._previous_probe = np.zeros(probe_size[::-1], dtype=np.uint8)
+        self._small = np.zeros(probe_size[::-1] + (3,), dtype=np.uint8)
+        self._diff = np.zeros(probe_size[::-1], dtype=np.uint8)
+
+        # Seconds spent in each state
+        self.state_time = {TRACKING: 0.0, IDLE: 0.0}
+
+    def configure(self, enter_seconds=None, motion_threshold=None, idle_fps=None):
+        if enter_seconds is not None:
+            self.enter_seconds = enter_seconds
+        if motion_threshold is not None:
+            self.motion_threshold = motion_threshold
+        if idle_fps is not None:
+            self.idle_fps = idle_fps
+
+    def _set_state(self, state, timestamp):
+        self.state_time[self.state] += timestamp - self.state_since
+        self.state = state
+        self.state_since = timestamp
+
+    def _take_probe(self, frame):
+        cv2.resize(frame, self.probe_size, dst=self._small, interpolation=cv2.INTER_AREA)
+        self._probe, self._previous_probe = self._previous_probe, self._probe
+        cv2.cvtColor(self._small, cv2.COLOR_RGB2GRAY, dst=self._probe)
+
+    def should_track(self, frame, timestamp=None):
+        """Call once per frame; True when this frame should get full inference"""
+        if timestamp is None:
+            timestamp = time.monotonic()
+        if self.state_since is None:
+            self.state_since = timestamp
+            self.last_hand_time = timestamp
+
+        if self.state == TRACKING:
+            if timestamp - self.last_hand_time < self.enter_seconds:
+                return True
+            # Nobody there for a while: go idle, keeping this frame as the motion reference
+            self._set_state(IDLE, timestamp)
+            self._take_probe(frame)
+            self.last_probe_time = timestamp
+            return False
+
+        # Idle: look at a few frames per second only
+        if timestamp - self.last_probe_time < 1.0 / self.idle_fps:
+            return False
+        self.last_probe_time = timestamp
+
+        self._take_probe(frame)
+        cv2.absdiff(self._probe, self._previous_probe, dst=self._diff)
+        if cv2.mean(self._diff)[0] < self.motion_threshold:
+            return False
+
+        self._set_state(TRACKING, timestamp)
+        self.last_hand_time = timestamp
+        return True
+
+    def update(self, hand_found, timestamp=None):
+        """Report whether the last tracked frame contained a hand"""
+        if hand_found:
+            self.last_hand_time = timestamp if timestamp is not None else time.monotonic()
+
+    def stats(self, timestamp=None):
+        """Seconds spent tracking and idle so far, including the current stretch"""
+        if timestamp is None:
+            timestamp = time.monotonic()
+        state_time = dict(self.state_time)
+        if self.state_since is not None:
+            state_time[self.state] += timestamp - self.state_since
+        return {
+            'presence_state': self.state,
+            'tracking_seconds': state_time[TRACKING],
+            'idle_seconds': state_time[IDLE]
+        }
@@ -0,0 +1,145 @@
+import time
+
+import cv2
+import numpy as np
+
+from landmark_sources import hand_pose
+
+# Named performance profiles. Each one bundles the detector options, the
+# capture resolution and the capture/inference rate.
+PROFILES = {
+    'low-power': {
+        'model_complexity': 0,
+        'capture_width': 320,
+        'capture_height': 240,
+        'target_fps': 15,
+        'min_detection_confidence': 0.6,
+        'min_tracking_confidence': 0.5
+    },
+    'balanced': {
+        'model_complexity': 1,
+        'capture_width': 640,
+        'capture_height': 480,
+        'target_fps': 30,
+        'min_detection_confidence': 0.7,
+        'min_tracking_confidence': 0.7
+    },
+    'low-latency': {
+        'model_complexity': 0,
+        'capture_width': 640,
+        'capture_height': 480,
+        'target_fps': 60,
+        'min_detection_confidence': 0.7,
+        'min_tracking_confidence': 0.6
+    }
+}
+
+# Preferred first when several profiles fit the latency target
+AUTO_ORDER = ('low-latency', 'balanced', 'low-power')
+
+def apply_profile(settings_manager, name):
+    """Store a profile's values in the settings"""
+    values = dict(PROFILES[name])
+    values['performance_profile'] = name
+    settings_manager.update(values)
+
+
+def hand_frame(width, height, seed=0):
+    """An RGB frame with a drawn open hand, which the palm detector picks up"""
+    points = hand_pose(extended=(0, 1, 2, 3))[:, :2]
+    center = (points.min(axis=0) + points.max(axis=0)) / 2
+    scale = 0.7 * height / np.ptp(points, axis=0).max()
+    pixels = ((points - center) * scale + (width / 2, height / 2)).astype(np.int32)
+
+    # Palm and fingers as a mask, fingers about as wide as the gaps between them
+    mask = np.zeros((height, width), dtype=np.uint8)
+    cv2.fillConvexPoly(mask, cv2.convexHull(pixels[[0, 1, 2, 5, 9, 13, 17]]), 255)
+    thickness = max(2, int(0.8 * np.abs(np.diff(pixels[[8, 12, 16, 20], 0])).mean()))
+    for chain in ((0, 1, 2, 3, 4), (5, 6, 7, 8), (9, 10, 11, 12), (13, 14, 15, 16), (17, 18, 19, 20)):
+        for a, b in zip(chain, chain[1:]):
+            cv2.line(mask, (int(pixels[a][0]), int(pixels[a][1])), (int(pixels[b][0]), int(pixels[b][1])),
+                     255, thickness)
+
+    # Skin shaded darker towards the edges, on a noisy background
+    shade = np.clip(cv2.distanceTransform(mask, cv2.DIST_L2, 5) / (0.35 * thickness), 0, 1)
+    skin = np.array((205, 150, 120), dtype=np.float32) * (0.55 + 0.45 * shade)[..., np.newaxis]
+    background = np.full((height, width, 3), (110, 100, 90), dtype=np.float32)
+    alpha = (cv2.GaussianBlur(mask, (7, 7), 0) / 255.0)[..., np.newaxis]
+    noise = np.random.default_rng(seed).normal(0.0, 5.0, (height, width, 3))
+    return np.clip(background * (1 - alpha) + skin * alpha + noise, 0, 255).astype(np.uint8)
+
+
+def measure_inference(profile, calls=5, hands_factory=None):
+    """
+    Median seconds per detector call at a profile's model complexity and resolution.
+
+    Each call gets a frame with a hand in static image mode, so it runs palm
+    detection and then the landmark model: the slowest path of
+    mp.solutions.hands, taken whenever tracking is lost. (A blank frame would
+    only time palm detection.)
+    """
+    if hands_factory is None:
+        import mediapipe as mp
+        hands_factory = mp.solutions.hands.Hands
+
+    hands = hands_factory(
+        static_image_mode=True,
+        max_num_hands=1,
+        model_complexity=profile['model_complexity'],
+        min_detection_confidence=profile['min_detection_confidence'],
+        min_tracking_confidence=profile['min_tracking_confidence'])
+    frame = hand_frame(profile['capture_width'], profile['capture_height'])
+    try:
+        hands.process(frame)  # Warm up (model loading, first allocation)
+        durations = []
+        for _ in range(calls):
+            start_time = time.perf_counter()
+            hands.process(frame)
+            durations.append(time.perf_counter() - start_time)
+    finally:
+        hands.close()
+    return float(np.median(durations))
+
+
+def choose_profile(latency_target_ms=30.0, calls=5, hands_factory=None):
+    """
+    Time a few inference calls per profile and pick the first in AUTO_ORDER
+    whose inference fits both the latency target and its own frame interval.
+
+    Returns the profile name and the measured milliseconds per profile.
+    """
+    # Profiles sharing a model and resolution are only timed once
+    measured = {}
+    timings = {}
+    for name in AUTO_ORDER:
+        profile = PROFILES[name]
+        key = (profile['model_complexity'], profile['capture_width'], profile['capture_height'])
+        if key not in measured:
+            measured[key] = measure_inference(profile, calls, hands_factory) * 1000.0
+        timings[name] = measured[key]
+        if timings[name] <= min(latency_target_ms, 1000.0 / profile['target_fps']):
+            return name, timings
+    return AUTO_ORDER[-1], timings
+
+
+def benchmark_profiles(latency_target_ms=30.0):
+    """choose_profile(), falling back to 'balanced' when the benchmark fails"""
+    try:
+        return choose_profile(latency_target_ms)
+    except Exception as e:
+        print(f"Error benchmarking performance profiles: {e}")
+        return 'balanced', {}
+
+
+def apply_auto_profile(settings_manager, name, timings):
+    """Store the values of the profile benchmark_profiles() chose"""
+    apply_profile(settings_manager, name)
+    settings_manager.update({'performance_profile': 'auto', 'auto_profile': name,
+                             'auto_profile_timings': timings})
+
+
+def auto_select(settings_manager):
+    """Benchmark this machine, then store the chosen profile's values in the settings"""
+    name, timings = benchmark_profiles(settings_manager.get('profile_latency_target_ms', 30.0))
+    apply_auto_profile(settings_manager, name, timings)
+    return name
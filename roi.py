@@ -0,0 +1,79 @@
+import cv2
+
+class RoiTracker:
+    """
+    Tracks a square region of interest around the hand so inference can run
+    on a small crop instead of the full camera frame.
+
+    The region is only moved when the hand gets close to its border or
+    changes size noticeably. Keeping the crop stable between frames keeps
+    MediaPipe's own landmark tracking (which works in crop coordinates)
+    from having to re-detect the palm on every frame; for the same reason
+    crops need a detector of their own, never shared with full frames.
+    """
+    def __init__(self, padding=0.25, input_size=256, edge_margin=0.1):
+        self.padding = padding          # Fraction of the hand size added on each side
+        self.input_size = input_size    # Side length of the square crop fed to inference
+        self.edge_margin = edge_margin  # Re-center when the hand gets this close to the border
+        self.roi = None                 # (x0, y0, side) in pixels, None when tracking is lost
+
+        # Statistics
+        self.tracked_frames = 0
+        self.full_frames = 0
+
+    def reset(self):
+        self.roi = None
+
+    def crop(self, frame):
+        """Crop the current region and resize it to the inference input size"""
+        x0, y0, side = self.roi
+        region = frame[y0:y0 + side, x0:x0 + side]
+        # Always resize: it also gives inference a contiguous buffer
+        return cv2.resize(region, (self.input_size, self.input_size), interpolation=cv2.INTER_AREA)
+
+    def map_to_frame(self, results, frame_shape):
+        """Convert landmarks found in the crop back to full-frame normalized coordinates"""
+        frame_height, frame_width = frame_shape[:2]
+        x0, y0, side = self.roi
+        scale_x = side / frame_width
+        scale_y = side / frame_height
+        offset_x = x0 / frame_width
+        offset_y = y0 / frame_height
+
+        for hand_landmarks in results.multi_hand_landmarks:
+            for landmark in hand_landmarks.landmark:
+                landmark.x = offset_x + landmark.x * scale_x
+                landmark.y = offset_y + landmark.y * scale_y
+                # z uses the same scale as x
+                landmark.z = landmark.z * scale_x
+
+    def update(self, results, frame_shape):
+        """Update the region from full-frame results; drops it when the hand is lost"""
+        if not results.multi_hand_landmarks:
+            self.roi = None
+            return
+
+        frame_height, frame_width = frame_shape[:2]
+        hand_landmarks = results.multi_hand_landmarks[0]
+        xs = [landmark.x * frame_width for landmark in hand_landmarks.landmark]
+        ys = [landmark.y * frame_height for landmark in hand_landmarks.landmark]
+        min_x, max_x = min(xs), max(xs)
+        min_y, max_y = min(ys), max(ys)
+        hand_size = max(max_x - min_x, max_y - min_y)
+
+        # Keep the current region while the hand sits comfortably inside it
+        if self.roi is not None:
+            x0, y0, side = self.roi
+            margin = side * self.edge_margin
+            if (x0 + margin <= min_x and max_x <= x0 + side - margin and
+                    y0 + margin <= min_y and max_y <= y0 + side - margin and
+                    hand_size > side / (2 + 4 * self.padding)):
+                return
+
+        side = int(hand_size * (1 + 2 * self.padding))
+        side = max(32, min(side, frame_width, frame_height))
+        center_x = (min_x + max_x) / 2
+        center_y = (min_y + max_y) / 2
+        x0 = int(min(max(center_x - side / 2, 0), frame_width - side))
+        y0 = int(min(max(center_y - side / 2, 0), frame_height - side))
+        self.roi = (x0, y0, side)
@@ -15,9 +15,54 @@ class Settings:
             'scroll_sensitivity': 5,
             'pinch_threshold': 0.1,
             'camera_index': 0,
+            'target_fps': 30,
+            'capture_width': 640,
+            'capture_height': 480,
+            'performance_profile': 'balanced',
+            'auto_profile': '',
+            'auto_profile_timings': {},
+            'profile_latency_target_ms': 30.0,
+            'model_complexity': 1,
+            'min_detection_confidence': 0.7,
+            'min_tracking_confidence': 0.7,
             'show_tutorial': True,
             'theme': 'dark',
-            'show_gestures': True
+            'show_gestures': True,
+            'preview_fps': 0,
+            'preview_scale': 1.0,
+            'inference_process': False,
+            'landmark_backend': 'solutions',
+            'hand_landmarker_model': '',
+            'roi_tracking': False,
+            'roi_padding': 0.25,
+            'adaptive_inference': False,
+            'max_skipped_frames': 2,
+            'presence_detection': False,
+            'idle_enter_seconds': 3.0,
+            'idle_motion_threshold': 4.0,
+            'idle_fps': 5,
+            'gesture_model': False,
+            'gesture_model_path': '',
+            'gesture_model_confidence': 0.6,
+            'temporal_gestures': False,
+            'double_pinch_window': 0.5,
+            'zoom_step': 0.03,
+            'zoom_range': 0.2,
+            'swipe_window': 0.4,
+            'swipe_distance': 0.25,
+            'flick_window': 0.15,
+            'flick_distance': 0.12,
+            'temporal_cooldown': 0.5,
+            'cursor_filter': 'kalman',
+            'cursor_filter_chain': [],
+            'one_euro_min_cutoff': 1.0,
+            'one_euro_beta': 0.007,
+            'one_euro_d_cutoff': 1.0,
+            'prediction_horizon': 0.03,
+            'prediction_max_offset': 80,
+            'cursor_output_rate': 0,
+            'cursor_output_mode': 'interpolate',
+            'input_backend': 'auto'
         }
 
         # Current settings
@@ -71,6 +116,11 @@ class Settings:
         self.current[key] = value
         self.save()
 
+    def update(self, values):
+        """Set several values and save once"""
+        self.current.update(values)
+        self.save()
+
     def reset(self):
         """Reset settings to defaults"""
         self.current = self.defaults.copy()
@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+
+pytest.importorskip('PyQt6')
+
+from app import VideoThread
+from capture import FrameGrabber
+from pipeline import Pipeline
+
+def test_frame_stats_keeps_capture_and_queue_drops_apart():
+    thread = VideoThread()
+    thread.grabber = FrameGrabber(cap=None)
+    for frame in range(3):
+        thread.grabber.slot.put(frame)      # Nobody takes them: two are dropped
+    thread.pipeline = Pipeline()
+    queue = thread.pipeline.add_queue('render', maxsize=1)
+    for item in range(4):
+        queue.put(item)
+
+    stats = thread.frame_stats()
+    assert stats['published'] == 3
+    assert stats['dropped'] == 2
+    assert stats['queue_dropped'] == {'render': 3}
+
+
+def test_preview_never_draws_into_the_shared_frame():
+    thread = VideoThread()
+    thread.set_preview_visible(True)
+    images = []
+    thread.change_pixmap_signal.connect(images.append)
+
+    frame = np.zeros((48, 64, 3), dtype=np.uint8)
+    thread.set_preview_size(64, 48)     # Same size: no resize needed
+    thread._render((frame, None, 0.0))
+    assert len(images) == 1
+    assert not frame.any()
+    assert images[0].width() == 64
@@ -0,0 +1,102 @@
+import numpy as np
+
+import capture
+from capture import FramePool
+
+class FakeCapture:
+    """cv2.VideoCapture stand-in that fills the given buffer, like cap.read(image) does"""
+    def __init__(self, shape=(48, 64, 3), frames=None):
+        self.shape = shape
+        self.frames = frames
+        self.count = 0
+
+    def read(self, image=None):
+        if self.frames is not None and self.count >= self.frames:
+            return False, None
+        if image is None or image.shape != self.shape:
+            image = np.empty(self.shape, dtype=np.uint8)
+        image[...] = self.count % 256
+        image[:, 0, 0] = 255    # Mark the left edge blue channel
+        self.count += 1
+        return True, image
+
+
+class CountingCv2:
+    """Counts the cv2 calls FramePool makes, passing them through"""
+    def __init__(self, cv2):
+        self.cv2 = cv2
+        self.calls = {'cvtColor': 0, 'flip': 0}
+
+    def __getattr__(self, name):
+        return getattr(self.cv2, name)
+
+    def cvtColor(self, *args, **kwargs):
+        self.calls['cvtColor'] += 1
+        return self.cv2.cvtColor(*args, **kwargs)
+
+    def flip(self, *args, **kwargs):
+        self.calls['flip'] += 1
+        return self.cv2.flip(*args, **kwargs)
+
+
+def test_no_allocations_after_warm_up(monkeypatch):
+    counting = CountingCv2(capture.cv2)
+    monkeypatch.setattr(capture, 'cv2', counting)
+    pool = FramePool(size=4)
+    cap = FakeCapture()
+
+    for _ in range(len(pool.buffers)):
+        assert pool.read(cap)[0]
+    warm_allocations = pool.allocations
+    assert warm_allocations == 2 * len(pool.buffers)   # One raw and one RGB array per slot
+
+    frames = 50
+    for _ in range(frames):
+        ret, image = pool.read(cap)
+        assert ret and image.shape == cap.shape
+    assert pool.allocations == warm_allocations
+    assert counting.calls == {'cvtColor': len(pool.buffers) + frames, 'flip': len(pool.buffers) + frames}
+    assert pool.conversions == pool.flips == pool.frames == len(pool.buffers) + frames
+    assert pool.stats()['bytes_copied_per_frame'] == 2 * np.prod(cap.shape)
+
+
+def test_frames_are_mirrored_rgb():
+    pool = FramePool(size=2)
+    ret, image = pool.read(FakeCapture())
+    assert ret
+    # Blue channel of the left edge ends up in the red channel of the right edge
+    assert (image[:, -1, 2] == 255).all()
+    assert (image[:, 0, 2] == 0).all()
+
+
+def test_grabbed_frames_are_only_converted_when_asked():
+    pool = FramePool(size=4)
+    cap = FakeCapture()
+    first = pool.grab(cap)
+    # Not converted: the next grab reuses the same buffer
+    assert pool.grab(cap) is first
+    assert pool.conversions == 0 and pool.stats()['skipped_conversions'] == 2
+    pool.convert(first)
+    assert pool.grab(cap) is not first
+    assert pool.conversions == 1
+
+
+def test_failed_read():
+    pool = FramePool(size=2)
+    assert pool.read(FakeCapture(frames=0)) == (False, None)
+
+
+def test_frame_clock_seeds_read_duration_from_the_first_read():
+    clock = capture.FrameClock(target_fps=30)
+    # A blocking camera: the very first read took a whole frame interval
+    clock.record_read(0.0, 0.033)
+    assert clock.read_duration == 0.033
+    clock.should_publish(0.033)
+    assert clock.wait_time(0.034) == 0.0
+
+    # A source that returns immediately is paced to the target rate
+    clock = capture.FrameClock(target_fps=30)
+    assert clock.wait_time(0.0) == 0.0
+    clock.record_read(0.0, 0.001)
+    clock.should_publish(0.001)
+    assert abs(clock.wait_time(0.002) - (0.001 + 1 / 30 - 0.002)) < 1e-9
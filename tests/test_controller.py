@@ -0,0 +1,47 @@
+import numpy as np
+
+from controller import HandGestureController
+from input_backends import RecordingBackend
+from landmark_sources import SampleClock, headless_controller
+from landmarks import HandResults
+
+def test_cursor_filter_is_only_rebuilt_when_its_settings_change():
+    controller = headless_controller()
+    cursor_filter = controller.cursor_filter
+    controller.update_settings({'roi_padding': 0.3, 'cursor_filter': 'kalman', 'stability_threshold': 5})
+    assert controller.cursor_filter is cursor_filter
+
+    controller.update_settings({'stability_threshold': 8})
+    assert controller.cursor_filter is not cursor_filter
+    cursor_filter = controller.cursor_filter
+    controller.update_settings({'cursor_filter': 'one_euro'})
+    assert controller.cursor_filter is not cursor_filter
+    assert controller.cursor_filter.names == ['one_euro']
+
+
+class DelayedDetector:
+    """Asynchronous backend stand-in: returns the results of the previous frame"""
+    asynchronous = True
+
+    def __init__(self):
+        self.submitted = []
+        self.results_timestamp = None
+
+    def process(self, rgb_frame, timestamp=None):
+        self.results_timestamp = self.submitted[-1] if self.submitted else None
+        self.submitted.append(timestamp)
+        return HandResults()
+
+    def close(self):
+        pass
+
+
+def test_asynchronous_results_keep_their_capture_time():
+    detector = DelayedDetector()
+    controller = HandGestureController({}, hands=detector, mouse=RecordingBackend(), clock=SampleClock())
+    frame = np.zeros((48, 64, 3), dtype=np.uint8)
+    controller.process_frame(frame, 10.0)
+    assert controller.results_timestamp == 10.0     # Nothing older yet
+    controller.process_frame(frame, 10.033)
+    assert detector.submitted == [10.0, 10.033]
+    assert controller.results_timestamp == 10.0
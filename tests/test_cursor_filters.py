@@ -0,0 +1,33 @@
+import numpy as np
+
+from cursor_filters import AdaptiveBlend, Deadzone, FilterChain, KalmanPredictor
+
+def test_predictor_leads_by_the_smoothed_delay():
+    predictor = KalmanPredictor(horizon=0.0, max_offset=1000.0)
+    speed, outputs = 100.0, []
+    for frame in range(120):
+        t = frame / 30
+        # The delay to the output alternates between 30 and 70 ms
+        delay = 0.03 if frame % 2 else 0.07
+        outputs.append(predictor.step(t, speed * t, 0.0, now=t + delay)[0])
+
+    assert abs(predictor.delay - 0.05) < 0.005
+    # Steady motion stays steady: the lead doesn't follow each frame's delay
+    steps = np.diff(outputs[60:])
+    assert np.std(steps) < 0.5
+    assert abs(outputs[-1] - speed * (119 / 30 + 0.05)) < 1.0
+
+
+def test_predictor_delay_starts_at_the_first_measurement():
+    predictor = KalmanPredictor()
+    predictor.step(1.0, 0.0, 0.0, now=1.05)
+    assert abs(predictor.delay - 0.05) < 1e-9
+
+
+def test_deadzone_compares_against_the_cursor():
+    chain = FilterChain([Deadzone(threshold=5), AdaptiveBlend(smoothing_factor=0.5)])
+    chain.step(0.0, 0.0, 0.0)
+    assert chain.step(0.1, 10.0, 0.0) == (5.0, 0.0)
+    # Within the threshold of the cursor, though the deadzone last passed 10: held
+    assert chain.step(0.2, 8.0, 0.0) == (5.0, 0.0)
+    assert chain.step(0.3, 11.0, 0.0) == (8.0, 0.0)
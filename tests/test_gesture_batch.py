@@ -0,0 +1,55 @@
+import numpy as np
+
+import gesture_features
+from gesture_batch import check_consistency, evaluate, sweep
+from gesture_features import GESTURE_FLAGS, classify, compute_features, frame_features
+from landmark_sources import GESTURE_POSES, SyntheticSource
+from landmarks import array_to_landmarks, results_to_array
+
+def recorded_sequence():
+    """Landmarks and labels of a synthetic session going through every pose"""
+    script = [(pose, 1.0) for pose in GESTURE_POSES]
+    points, labels = [], []
+    for sample in SyntheticSource(script, noise=0.003):
+        points.append(results_to_array(sample.results)[0])
+        labels.append(sample.label)
+    return np.array(points), np.array(labels)
+
+
+def test_batch_matches_streaming_classifier():
+    points, _ = recorded_sequence()
+    flags, _ = evaluate(points)
+    assert flags.shape == (len(points), len(GESTURE_FLAGS))
+    assert check_consistency(points, flags) == []
+
+
+def test_batch_matches_per_frame_features():
+    points, _ = recorded_sequence()
+    _, features = evaluate(points)
+    buffer = np.empty(gesture_features.NUM_FEATURES, dtype=np.float32)
+    for hand, row in zip(points, features):
+        np.testing.assert_allclose(compute_features(hand, buffer), row, rtol=1e-5, atol=1e-5)
+        np.testing.assert_allclose(frame_features(array_to_landmarks(hand)), row, rtol=1e-4, atol=1e-4)
+
+
+def test_flags_follow_the_script():
+    points, labels = recorded_sequence()
+    flags, _ = evaluate(points)
+    column = {name: i for i, name in enumerate(GESTURE_FLAGS)}
+    assert flags[labels == 'point', column['pointing_gesture']].all()
+    assert flags[labels == 'v_scroll', column['v_shape']].all()
+    assert flags[labels == 'pinch', column['index_thumb_pinch']].any()
+    assert not flags[labels == 'none', column['pointing_gesture']].any()
+    # Every frame agrees with classify on its own
+    for hand, row in zip(points[::7], flags[::7]):
+        record = classify(frame_features(array_to_landmarks(hand)))
+        assert [bool(record[name]) for name in GESTURE_FLAGS] == row.tolist()
+
+
+def test_sweep_is_monotonic_in_pinch_threshold():
+    points, labels = recorded_sequence()
+    _, features = evaluate(points)
+    results = sweep(features, 'pinch_threshold', [0.02, 0.1, 0.3], labels)
+    pinch = GESTURE_FLAGS.index('index_thumb_pinch')
+    rates = [results[value][None][pinch] for value in (0.02, 0.1, 0.3)]
+    assert rates == sorted(rates)
@@ -0,0 +1,120 @@
+from controller import GESTURES
+from gesture_engine import GestureEngine, GestureSpec
+from input_backends import RecordingBackend
+from landmark_sources import GESTURE_POSES, SampleClock, headless_controller
+from landmarks import array_to_landmarks
+
+class Actions:
+    """Records the actions the engine calls, in order"""
+    def __init__(self):
+        self.calls = []
+
+    def __getattr__(self, name):
+        return lambda features: self.calls.append(name)
+
+
+def run(engine, clock, frames, step=0.05):
+    """Feed (features, seconds) steps to the engine at `step` intervals"""
+    for features, seconds in frames:
+        for _ in range(int(round(seconds / step))):
+            engine.update(features)
+            clock.now += step
+
+
+def make_engine(specs=GESTURES):
+    actions, clock = Actions(), SampleClock()
+    return GestureEngine(specs, actions, clock=clock), actions, clock
+
+
+def test_hold_time_is_respected():
+    engine, actions, clock = make_engine()
+    pinch = {'index_thumb_pinch': True}
+    # Shorter than the 0.2 s hold: nothing fires
+    run(engine, clock, [(pinch, 0.15), ({}, 0.1)])
+    assert 'left_click' not in actions.calls
+    assert engine.stats()['left_click'] == 0
+
+    run(engine, clock, [(pinch, 0.3), ({}, 0.1)])
+    assert actions.calls.count('left_click') == 1
+
+
+def test_fires_once_per_hold():
+    engine, actions, clock = make_engine()
+    run(engine, clock, [({'index_thumb_pinch': True}, 2.0)])
+    assert actions.calls.count('left_click') == 1
+
+
+def test_earlier_spec_preempts_pending_one():
+    engine, actions, clock = make_engine()
+    # A pinch starts a pending left click, pointing while pinching turns it into a drag
+    run(engine, clock, [({'index_thumb_pinch': True}, 0.1)])
+    assert engine.is_pending('left_click')
+    run(engine, clock, [({'index_thumb_pinch': True, 'drag_gesture': True}, 0.5)])
+    assert engine.is_active('drag')
+    assert not engine.is_pending('left_click') and not engine.is_active('left_click')
+    assert 'left_click' not in actions.calls
+    assert actions.calls.count('start_drag') == 1
+
+
+def test_active_gesture_is_not_preempted():
+    engine, actions, clock = make_engine()
+    run(engine, clock, [({'index_thumb_pinch': True}, 0.3)])
+    assert engine.is_active('left_click')
+    run(engine, clock, [({'index_thumb_pinch': True, 'drag_gesture': True}, 0.3)])
+    assert 'start_drag' not in actions.calls
+
+
+def test_groups_are_independent():
+    engine, actions, clock = make_engine()
+    run(engine, clock, [({'index_thumb_pinch': True, 'v_shape': True}, 0.3)])
+    assert engine.is_active('left_click') and engine.is_active('scroll')
+
+
+def test_keep_condition_ends_gesture():
+    engine, actions, clock = make_engine()
+    run(engine, clock, [({'index_thumb_pinch': True, 'drag_gesture': True}, 0.2),
+                        # Drag continues while the pinch holds, even without pointing
+                        ({'index_thumb_pinch': True}, 0.2)])
+    assert engine.is_active('drag')
+    run(engine, clock, [({}, 0.05)])
+    assert actions.calls[-1] == 'end_drag'
+    assert not engine.is_active('drag')
+
+
+def test_reset_runs_exit_actions():
+    engine, actions, clock = make_engine()
+    run(engine, clock, [({'index_thumb_pinch': True, 'drag_gesture': True}, 0.2)])
+    engine.reset()
+    assert actions.calls[-1] == 'end_drag'
+    assert engine.started('drag') is None
+    # Pending gestures end without their exit action
+    run(engine, clock, [({'index_thumb_pinch': True}, 0.1)])
+    engine.reset()
+    assert actions.calls.count('end_drag') == 1
+
+
+def test_custom_table():
+    specs = (GestureSpec('hold', enter='a', hold=1.0, on_fire='fire', on_hold='tick', on_exit='done'),)
+    engine, actions, clock = make_engine(specs)
+    run(engine, clock, [({'a': True}, 1.5), ({}, 0.25)], step=0.25)
+    assert actions.calls == ['fire', 'tick', 'done']
+
+
+def test_hand_loss_releases_drag():
+    mouse = RecordingBackend()
+    controller = headless_controller(mouse=mouse)
+    controller.gesture_engine.update({'index_thumb_pinch': True, 'drag_gesture': True})
+    assert mouse.pressed == {'left'}
+
+    # What the tracking loop does when no hand is found
+    controller.release_gestures()
+    assert mouse.pressed == set()
+    assert [name for name, _ in mouse.events] == ['mouseDown', 'mouseUp']
+
+
+def test_zoom_releases_ctrl():
+    mouse = RecordingBackend()
+    controller = headless_controller(mouse=mouse)
+    controller.zoom(controller.get_gesture(array_to_landmarks(GESTURE_POSES['pinch'])), 2)
+    assert mouse.pressed == set()
+    assert [name for name, _ in mouse.events] == ['keyDown_ctrl', 'scroll', 'keyUp_ctrl']
@@ -0,0 +1,136 @@
+from types import SimpleNamespace
+
+from gesture_features import THUMB_INDEX, TIP_PAIRS
+from gesture_temporal import TemporalRecognizer
+from input_backends import RecordingBackend
+from landmark_sources import SyntheticSource, drive, headless_controller
+
+class Actions:
+    """Records the actions the recognizer calls, in order"""
+    def __init__(self):
+        self.calls = []
+
+    def __getattr__(self, name):
+        return lambda state, *args: self.calls.append((name,) + args)
+
+
+def state(extended=(False,) * 5, pinch_distance=0.2, pinch=False, open_hand=False):
+    """A gesture record with just the fields the recognizer reads"""
+    tip_distances = [0.2] * len(TIP_PAIRS)
+    tip_distances[THUMB_INDEX] = pinch_distance
+    return SimpleNamespace(extended=extended, tip_distances=tip_distances, index_thumb_pinch=pinch,
+                           drag_gesture=False, two_finger_gesture=False, open_hand=open_hand)
+
+
+def run(recognizer, frames, start=0.0, step=0.05, x=0.5):
+    """Feed (state factory, seconds) steps; returns the time after the last frame"""
+    now = start
+    for make_state, seconds in frames:
+        for _ in range(int(round(seconds / step))):
+            recognizer.update(now, make_state(), x, 0.5)
+            now += step
+    return now
+
+
+def pinch_events(script, **settings):
+    """Mouse events of a headless controller following a SyntheticSource script"""
+    mouse = RecordingBackend()
+    controller = headless_controller(dict(settings, temporal_gestures=True), mouse=mouse)
+    drive(controller, SyntheticSource(script))
+    return [name for name, _ in mouse.events if name != 'moveTo']
+
+
+def test_double_pinch_does_not_also_click():
+    # Two 0.25 s pinches, starting 0.5 s apart
+    events = pinch_events([('point', 0.5), ('pinch', 1.0), ('point', 1.0)], double_pinch_window=0.6)
+    assert events == ['doubleClick']
+
+
+def test_single_pinch_clicks_once():
+    events = pinch_events([('point', 0.5), ('pinch', 0.5), ('point', 1.0)], double_pinch_window=0.6)
+    assert events == ['click_left']
+
+
+def test_single_pinch_clicks_where_the_pinch_was():
+    mouse = RecordingBackend()
+    controller = headless_controller({'temporal_gestures': True, 'double_pinch_window': 0.6}, mouse=mouse)
+    drive(controller, SyntheticSource([('point', 0.5), ('pinch', 0.5), ('point', 1.0)], noise=0.0))
+
+    # The same frames up to the pinch give the cursor position it started at
+    reference = headless_controller({'temporal_gestures': True}, mouse=RecordingBackend())
+    drive(reference, SyntheticSource([('point', 0.5), ('pinch', 0.25)], noise=0.0))
+
+    click = [name for name, _ in mouse.events].index('click_left')
+    assert mouse.events[click - 1] == ('moveTo', (reference.prev_x, reference.prev_y))
+    # By the time of the click, pointing had moved the cursor elsewhere
+    assert mouse.events[click - 2][0] == 'moveTo'
+    assert mouse.events[click - 2] != mouse.events[click - 1]
+
+
+def test_pending_click_fires_when_the_hand_is_lost():
+    events = pinch_events([('point', 0.5), ('pinch', 0.5), ('absent', 0.5)], double_pinch_window=0.6)
+    assert events == ['click_left']
+
+
+def test_reset_flushes_a_pending_tap_at_its_cursor():
+    actions = Actions()
+    recognizer = TemporalRecognizer(actions)
+    recognizer.update(0.0, state(), 0.5, 0.5, (10, 20))
+    recognizer.update(0.05, state(pinch=True, pinch_distance=0.02), 0.5, 0.5, (30, 40))
+    recognizer.update(0.1, state(), 0.5, 0.5, (50, 60))
+    assert actions.calls == []
+
+    recognizer.reset()
+    assert actions.calls == [('click_at', (30, 40))]
+    recognizer.reset()
+    assert recognizer.stats()['pinch_click'] == 1
+
+
+def test_quick_pinch_is_held_back_from_the_engine():
+    recognizer = TemporalRecognizer(Actions())
+    pinched = state(pinch=True, pinch_distance=0.02)
+    recognizer.update(0.0, pinched, 0.5, 0.5)
+    assert not pinched.index_thumb_pinch
+
+    # Held past the window it is left to GestureEngine
+    run(recognizer, [(lambda: state(pinch=True, pinch_distance=0.02), 0.6)], start=0.05)
+    pinched = state(pinch=True, pinch_distance=0.02)
+    recognizer.update(0.7, pinched, 0.5, 0.5)
+    assert pinched.index_thumb_pinch
+    assert recognizer.stats()['pinch_click'] == 0
+
+
+def test_zoom_needs_a_pinch_to_start():
+    actions = Actions()
+    recognizer = TemporalRecognizer(actions)
+    ok_sign = (True, False, True, True, True)
+    # Middle, ring and pinky raised but the thumb and index apart: no zoom
+    run(recognizer, [(lambda: state(ok_sign, pinch_distance=0.1), 0.3),
+                     (lambda: state(ok_sign, pinch_distance=0.2), 0.3)])
+    assert recognizer.stats()['zoom'] == 0
+
+    run(recognizer, [(lambda: state(ok_sign, pinch_distance=0.02, pinch=True), 0.1),
+                     (lambda: state(ok_sign, pinch_distance=0.12), 0.1)], start=1.0)
+    assert recognizer.stats()['zoom'] == 1
+    assert actions.calls[-1] == ('zoom', 3)
+
+
+def test_zoom_ends_when_the_pinch_opens_past_its_range():
+    actions = Actions()
+    recognizer = TemporalRecognizer(actions, {'zoom_range': 0.2})
+    ok_sign = (True, False, True, True, True)
+    open_hand = (True,) * 5
+    # Opening the hand within the range keeps zooming, past it ends the zoom
+    now = run(recognizer, [(lambda: state(ok_sign, pinch_distance=0.02, pinch=True), 0.1),
+                           (lambda: state(open_hand, pinch_distance=0.12, open_hand=True), 0.1),
+                           (lambda: state(open_hand, pinch_distance=0.3, open_hand=True), 0.1)])
+    zooms = recognizer.stats()['zoom']
+    assert zooms == 1
+
+    # Now an open hand: travelling sideways swipes instead of zooming
+    for i in range(6):
+        recognizer.update(now + 0.05 * i, state(open_hand, pinch_distance=0.3, open_hand=True),
+                          0.5 + 0.06 * i, 0.5)
+    assert recognizer.stats()['zoom'] == zooms
+    assert recognizer.stats()['swipe'] == 1
+    assert actions.calls[-1] == ('swipe', 1)
@@ -0,0 +1,42 @@
+import numpy as np
+
+from inference_scheduler import AdaptiveInferenceScheduler
+from landmark_sources import GESTURE_POSES
+
+def run(scheduler, frames, velocity=0.0, fps=30):
+    """Feed `frames` frames of a hand moving at `velocity`; returns the inference pattern"""
+    pattern = []
+    points = GESTURE_POSES['point'].copy()
+    for frame in range(frames):
+        timestamp = frame / fps
+        infer = scheduler.should_infer(timestamp)
+        pattern.append(infer)
+        if infer:
+            scheduler.extrapolator.observe(points + velocity * timestamp, timestamp)
+    return pattern
+
+
+def longest_skip(pattern):
+    longest = run_length = 0
+    for infer in pattern:
+        run_length = 0 if infer else run_length + 1
+        longest = max(longest, run_length)
+    return longest
+
+
+def test_still_hand_skips_at_most_max_skip_frames():
+    for max_skip in (0, 1, 2, 3):
+        scheduler = AdaptiveInferenceScheduler(max_skip=max_skip)
+        assert longest_skip(run(scheduler, 60)) == max_skip
+
+
+def test_slow_inference_never_skips_more_than_max_skip():
+    scheduler = AdaptiveInferenceScheduler(max_skip=2)
+    scheduler.record_inference(1.0)     # Far over the CPU budget
+    assert scheduler.allowed_skip() == 2
+    assert longest_skip(run(scheduler, 60)) == 2
+
+    # A fast hand gets every frame, plus the one extra frame when CPU is short
+    scheduler = AdaptiveInferenceScheduler(max_skip=2)
+    scheduler.record_inference(1.0)
+    assert longest_skip(run(scheduler, 60, velocity=np.float32(5.0))) == 1
@@ -0,0 +1,18 @@
+import sys
+from types import ModuleType
+
+from input_backends import PyAutoGuiBackend
+
+def test_pyautogui_clicks_use_its_own_click_calls(monkeypatch):
+    calls = []
+    fake = ModuleType('pyautogui')
+    for name in ('click', 'doubleClick', 'mouseDown', 'mouseUp'):
+        setattr(fake, name, lambda *args, name=name, **kwargs: calls.append((name, kwargs)))
+    monkeypatch.setitem(sys.modules, 'pyautogui', fake)
+
+    backend = PyAutoGuiBackend()
+    backend.click(button='right')
+    backend.doubleClick()
+    assert calls == [('click', {'button': 'right', '_pause': False}),
+                     ('doubleClick', {'button': 'left', '_pause': False})]
+    assert backend.stats()['click']['count'] == 2
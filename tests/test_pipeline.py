@@ -0,0 +1,19 @@
+from pipeline import DropOldestQueue, Pipeline
+
+def test_queue_drops_oldest_and_counts_it():
+    queue = DropOldestQueue(maxsize=2)
+    for item in range(5):
+        queue.put(item)
+    assert queue.dropped == 3
+    assert queue.get(timeout=0) == 3
+
+
+def test_stats_report_queue_drops_under_their_own_key():
+    pipeline = Pipeline()
+    pipeline.add_queue('gesture', maxsize=1).put(1)
+    render = pipeline.add_queue('render', maxsize=1)
+    render.put(1)
+    render.put(2)
+    stats = pipeline.stats()
+    assert 'dropped' not in stats
+    assert stats['queue_dropped'] == {'gesture': 0, 'render': 1}
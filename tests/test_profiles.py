@@ -0,0 +1,42 @@
+import numpy as np
+
+import profiles
+
+class FakeHands:
+    """Records the options and frames a detector gets"""
+    created = []
+
+    def __init__(self, **options):
+        self.options = options
+        self.frames = []
+        FakeHands.created.append(self)
+
+    def process(self, frame):
+        self.frames.append(frame)
+
+    def close(self):
+        pass
+
+
+def test_inference_is_timed_on_a_frame_with_a_hand():
+    FakeHands.created.clear()
+    profile = profiles.PROFILES['balanced']
+    assert profiles.measure_inference(profile, calls=3, hands_factory=FakeHands) >= 0.0
+
+    hands, = FakeHands.created
+    # Static image mode: palm detection and the landmark model on every call
+    assert hands.options['static_image_mode']
+    assert len(hands.frames) == 4
+    frame = hands.frames[0]
+    assert frame.shape == (profile['capture_height'], profile['capture_width'], 3)
+    assert frame.dtype == np.uint8
+    # Skin-coloured pixels in the middle of the frame
+    height, width = frame.shape[:2]
+    red, green, blue = frame[height // 2, width // 2].astype(int)
+    assert red > green > blue
+
+
+def test_choose_profile_falls_back_to_low_power():
+    name, timings = profiles.choose_profile(latency_target_ms=0.0, calls=1, hands_factory=FakeHands)
+    assert name == 'low-power'
+    assert set(timings) == set(profiles.AUTO_ORDER)